@@ -0,0 +1,36 @@
+import argparse
+import json
+import sys
+import time
+from src.sim.batch import ResultWriter, expand_grid, run_batch, wave_rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a grid of balancing scenarios headless, in parallel')
+    parser.add_argument('grid', help='JSON file with maps, layouts and config overrides')
+    parser.add_argument('--out', default='results.jsonl', help='Output file (.jsonl or .csv)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    with open(args.grid) as f:
+        scenarios = expand_grid(json.load(f))
+
+    writer = ResultWriter(args.out)
+    started = time.perf_counter()
+    failures = 0
+    try:
+        for done, (scenario, report, error) in enumerate(run_batch(scenarios, args.workers), 1):
+            writer.write(wave_rows(scenario, report, error))
+            if error:
+                failures += 1
+                print(f"[{done}/{len(scenarios)}] scenario {scenario['id']} failed: {error}")
+            else:
+                print(f"[{done}/{len(scenarios)}] {scenario['map']} / {scenario['layout']} / "
+                      f"{scenario['override']}: {report['result']}, lives {report['lives']}")
+    finally:
+        writer.close()
+
+    print(f"{len(scenarios)} scenarios in {time.perf_counter() - started:.1f}s, results in {args.out}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+from src.sim.benchmark import BenchmarkSuite, compare
+
+def run(args):
+    suite = BenchmarkSuite(args.enemies, args.towers, args.projectiles, args.repeats,
+                           enemy_engine=args.enemy_engine, maps=args.map, saves=args.load)
+    report = suite.run(progress=lambda name, timing: print(f"{name:<36} {timing['median_us']:12.1f} us"))
+    with open(args.out, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.out}")
+    return 0
+
+def run_compare(args):
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    regressions = 0
+    print(f"{'benchmark':<36} {'baseline us':>12} {'current us':>12} {'ratio':>7}")
+    for name, base_us, current_us, ratio, status in compare(baseline, current, args.threshold):
+        base_text = f"{base_us:12.1f}" if base_us is not None else f"{'-':>12}"
+        current_text = f"{current_us:12.1f}" if current_us is not None else f"{'-':>12}"
+        ratio_text = f"{ratio:7.2f}" if ratio is not None else f"{'-':>7}"
+        print(f"{name:<36} {base_text} {current_text} {ratio_text}  {status}")
+        regressions += status == 'REGRESSION'
+    if baseline['machine'] != current['machine']:
+        print("Warning: the reports come from different machines")
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the simulation and drawing hot paths')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmark suite and write a JSON report')
+    run_parser.add_argument('--out', default='bench.json', help='Report path')
+    run_parser.add_argument('--map', action='append', help='Map id from MAPS (repeatable, default all)')
+    run_parser.add_argument('--enemies', type=int, default=200, help='Enemies per level')
+    run_parser.add_argument('--towers', type=int, default=2, help='Towers of each type per level')
+    run_parser.add_argument('--projectiles', type=int, default=100, help='Shells in flight, half of them storm')
+    run_parser.add_argument('--repeats', type=int, default=7, help='Timed repeats per benchmark')
+    run_parser.add_argument('--load', action='append', default=[], metavar='FILE',
+                            help='Also time a saved (mid-wave) state to the end of its wave (repeatable)')
+    run_parser.add_argument('--enemy-engine', choices=['sprite', 'array'], help='Enemy update engine')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='Flag regressions against a baseline report')
+    compare_parser.add_argument('baseline', help='Baseline report')
+    compare_parser.add_argument('current', help='Report to check')
+    compare_parser.add_argument('--threshold', type=float, default=0.10, help='Allowed slowdown of the median')
+    compare_parser.set_defaults(func=run_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
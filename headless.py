@@ -0,0 +1,45 @@
+import argparse
+import json
+import sys
+from src.sim.headless import HeadlessRunner, parse_placement
+
+def placement(text):
+    try:
+        return parse_placement(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))  # Shown in argparse's usage error
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Myth-Forge Defense without a window, as fast as possible')
+    parser.add_argument('--map', default='level_1', help='Map id from MAPS, or a .mfs save file to start from')
+    parser.add_argument('--tower', action='append', default=[], type=placement,
+                        metavar='SPOT:TYPE[:ELEMENT]', help='Tower to build, in build order (repeatable)')
+    parser.add_argument('--dt', type=float, help='Simulated seconds per tick (default: 1 / GAME_CONFIG tick_rate)')
+    parser.add_argument('--max-time', type=float, default=3600.0, help='Simulated seconds before giving up')
+    parser.add_argument('--enemy-engine', choices=['sprite', 'array'], help='Enemy update engine')
+    parser.add_argument('--verbose', action='store_true', help='Show game log output')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(args.map, args.tower, dt=args.dt, max_time=args.max_time, quiet=not args.verbose,
+                            enemy_engine=args.enemy_engine)
+    report = runner.run()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for wave in report['waves']:
+            print(f"Wave {wave['wave']}: leaks {wave['leaks']}, kills {wave['kills']}, "
+                  f"lives {wave['lives']}, money {wave['money']}")
+        print(f"Result: {report['result']} - lives {report['lives']}, money {report['money']}")
+        print(f"{report['ticks']} ticks in {report['wall_time']:.2f}s "
+              f"({report['ticks_per_second']:.0f} ticks/s)")
+        if args.verbose:
+            for name, stats in report['pools'].items():
+                print(f"Pool {name}: {stats['created']} created, {stats['reused']} reused, "
+                      f"peak {stats['peak_in_use']} in use")
+
+    return 0 if report['result'] == 'victory' else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,36 @@
+import argparse
 import pygame
 import sys
+import time
 from src.game import Game
 from src.config.ui_config import SCREEN_HEIGHT, SCREEN_WIDTH, FPS
+from src.config.utils import StartupTimer
+from src.sim.remote import SimulationProcess
 
 def main():
+    parser = argparse.ArgumentParser(description='Myth-Forge Defense')
+    parser.add_argument('--record', metavar='FILE', help='Record the inputs of the level played, for replay.py')
+    parser.add_argument('--sim-process', action='store_true',
+                        help='Run the simulation in a separate process, sharing its state through shared memory')
+    args = parser.parse_args()
+
+    startup = StartupTimer()
     pygame.init()
+    startup.mark('pygame.init')
     
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption('Myth-Forge Defense')
     clock = pygame.time.Clock()
+    startup.mark('display')
     
     # Initialize game
     game = Game(screen)
+    if args.sim_process:
+        game.remote = SimulationProcess(args.record)  # Records in the simulation process
+        game.remote.start()
+    else:
+        game.record_path = args.record
+    startup.mark('game init')
     
     # Main game loop
     running = True
@@ -25,9 +44,20 @@ def main():
         dt = clock.tick(FPS) / 1000 
         game.update(dt)
         game.draw()
-        pygame.display.flip()
+        game.present()  # Dirty regions only, or a full flip
+        game.perf.end_frame(game)  # No-op unless the performance HUD is on
         #clock.tick(FPS)
+
+        # Startup instrumentation
+        startup.mark('first frame')
+        if game.state == "playing" and not startup.has('first playable frame'):
+            startup.mark('first playable frame')
+            level_load = time.perf_counter() - game.level_started_at
+            print(f"Startup timings:\n{startup.report()}\n  level load to first playable frame: {level_load * 1000:.1f} ms")
     
+    game.save_recording()
+    if game.remote is not None:
+        game.remote.stop()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,34 @@
+import argparse
+import json
+import sys
+from src.sim.replay import ReplayRunner
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded game headless, as fast as possible')
+    parser.add_argument('recording', help='File written by main.py --record')
+    parser.add_argument('--no-verify', action='store_true', help='Skip the per-tick state hash check')
+    parser.add_argument('--to-end', action='store_true', help='Keep simulating past the recording until the game ends')
+    parser.add_argument('--verbose', action='store_true', help='Show game log output')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = ReplayRunner(args.recording, verify=not args.no_verify, to_end=args.to_end,
+                          quiet=not args.verbose).run()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        if not report['config_matches']:
+            print("Warning: game configs changed since this was recorded")
+        print(f"{report['map']}: {report['commands_applied']}/{report['commands']} commands, "
+              f"{report['ticks']} ticks in {report['wall_time']:.2f}s ({report['ticks_per_second']:.0f} ticks/s)")
+        print(f"Result: {report['result']} - lives {report['lives']}, money {report['money']}")
+        if report['diverged_at'] is None:
+            print("No divergence")
+        else:
+            print(f"Diverged at tick {report['diverged_at']}")
+
+    return 0 if report['diverged_at'] is None else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
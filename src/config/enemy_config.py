@@ -11,7 +11,8 @@ ENEMY_CONFIG = {
             'value': 1,
             'color': (70, 130, 180),  # Steel blue
             'radius': 14,
-            'flying': False
+            'flying': False,
+            'route': 'ground'
         },
         'fast': {
             'class': 'FastEnemy',
@@ -20,7 +21,8 @@ ENEMY_CONFIG = {
             'value': 2,
             'color': (255, 165, 0),  # Orange
             'radius': 10,
-            'flying': False
+            'flying': False,
+            'route': 'ground'
         },
         'tank': {
             'class': 'TankEnemy',
@@ -29,7 +31,8 @@ ENEMY_CONFIG = {
             'value': 5,
             'color': (139, 69, 19),  # Saddle brown
             'radius': 20,
-            'flying': False
+            'flying': False,
+            'route': 'heavy'
         },
         'flying': {
             'class': 'FlyingEnemy',
@@ -38,7 +41,8 @@ ENEMY_CONFIG = {
             'value': 3,
             'color': (255, 20, 147),  # Deep pink
             'radius': 12,
-            'flying': True
+            'flying': True,
+            'route': 'flying'
         },
         'basic_boss': {
             'class': 'BasicBossEnemy',
@@ -47,7 +51,16 @@ ENEMY_CONFIG = {
             'value': 20,
             'color': (80, 140, 190),  # Steel blue
             'radius': 30,
-            'flying': False
+            'flying': False,
+            'route': 'heavy'
         }
     }
-}
\ No newline at end of file
+}
+
+# Movement classes. Each enemy type names one with 'route'; a map path may be limited to
+# some routes (see docs/README.md), free routes ignore paths and fly straight to the goal
+ENEMY_ROUTES = {
+    'ground': {'free': False},
+    'heavy': {'free': False},   # Too big for paths limited to 'ground'
+    'flying': {'free': True},
+}
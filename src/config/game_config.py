@@ -2,4 +2,19 @@ GAME_CONFIG = {
     'starting_lives': 20,
     'starting_money': 100,
     'initial_speed': 1.0,
+    'min_speed': 0.25,
+    'max_speed': 8.0,
+    'tick_rate': 60,            # Fixed simulation ticks per second of game time
+    'max_ticks_per_frame': 32,  # Backlog beyond this is dropped instead of spiralling
+    'enemy_engine': 'sprite',   # 'sprite' (one Enemy.update per enemy) or 'array' (vectorized EnemyStore)
+    'spatial_cell_size': 64,    # Cell size (px) of the enemy spatial grid
+    'projectile_range_factor': 1.5,  # Projectiles are culled after flying this many times their tower's range
+    'quicksave_path': 'quicksave.mfs',  # F5 saves the game here, F9 loads it
+    'map_dirs': ['maps'],              # Extra directories searched for <map_id>.json level files
+    'map_cache_dir': '.map_cache',     # Baked map data, keyed by a hash of the map file
+    'flow_cell_size': 8,        # Cell size (px) of the enemy flow fields
+    'path_width': 41,           # Drawn path width (px), ground enemies steer within it
+    'sim_process_enemies': 4096,      # Shared memory capacity of the --sim-process simulation,
+    'sim_process_projectiles': 4096,  # entities beyond these are simulated but not drawn
+    'sim_process_towers': 256,
 }
\ No newline at end of file
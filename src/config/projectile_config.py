@@ -45,9 +45,24 @@ ELEMENTAL_EFFECTS = {
         'color': (173, 216, 230) # Light Blue
     },
     'storm': {
+        'type': 'chain',
         'chain_range': 80,      # Range to chain to next enemy
         'max_jumps': 3,         # Max number of jumps
         'damage_reduction': 0.2, # 20% damage reduction per jump
+        'arc_duration': 0.15,   # Seconds a chain arc stays visible
         'color': Colors.YELLOW
     }
-}
\ No newline at end of file
+}
+
+# Status effect kinds applied by elemental hits. Stacking rule when an enemy
+# already has the kind: 'refresh' restarts the duration and keeps the stronger
+# magnitude, 'ignore' leaves the running effect untouched.
+STATUS_EFFECTS = {
+    'burn': {
+        'stacking': 'refresh',
+        'tick_interval': 1.0,   # Seconds between burn damage ticks
+    },
+    'slow': {
+        'stacking': 'refresh',  # Speed is base speed * (1 - slow_pct) while active
+    },
+}
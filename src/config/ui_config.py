@@ -28,7 +28,13 @@ UI_CONFIG = {
     'text_color': (255, 255, 255),
     'font_size_large': 46,
     'font_size_medium': 24,
-    'font_size_small': 18
+    'font_size_small': 18,
+    'text_cache_size': 256,  # Rendered text surfaces kept by the LRU text cache
+    'dirty_rects': True,     # Present only changed regions instead of flipping the whole window
+    'dirty_max_area_pct': 0.4,  # Fall back to a full flip above this fraction of the screen
+    'perf_history_seconds': 10,   # Frames kept by the performance HUD (F3)
+    'perf_dump_seconds': 10,      # Seconds of frames written by the JSON dump (F4)
+    'perf_refresh_interval': 0.25 # Seconds between performance HUD text/graph refreshes
 }
 
 UI_POSITIONS = {
@@ -38,5 +44,6 @@ UI_POSITIONS = {
     'lives': (SCREEN_WIDTH - 125, 10),
     'speed': (10, SCREEN_HEIGHT - 40),
     'wave_timer': (SCREEN_WIDTH//2 - 100, 50),
-    'tower_shop': (10, 100)  # Starting position for tower shop
+    'tower_shop': (10, 100),  # Starting position for tower shop
+    'perf_hud': (SCREEN_WIDTH - 280, 100)
 }
\ No newline at end of file
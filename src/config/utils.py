@@ -1,4 +1,5 @@
 # Game constants and helper functions
+import time
 import pygame
 
 def distance(pos1, pos2):
@@ -16,4 +17,21 @@ def load_image(path, scale=None):
         # Return a placeholder colored rectangle if image not found
         surf = pygame.Surface((32, 32))
         surf.fill((255, 0, 255))  # Magenta placeholder
-        return surf
\ No newline at end of file
+        return surf
+
+class StartupTimer:
+    """Records named milestones relative to when it was created"""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = {}
+
+    def mark(self, name):
+        """Record a milestone the first time it is reached"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def has(self, name):
+        return name in self.marks
+
+    def report(self):
+        return "\n".join(f"  {name}: {elapsed * 1000:.1f} ms" for name, elapsed in self.marks.items())
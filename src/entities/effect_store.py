@@ -0,0 +1,144 @@
+import numpy as np
+from ..config.projectile_config import ELEMENTAL_EFFECTS, STATUS_EFFECTS
+
+EFFECT_KINDS = tuple(STATUS_EFFECTS)
+BURN = EFFECT_KINDS.index('burn')
+SLOW = EFFECT_KINDS.index('slow')
+
+class EffectStore:
+    """Array-backed status effects, one row per (enemy, effect kind)
+
+    Expiry and burn ticks run for every row in one vectorized pass; only the
+    rows that actually deal damage or expire call back into their enemy."""
+    def __init__(self, capacity=64):
+        # Per element: (kind, duration, magnitude), resolved once instead of per hit
+        self.elements = {}
+        for element, data in ELEMENTAL_EFFECTS.items():
+            if data.get('type') in STATUS_EFFECTS:
+                magnitude = data['slow_pct'] if data['type'] == 'slow' else data['damage_per_second']
+                self.elements[element] = (EFFECT_KINDS.index(data['type']), data['duration'], magnitude)
+        self.refresh = np.array([STATUS_EFFECTS[kind]['stacking'] == 'refresh' for kind in EFFECT_KINDS])
+        self.tick_interval = np.array([STATUS_EFFECTS[kind].get('tick_interval', 0.0) for kind in EFFECT_KINDS])
+
+        self.count = 0
+        self.capacity = 0
+        self.owners = []   # Row -> enemy
+        self.sources = []  # Row -> tower type credited with effect damage
+        self.rows = {}     # (enemy, kind) -> row
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create (or grow) the backing arrays"""
+        def grow(old, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        first = self.capacity == 0
+        self.kind = grow(None if first else self.kind, np.int8)
+        self.remaining = grow(None if first else self.remaining, np.float64)
+        self.magnitude = grow(None if first else self.magnitude, np.float64)
+        self.timer = grow(None if first else self.timer, np.float64)
+        self.owners.extend([None] * (capacity - self.capacity))
+        self.sources.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def apply(self, enemy, element, source=None):
+        """Apply an element's status effect to an enemy, following its stacking rule"""
+        if element not in self.elements:
+            return
+        kind, duration, magnitude = self.elements[element]
+        row = self.rows.get((enemy, kind))
+        if row is None:
+            self.add_row(enemy, kind, duration, magnitude, 0.0, source)
+        elif self.refresh[kind]:
+            self.remaining[row] = max(self.remaining[row], duration)
+            if magnitude >= self.magnitude[row]:
+                self.magnitude[row] = magnitude
+                self.sources[row] = source
+        else:
+            return
+        if kind == SLOW:
+            self._update_speed(enemy)
+
+    def add_row(self, enemy, kind, remaining, magnitude, timer=0.0, source=None):
+        """Append a new effect row as is, without stacking rules or speed updates"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        self.count += 1
+        self.rows[(enemy, kind)] = row
+        self.owners[row] = enemy
+        self.sources[row] = source
+        self.kind[row] = kind
+        self.remaining[row] = remaining
+        self.magnitude[row] = magnitude
+        self.timer[row] = timer
+        return row
+
+    def has_effect(self, enemy, kind_name):
+        return (enemy, EFFECT_KINDS.index(kind_name)) in self.rows
+
+    def update(self, dt):
+        """Expire effects and tick burn damage for every affected enemy"""
+        n = self.count
+        if n == 0:
+            return
+        remaining = self.remaining[:n]
+        remaining -= dt
+        expired = remaining <= 0
+
+        # Damage-over-time rows tick on a per-kind interval
+        interval = self.tick_interval[self.kind[:n]]
+        ticking = (interval > 0) & ~expired
+        timer = self.timer[:n]
+        timer += np.where(ticking, dt, 0.0)
+        due = ticking & (timer >= interval)
+        for row in np.flatnonzero(due):
+            timer[row] = 0.0
+            self.owners[row].take_damage(self.magnitude[row] * interval[row], self.sources[row])
+
+        if expired.any():
+            slowed = [self.owners[row] for row in np.flatnonzero(expired & (self.kind[:n] == SLOW))]
+            self._compact(~expired)
+            for enemy in slowed:
+                self._update_speed(enemy)
+
+    def remove_enemies(self, enemies):
+        """Drop every effect on enemies that left the game"""
+        n = self.count
+        if n == 0:
+            return
+        keep = np.ones(n, dtype=np.bool_)
+        for enemy in enemies:
+            for kind in range(len(EFFECT_KINDS)):
+                row = self.rows.get((enemy, kind))
+                if row is not None:
+                    keep[row] = False
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep_mask):
+        """Stable compaction of the rows in keep_mask"""
+        n = self.count
+        keep = np.flatnonzero(keep_mask)
+        k = keep.size
+        for name in ('kind', 'remaining', 'magnitude', 'timer'):
+            array = getattr(self, name)
+            array[:k] = array[keep]
+        self.owners[:k] = [self.owners[row] for row in keep]
+        self.sources[:k] = [self.sources[row] for row in keep]
+        self.owners[k:n] = [None] * (n - k)
+        self.sources[k:n] = [None] * (n - k)
+        self.count = k
+        kinds = self.kind[:k].tolist()
+        self.rows = {(self.owners[row], kinds[row]): row for row in range(k)}
+
+    def _update_speed(self, enemy):
+        """Recompute speed from the base speed, so slows are undone exactly"""
+        row = self.rows.get((enemy, SLOW))
+        if row is None:
+            enemy.speed = enemy.base_speed
+        else:
+            enemy.speed = enemy.base_speed * (1 - self.magnitude[row])
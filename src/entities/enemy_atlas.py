@@ -0,0 +1,83 @@
+import pygame
+from ..config.enemy_config import ENEMY_CONFIG
+from ..managers.resource_manager import RESOURCES
+
+HEALTH_BAR_HEIGHT = 4
+HEALTH_BAR_OFFSET = 8  # Gap between the top of the enemy and its health bar
+
+class EnemyAtlas:
+    """One surface holding a sprite per ENEMY_CONFIG type and every health bar fill level
+
+    Health bars are quantized to whole pixels: a bar of width w has w + 1 fill
+    levels, which is exactly what drawing int(w * hp / max_hp) pixels produces.
+    """
+    def __init__(self):
+        types = ENEMY_CONFIG['types']
+        columns = []
+        for enemy_type, stats in types.items():
+            size = stats['radius'] * 2
+            columns.append((enemy_type, stats, size, size + (size + 1) * HEALTH_BAR_HEIGHT))
+
+        width = sum(size for _, _, size, _ in columns)
+        height = max(column_height for _, _, _, column_height in columns)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.sprite_areas = {}  # type -> Rect of the enemy sprite
+        self.bar_areas = {}     # type -> list of Rects, indexed by filled pixels
+
+        x = 0
+        for enemy_type, stats, size, _ in columns:
+            radius = stats['radius']
+            pygame.draw.circle(self.surface, stats['color'], (x + radius, radius), radius)
+            self.sprite_areas[enemy_type] = pygame.Rect(x, 0, size, size)
+
+            bars = []
+            for filled in range(size + 1):
+                bar = pygame.Rect(x, size + filled * HEALTH_BAR_HEIGHT, size, HEALTH_BAR_HEIGHT)
+                self.surface.fill((255, 0, 0), bar)
+                self.surface.fill((0, 255, 0), (bar.x, bar.y, filled, HEALTH_BAR_HEIGHT))
+                bars.append(bar)
+            self.bar_areas[enemy_type] = bars
+            x += size
+
+        # Match the display pixel format so blits are plain copies
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def sprite(self, enemy_type):
+        return self.surface.subsurface(self.sprite_areas[enemy_type])
+
+    def blit_list(self, enemies, alpha=1.0):
+        """Surface.blits sequence drawing every enemy and its health bar"""
+        surface = self.surface
+        sprite_areas = self.sprite_areas
+        bar_areas = self.bar_areas
+        blits = []
+        for enemy in enemies:
+            # Interpolate between the last two sim positions
+            x = int(enemy.prev_x + (enemy.x - enemy.prev_x) * alpha)
+            y = int(enemy.prev_y + (enemy.y - enemy.prev_y) * alpha)
+            radius = enemy.radius
+            bars = bar_areas[enemy.type]
+            filled = int((len(bars) - 1) * enemy.hp / enemy.max_hp)
+            blits.append((surface, (x - radius, y - radius), sprite_areas[enemy.type]))
+            blits.append((surface, (x - radius, y - radius - HEALTH_BAR_OFFSET), bars[filled]))
+        return blits
+
+    def blit_arrays(self, types, xs, ys, hp_fractions):
+        """blit_list for enemies given as arrays: ENEMY_CONFIG type indices, drawn positions and hp / max_hp"""
+        surface = self.surface
+        sprite_areas = list(self.sprite_areas.values())  # Built in ENEMY_CONFIG order
+        bar_areas = list(self.bar_areas.values())
+        blits = []
+        for enemy_type, x, y, fraction in zip(types.tolist(), xs.tolist(), ys.tolist(), hp_fractions.tolist()):
+            sprite = sprite_areas[enemy_type]
+            bars = bar_areas[enemy_type]
+            radius = sprite.width // 2
+            blits.append((surface, (x - radius, y - radius), sprite))
+            blits.append((surface, (x - radius, y - radius - HEALTH_BAR_OFFSET), bars[int((len(bars) - 1) * fraction)]))
+        return blits
+
+
+def get_enemy_atlas():
+    """Shared atlas, built the first time enemies are drawn"""
+    return RESOURCES.get_surface('enemy_atlas', EnemyAtlas)
@@ -0,0 +1,211 @@
+import numpy as np
+import pygame
+from ..config.enemy_config import ENEMY_CONFIG
+from .enemy import Enemy
+from .flow_field import ROUTES
+from .pool import ObjectPool
+
+class EnemyStore:
+    """Struct-of-arrays enemy storage, steered by the flow field in one vectorized step
+
+    Each tick every enemy looks up the direction of its cell for its route,
+    moves along it and reads the distance left to the goal from its new cell."""
+    def __init__(self, flow_field, capacity=64):
+        self.field = flow_field
+
+        self.count = 0
+        self.capacity = 0
+        self.enemies = []  # Slot -> StoredEnemy view
+        self.pool = ObjectPool(StoredEnemy, 'stored_enemy')  # Views are recycled once removed
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create (or grow) the backing arrays"""
+        def grow(old, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        first = self.capacity == 0
+        self.x = grow(None if first else self.x, np.float64)
+        self.y = grow(None if first else self.y, np.float64)
+        self.prev_x = grow(None if first else self.prev_x, np.float64)
+        self.prev_y = grow(None if first else self.prev_y, np.float64)
+        self.speed = grow(None if first else self.speed, np.float64)
+        self.hp = grow(None if first else self.hp, np.float64)
+        self.max_hp = grow(None if first else self.max_hp, np.float64)
+        self.radius = grow(None if first else self.radius, np.float64)
+        self.value = grow(None if first else self.value, np.int64)
+        self.route = grow(None if first else self.route, np.int64)
+        self.dir_x = grow(None if first else self.dir_x, np.float64)
+        self.dir_y = grow(None if first else self.dir_y, np.float64)
+        self.goal_distance = grow(None if first else self.goal_distance, np.float64)
+        self.flying = grow(None if first else self.flying, np.bool_)
+        self.reached_goal = grow(None if first else self.reached_goal, np.bool_)
+        self.grid_key = grow(None if first else self.grid_key, np.int64)  # Spatial grid cell, -1 if not inserted
+        self.enemies.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def spawn(self, enemy_type='basic', spawn=(0, 0)):
+        """Create a new enemy of the given ENEMY_CONFIG type backed by this store"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        stats = ENEMY_CONFIG['types'][enemy_type]
+        self.max_hp[slot] = stats['max_hp']
+        self.radius[slot] = stats['radius']
+        self.value[slot] = stats['value']
+        self.flying[slot] = stats['flying']
+        self.route[slot] = ROUTES.index(stats['route'])
+        self.reached_goal[slot] = False
+        self.grid_key[slot] = -1
+        enemy = self.pool.acquire(self, slot, self.field, enemy_type, spawn)
+        self.enemies[slot] = enemy
+        return enemy
+
+    def update(self, dt):
+        """Move every live enemy by speed * dt along its flow field direction"""
+        n = self.count
+        if n == 0:
+            return
+        field = self.field
+        reached = self.reached_goal[:n]
+        route = self.route[:n]
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        # Moves longer than a cell are split, as in Enemy.update
+        step = self.speed[:n] * dt
+        substeps = np.where(step > field.cell_size, np.ceil(step / field.cell_size), 1.0)
+        step = step / substeps
+        for i in range(int(substeps.max())):
+            moving = ~reached & (substeps > i)
+            cells = field.cells_at(x, y)
+            dx = field.dx[route, cells]
+            dy = field.dy[route, cells]
+            part = np.where(moving, step, 0.0)
+            x += dx * part
+            y += dy * part
+            self.dir_x[:n][moving] = dx[moving]
+            self.dir_y[:n][moving] = dy[moving]
+
+            goal_distance = field.distance[route, field.cells_at(x, y)]
+            self.goal_distance[:n][moving] = goal_distance[moving]
+            reached |= moving & (goal_distance <= field.goal_radius)
+
+    def remove_finished(self):
+        """Drop enemies that reached the goal or died, returns (leaked, dead) lists"""
+        n = self.count
+        if n == 0:
+            return [], []
+        leaked_mask = self.reached_goal[:n]
+        dead_mask = ~leaked_mask & (self.hp[:n] <= 0)
+        finished = leaked_mask | dead_mask
+        if not finished.any():
+            return [], []
+
+        enemies = self.enemies
+        leaked = [enemies[slot] for slot in np.flatnonzero(leaked_mask)]
+        dead = [enemies[slot] for slot in np.flatnonzero(dead_mask)]
+
+        # Stable compaction keeps spawn order intact
+        keep = np.flatnonzero(~finished)
+        k = keep.size
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'speed', 'hp', 'max_hp', 'radius', 'value', 'route', 'dir_x',
+                     'dir_y', 'goal_distance', 'flying', 'reached_goal', 'grid_key'):
+            array = getattr(self, name)
+            array[:k] = array[keep]
+        first_moved = int(np.argmax(finished))
+        kept = [enemies[slot] for slot in keep]
+        for slot in range(first_moved, k):
+            kept[slot]._slot = slot
+        enemies[:k] = kept
+        enemies[k:n] = [None] * (n - k)
+        self.count = k
+
+        # Detach removed enemies so their views keep their last values, and recycle them
+        for enemy in leaked + dead:
+            enemy._detach()
+            self.pool.release(enemy)
+        return leaked, dead
+
+    def positions(self):
+        """(count, 2) view of live enemy positions"""
+        return np.column_stack((self.x[:self.count], self.y[:self.count]))
+
+
+class StoredEnemy(Enemy):
+    """Enemy whose hot state lives in an EnemyStore instead of on the object"""
+    _STORED = ('x', 'y', 'prev_x', 'prev_y', 'speed', 'hp', 'goal_distance', 'reached_goal')
+
+    def __init__(self, store, slot, flow_field, enemy_type='basic', spawn=(0, 0)):
+        pygame.sprite.Sprite.__init__(self)
+        self.pool = None
+        self.reset(store, slot, flow_field, enemy_type, spawn)
+
+    def reset(self, store, slot, flow_field, enemy_type='basic', spawn=(0, 0)):
+        """Rebind a recycled view to a fresh store slot"""
+        self._store = store
+        self._slot = slot
+        self._detached = None
+        super().reset(flow_field, enemy_type, spawn)
+
+    def _detach(self):
+        """Copy stored values onto the object once it leaves the store"""
+        self._detached = {name: getattr(self, name) for name in self._STORED}
+        self._detached['direction'] = self.direction
+        self._store = None
+
+    def _get(self, array_name, name):
+        if self._store is None:
+            return self._detached[name]
+        return getattr(self._store, array_name)[self._slot]
+
+    def _set(self, array_name, name, value):
+        if self._store is None:
+            self._detached[name] = value
+        else:
+            getattr(self._store, array_name)[self._slot] = value
+
+    x = property(lambda self: float(self._get('x', 'x')),
+                 lambda self, value: self._set('x', 'x', value))
+    y = property(lambda self: float(self._get('y', 'y')),
+                 lambda self, value: self._set('y', 'y', value))
+    prev_x = property(lambda self: float(self._get('prev_x', 'prev_x')),
+                      lambda self, value: self._set('prev_x', 'prev_x', value))
+    prev_y = property(lambda self: float(self._get('prev_y', 'prev_y')),
+                      lambda self, value: self._set('prev_y', 'prev_y', value))
+    speed = property(lambda self: float(self._get('speed', 'speed')),
+                     lambda self, value: self._set('speed', 'speed', value))
+    hp = property(lambda self: float(self._get('hp', 'hp')),
+                  lambda self, value: self._set('hp', 'hp', value))
+    goal_distance = property(lambda self: float(self._get('goal_distance', 'goal_distance')),
+                             lambda self, value: self._set('goal_distance', 'goal_distance', value))
+    reached_goal = property(lambda self: bool(self._get('reached_goal', 'reached_goal')),
+                            lambda self, value: self._set('reached_goal', 'reached_goal', value))
+
+    @property
+    def direction(self):
+        if self._store is None:
+            return self._detached['direction']
+        return (float(self._store.dir_x[self._slot]), float(self._store.dir_y[self._slot]))
+
+    @direction.setter
+    def direction(self, value):
+        if self._store is None:
+            self._detached['direction'] = value
+        else:
+            self._store.dir_x[self._slot], self._store.dir_y[self._slot] = value
+
+    @property
+    def rect(self):
+        size = int(self.radius * 2)
+        return pygame.Rect(int(self.x) - size // 2, int(self.y) - size // 2, size, size)
+
+    @rect.setter
+    def rect(self, value):
+        pass  # Derived from the stored position
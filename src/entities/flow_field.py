@@ -0,0 +1,178 @@
+import heapq
+import math
+import numpy as np
+from ..config.enemy_config import ENEMY_ROUTES
+
+ROUTES = tuple(ENEMY_ROUTES)
+
+
+def path_network(paths):
+    """Vertices, directed segments, spawns and goals of a set of polylines
+
+    Polylines connect wherever they share a point, which is how forks and
+    merges are expressed. Spawns are first points nothing leads into, goals
+    are points nothing leads out of.
+    """
+    vertices = {}  # Point -> vertex id
+    segments = []  # (start id, end id, path index)
+    for index, points in enumerate(paths):
+        ids = [vertices.setdefault(tuple(point), len(vertices)) for point in points]
+        for start, end in zip(ids, ids[1:]):
+            if start != end:
+                segments.append((start, end, index))
+
+    incoming = {end for _, end, _ in segments}
+    outgoing = {start for start, _, _ in segments}
+    points = list(vertices)
+    spawns = []
+    for path in paths:
+        vertex = vertices[tuple(path[0])]
+        if vertex not in incoming and points[vertex] not in spawns:
+            spawns.append(points[vertex])
+    goals = [point for vertex, point in enumerate(points) if vertex in incoming and vertex not in outgoing]
+    if not spawns or not goals:
+        raise ValueError("Map paths need at least one spawn and one goal")
+    return points, segments, spawns, goals
+
+
+def _goal_distances(points, segments, goals):
+    """Shortest distance along the segments from every vertex to the nearest goal"""
+    into = [[] for _ in points]
+    for start, end, _ in segments:
+        into[end].append(start)
+    distance = [math.inf] * len(points)
+    heap = []
+    for vertex, point in enumerate(points):
+        if point in goals:
+            distance[vertex] = 0.0
+            heap.append((0.0, vertex))
+    heapq.heapify(heap)
+    while heap:
+        dist, vertex = heapq.heappop(heap)
+        if dist > distance[vertex]:
+            continue
+        for start in into[vertex]:
+            candidate = dist + math.dist(points[start], points[vertex])
+            if candidate < distance[start]:
+                distance[start] = candidate
+                heapq.heappush(heap, (candidate, start))
+    return distance
+
+
+def bake_flow_fields(paths, path_routes, width, height, cell_size, path_width):
+    """Per-route direction and distance-to-goal grids, shape (routes, cells)
+
+    Ground routes follow the path segments they may use: inside the path a cell
+    steers along the segment with the least distance left, pulled toward its
+    center line, outside it steers back to the nearest segment. Free routes
+    head straight for the nearest goal.
+    """
+    points, segments, spawns, goals = path_network(paths)
+    cols = max(1, math.ceil(width / cell_size))
+    rows = max(1, math.ceil(height / cell_size))
+    cx, cy = np.meshgrid((np.arange(cols) + 0.5) * cell_size, (np.arange(rows) + 0.5) * cell_size)
+    centers = np.column_stack((cx.ravel(), cy.ravel()))
+    half_width = path_width / 2.0
+
+    flow_dx = np.zeros((len(ROUTES), len(centers)))
+    flow_dy = np.zeros((len(ROUTES), len(centers)))
+    flow_distance = np.zeros((len(ROUTES), len(centers)))
+    for r, route in enumerate(ROUTES):
+        if ENEMY_ROUTES[route]['free']:
+            targets = np.array(goals, dtype=np.float64)
+            offsets = targets[None, :, :] - centers[:, None, :]
+            dist = np.hypot(offsets[..., 0], offsets[..., 1])
+            nearest = dist.argmin(axis=1)
+            cells = np.arange(len(centers))
+            best = dist[cells, nearest]
+            safe = np.where(best > 0, best, 1.0)
+            flow_dx[r] = offsets[cells, nearest, 0] / safe
+            flow_dy[r] = offsets[cells, nearest, 1] / safe
+            flow_distance[r] = best
+            continue
+
+        allowed = [segment for segment in segments if path_routes[segment[2]] is None or route in path_routes[segment[2]]]
+        vertex_distance = _goal_distances(points, allowed, goals)
+        usable = [(start, end) for start, end, _ in allowed if math.isfinite(vertex_distance[end])]
+        if not usable:
+            flow_distance[r] = np.inf
+            continue
+        a = np.array([points[start] for start, _ in usable], dtype=np.float64)
+        b = np.array([points[end] for _, end in usable], dtype=np.float64)
+        end_distance = np.array([vertex_distance[end] for _, end in usable])
+        delta = b - a
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        direction = delta / length[:, None]
+
+        # Projection of every cell center on every segment, shape (cells, segments)
+        offset = centers[:, None, :] - a[None, :, :]
+        t = np.clip((offset * delta[None, :, :]).sum(axis=2) / (length * length)[None, :], 0.0, 1.0)
+        proj = a[None, :, :] + t[..., None] * delta[None, :, :]
+        to_line = proj - centers[:, None, :]
+        lateral = np.hypot(to_line[..., 0], to_line[..., 1])
+        left = end_distance[None, :] + (1.0 - t) * length[None, :]
+
+        inside = lateral <= half_width
+        any_inside = inside.any(axis=1)
+        # Past the end of a segment the next one ties with it, hand over to the next one
+        cost = np.where(inside, left + np.where(t >= 1.0, 1e-3, 0.0), np.inf)
+        best = np.where(any_inside, cost.argmin(axis=1), lateral.argmin(axis=1))
+        cells = np.arange(len(centers))
+        pull = to_line[cells, best]
+        steer = np.where(any_inside[:, None], direction[best] + pull / half_width, pull)
+        norm = np.hypot(steer[:, 0], steer[:, 1])
+        steer = np.where(norm[:, None] > 1e-9, steer / np.maximum(norm, 1e-9)[:, None], direction[best])
+        flow_dx[r] = steer[:, 0]
+        flow_dy[r] = steer[:, 1]
+        flow_distance[r] = left[cells, best] + np.where(any_inside, 0.0, lateral[cells, best])
+
+    return {
+        'flow_shape': np.array([cols, rows, cell_size], dtype=np.float64),
+        'flow_dx': flow_dx,
+        'flow_dy': flow_dy,
+        'flow_distance': flow_distance,
+        'spawns': np.array(spawns, dtype=np.float64).reshape(-1, 2),
+        'goals': np.array(goals, dtype=np.float64).reshape(-1, 2),
+    }
+
+
+class FlowField:
+    """Precomputed steering for every route: one cell lookup per enemy per tick
+
+    Enemies move along the direction of the cell they are in; the distance
+    left to the nearest goal is read from the cell they end up in.
+    """
+    def __init__(self, cols, rows, cell_size, flow_dx, flow_dy, flow_distance):
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.inverse_cell_size = 1.0 / cell_size
+        self.goal_radius = cell_size  # Enemies this close to a goal have reached it
+        self.dx = flow_dx                # (routes, cells) arrays for the vectorized engine
+        self.dy = flow_dy
+        self.distance = flow_distance
+        # Plain lists per route for per-enemy lookups
+        self.directions = [list(zip(dx.tolist(), dy.tolist())) for dx, dy in zip(flow_dx, flow_dy)]
+        self.distances = [distance.tolist() for distance in flow_distance]
+
+    @classmethod
+    def from_baked(cls, baked):
+        cols, rows, cell_size = baked['flow_shape'].tolist()
+        return cls(int(cols), int(rows), cell_size, baked['flow_dx'], baked['flow_dy'], baked['flow_distance'])
+
+    def cell_at(self, x, y):
+        """Cell index of a point, points outside the grid clamp to the border cells"""
+        cx = int(x * self.inverse_cell_size)  # Truncation, the same as flooring once clamped
+        cy = int(y * self.inverse_cell_size)
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return cy * self.cols + cx
+        return min(max(cy, 0), self.rows - 1) * self.cols + min(max(cx, 0), self.cols - 1)
+
+    def cells_at(self, xs, ys):
+        """Vectorized cell_at over coordinate arrays"""
+        cx = np.clip((xs * self.inverse_cell_size).astype(np.int64), 0, self.cols - 1)
+        cy = np.clip((ys * self.inverse_cell_size).astype(np.int64), 0, self.rows - 1)
+        return cy * self.cols + cx
+
+    def goal_distance(self, route, x, y):
+        return self.distances[route][self.cell_at(x, y)]
@@ -1,32 +1,122 @@
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+import numpy as np
 import pygame
-from ..config.ui_config import Colors
-from ..maps.level_1 import LEVEL_1
-from ..maps.level_2 import LEVEL_2
+from ..config.game_config import GAME_CONFIG
+from ..config.tower_config import TOWER_CONFIG
+from ..config.enemy_config import ENEMY_ROUTES
+from ..config.ui_config import Colors, GAME_HEIGHT, GAME_WIDTH
+from .flow_field import FlowField, bake_flow_fields
+from .path import Path
+
+BUILTIN_MAP_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'maps')
+BAKE_VERSION = 2  # Bump when bake_map() output changes, old cache files are then ignored
+
+
+def bake_map(paths, path_routes, tower_points):
+    """Everything derived from a map's layout: spot rects, path segments, spot-to-path distances, flow fields"""
+    built = [Path(points) for points in paths]
+    rects = np.array(tower_points, dtype=np.int32).reshape(-1, 4)
+
+    # Distance from each spot's center to the nearest point of any path
+    centers = rects[:, :2] + rects[:, 2:] / 2.0
+    starts = np.array([start for path in built for start in path.points[:-1]], dtype=np.float64).reshape(-1, 2)
+    deltas = np.array([end for path in built for end in path.points[1:]], dtype=np.float64).reshape(-1, 2) - starts
+    if len(starts):
+        lengths_sq = np.maximum((deltas ** 2).sum(axis=1), 1e-12)
+        offsets = centers[:, None, :] - starts[None, :, :]
+        t = np.clip((offsets * deltas).sum(axis=2) / lengths_sq, 0.0, 1.0)
+        nearest = starts[None, :, :] + t[:, :, None] * deltas[None, :, :]
+        distances = np.sqrt(((centers[:, None, :] - nearest) ** 2).sum(axis=2)).min(axis=1)
+    else:
+        distances = np.hypot(*(centers - np.array(built[0].points[:1], dtype=np.float64)).T)
+
+    baked = {
+        'tower_rects': rects,
+        # Paths back to back, path_sizes splits them again
+        'path_sizes': np.array([len(path) for path in built], dtype=np.int64),
+        'segment_lengths': np.array([x for path in built for x in path.segment_lengths], dtype=np.float64),
+        'directions': np.array([d for path in built for d in path.directions], dtype=np.float64).reshape(-1, 2),
+        'cumulative_lengths': np.array([x for path in built for x in path.cumulative_lengths], dtype=np.float64),
+        'spot_path_distances': distances,
+    }
+    baked.update(bake_flow_fields(paths, path_routes, GAME_WIDTH, GAME_HEIGHT, GAME_CONFIG['flow_cell_size'],
+                                  GAME_CONFIG['path_width']))
+    return baked
+
 
 class Map:
-    def __init__(self, path_points, tower_points, name="Unnamed Map"):
+    def __init__(self, paths, tower_points, name="Unnamed Map", map_id=None, baked=None, path_routes=None):
+        self.map_id = map_id
         self.name = name
-        self.path_points = path_points
-        self.tower_points = tower_points
-        self.tower_rects = [pygame.Rect(spot) for spot in tower_points]
+        self.path_routes = path_routes or [None] * len(paths)  # Routes allowed on each path, None for all
+        if baked is None:
+            baked = bake_map(paths, self.path_routes, tower_points)
+
+        # Arc-length lookup per path: cumulative segment lengths and directions
+        self.paths = []
+        segments = points = 0
+        directions = [tuple(direction) for direction in baked['directions'].tolist()]
+        for size, path in zip(baked['path_sizes'].tolist(), paths):
+            self.paths.append(Path(path, (baked['segment_lengths'][segments:segments + size - 1].tolist(),
+                                          directions[segments:segments + size - 1],
+                                          baked['cumulative_lengths'][points:points + size].tolist())))
+            segments += size - 1
+            points += size
+        self.path = self.paths[0]
+
+        # Enemy steering, see src/entities/flow_field.py
+        self.flow_field = FlowField.from_baked(baked)
+        self.spawns = [tuple(point) for point in baked['spawns'].tolist()]
+        self.goals = [tuple(point) for point in baked['goals'].tolist()]
+
+        self.tower_points = [tuple(spot) for spot in baked['tower_rects'].tolist()]
+        self.tower_rects = [pygame.Rect(spot) for spot in self.tower_points]
+        self.spot_path_distances = baked['spot_path_distances'].tolist()  # Spot center to nearest path point
+        self.static_layer = None  # Pre-rendered path, spots and spawn/end markers
+        self.static_layer_key = None
+
+    def get_static_layer(self, size, bg_color):
+        """Background with everything that never changes during a level, rendered once"""
+        key = (tuple(size), tuple(bg_color))
+        if self.static_layer is None or self.static_layer_key != key:
+            layer = pygame.Surface(size)
+            layer.fill(bg_color)
+            self.draw_path(layer)
+            self.draw_tower_spots(layer)
+            self.draw_spawn_point(layer)
+            self.draw_end_point(layer)
+            # Match the display pixel format so the per-frame blit is a plain copy
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            self.static_layer = layer
+            self.static_layer_key = key
+        return self.static_layer
+
+    def invalidate_static_layer(self):
+        """Force the static layer to be re-rendered, call after changing the map layout"""
+        self.static_layer = None
 
     def draw_path(self, screen):
-        if len(self.path_points) > 1:
-            pygame.draw.lines(screen, (140, 140, 35), False, self.path_points, 41)
+        width = GAME_CONFIG['path_width']
+        for path in self.paths:
+            if len(path) > 1:
+                pygame.draw.lines(screen, (140, 140, 35), False, path.points, width)
 
-        # Draw connection points between path segments
-        for pt in self.path_points[1:-1]:  # Skip first and last points
-            pygame.draw.circle(screen, (140, 140, 35), pt, 20)
+            # Draw connection points between path segments
+            for pt in path.points[1:-1]:  # Skip first and last points
+                pygame.draw.circle(screen, (140, 140, 35), pt, width // 2)
 
     def draw_spawn_point(self, screen):
-        if self.path_points:
-            spawn_pos = self.path_points[0]
+        for spawn_pos in self.spawns:
             pygame.draw.circle(screen, Colors.GREEN, spawn_pos, 40)
             pygame.draw.circle(screen, Colors.DARK_GREEN, spawn_pos, 40, 2)
 
     def draw_end_point(self, screen):
-        if self.path_points:
-            end_pos = self.path_points[-1]
+        for end_pos in self.goals:
             pygame.draw.circle(screen, Colors.RED, end_pos, 40)
             pygame.draw.circle(screen, Colors.DARK_RED, end_pos, 40, 2)
 
@@ -35,17 +125,130 @@ class Map:
             pygame.draw.rect(screen, (200,200,50), spot, 1)
 
     def get_path(self):
-        return self.path_points
+        """The first path, the whole route on single path maps"""
+        return self.path
 
     def get_tower_points(self):
         return self.tower_points
 
     def get_tower_rects(self):
         return self.tower_rects
-    
-# Create map instances
-MAPS = {
-    "level_1": Map(LEVEL_1['path_points'], LEVEL_1['tower_points'], LEVEL_1['name']),
-    "level_2": Map(LEVEL_2['path_points'], LEVEL_2['tower_points'], LEVEL_2['name']),
-    # Add more maps as needed
-}
\ No newline at end of file
+
+    def get_spot_path_distances(self):
+        return self.spot_path_distances
+
+
+class MapRegistry:
+    """Map ids discovered from JSON files, each map is read and baked the first time it is used
+
+    Discovery only lists directories. Baked data is cached in cache_dir under the
+    hash of the map file, so a map is only baked again after its file changes.
+    A file that is not a valid map raises ValueError when used and is listed in broken.
+    """
+    def __init__(self, directories, cache_dir):
+        self.directories = list(directories)  # Later directories override maps of the same id
+        self.cache_dir = cache_dir
+        self.files = None  # map_id -> file path, filled by discover()
+        self.maps = {}     # map_id -> loaded Map
+        self.broken = {}   # map_id -> error of a file that failed to load, retried after discover()
+
+    def discover(self):
+        """Rescan the map directories"""
+        files = {}
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                map_id, ext = os.path.splitext(filename)
+                if ext == '.json':
+                    files[map_id] = os.path.join(directory, filename)
+        self.files = files
+        self.maps = {map_id: level for map_id, level in self.maps.items() if map_id in files}
+        self.broken = {}
+        return list(files)
+
+    def _files(self):
+        if self.files is None:
+            self.discover()
+        return self.files
+
+    def __iter__(self):
+        return iter(self._files())
+
+    def __len__(self):
+        return len(self._files())
+
+    def __contains__(self, map_id):
+        return map_id in self._files()
+
+    def __getitem__(self, map_id):
+        level = self.maps.get(map_id)
+        if level is None:
+            try:
+                level = self.maps[map_id] = self.load(map_id)
+            except ValueError as error:
+                self.broken[map_id] = str(error)
+                raise
+        return level
+
+    def keys(self):
+        return self._files().keys()
+
+    def load(self, map_id):
+        """Read a map file and attach its baked data, from the cache when possible"""
+        path = self._files()[map_id]
+        try:
+            return self._load(map_id, path)
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as error:
+            reason = f"missing {error}" if isinstance(error, KeyError) else str(error)
+            raise ValueError(f"Invalid map file {path}: {reason}") from error
+
+    def _load(self, map_id, path):
+        with open(path, 'rb') as file:
+            content = file.read()
+        data = json.loads(content)
+        size = TOWER_CONFIG['size']
+        tower_points = [spot if len(spot) == 4 else (spot[0], spot[1], size, size) for spot in data['tower_points']]
+        # One polyline in 'path_points', or several in 'paths', each a point list or {'points', 'routes'}
+        paths = data.get('paths', [data['path_points']] if 'path_points' in data else [])
+        path_routes = [entry.get('routes') if isinstance(entry, dict) else None for entry in paths]
+        paths = [[tuple(point) for point in (entry['points'] if isinstance(entry, dict) else entry)]
+                 for entry in paths]
+        if not paths or not all(paths):
+            raise ValueError("no points in 'path_points' or 'paths'")
+
+        # Baked data also depends on these configs, so they are part of the key too
+        settings = json.dumps([BAKE_VERSION, size, GAME_CONFIG['flow_cell_size'], GAME_CONFIG['path_width'],
+                               GAME_WIDTH, GAME_HEIGHT, ENEMY_ROUTES], sort_keys=True)
+        digest = hashlib.sha1(settings.encode() + content).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{digest}.npz")
+        name = data.get('name', map_id)
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    baked = {key: cached[key] for key in cached.files}
+                return Map(paths, tower_points, name, map_id, baked, path_routes)
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                pass  # Truncated, corrupt or incomplete cache file, bake again
+        baked = bake_map(paths, path_routes, tower_points)
+        self._write_cache(cache_path, baked)
+        return Map(paths, tower_points, name, map_id, baked, path_routes)
+
+    def _write_cache(self, cache_path, baked):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # A temp file of its own, processes baking the same map at once must not share one
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    np.savez_compressed(file, **baked)
+                os.replace(temp_path, cache_path)  # Readers never see a half written file
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as error:
+            print(f"Could not cache baked map data: {error}")
+
+
+# Built-in levels first, then anything dropped into the user map directories
+MAPS = MapRegistry([BUILTIN_MAP_DIR] + GAME_CONFIG['map_dirs'], GAME_CONFIG['map_cache_dir'])
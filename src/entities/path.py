@@ -0,0 +1,54 @@
+import math
+
+class Path:
+    """Polyline parameterized by arc length: positions are looked up by distance travelled"""
+    def __init__(self, points, baked=None):
+        self.points = [tuple(point) for point in points]
+        self.segment_lengths = []       # Length of each segment
+        self.directions = []            # Unit direction of each segment
+        self.cumulative_lengths = [0.0] # Distance from the start to each waypoint
+
+        if baked is not None:
+            # (segment_lengths, directions, cumulative_lengths) precomputed by the map cache
+            self.segment_lengths, self.directions, self.cumulative_lengths = baked
+            self.length = self.cumulative_lengths[-1]
+            return
+
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            self.segment_lengths.append(length)
+            self.directions.append(((x1 - x0) / length, (y1 - y0) / length) if length else (0.0, 0.0))
+            self.cumulative_lengths.append(self.cumulative_lengths[-1] + length)
+
+        self.length = self.cumulative_lengths[-1]
+
+    def __len__(self):
+        return len(self.points)
+
+    def __getitem__(self, index):
+        return self.points[index]
+
+    def __iter__(self):
+        return iter(self.points)
+
+    def segment_at(self, distance, hint=0):
+        """Index of the segment containing distance, searching forward from hint"""
+        cumulative = self.cumulative_lengths
+        last = len(self.segment_lengths) - 1
+        segment = max(0, min(hint, last))
+        while segment < last and distance >= cumulative[segment + 1]:
+            segment += 1
+        while segment > 0 and distance < cumulative[segment]:
+            segment -= 1
+        return segment
+
+    def position_at(self, distance, segment=None):
+        """(x, y) of the point at distance along the path"""
+        if not self.segment_lengths:
+            return self.points[0]
+        if segment is None:
+            segment = self.segment_at(distance)
+        x0, y0 = self.points[segment]
+        dx, dy = self.directions[segment]
+        offset = distance - self.cumulative_lengths[segment]
+        return (x0 + dx * offset, y0 + dy * offset)
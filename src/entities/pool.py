@@ -0,0 +1,45 @@
+class ObjectPool:
+    """Free list of reusable objects that are reset in place instead of reallocated
+
+    Pooled objects implement reset(*args) with the same arguments as their
+    constructor, and are handed back with release() once they leave the game.
+    """
+    def __init__(self, factory, name=None):
+        self.factory = factory
+        self.name = name or getattr(factory, '__name__', 'pool')
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+        obj.pool = self
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Return an object to the free list, releasing twice is a no-op"""
+        if obj.pool is not self:
+            return
+        obj.pool = None
+        self.in_use -= 1
+        self.free.append(obj)
+
+    def stats(self):
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'peak_in_use': self.peak_in_use,
+        }
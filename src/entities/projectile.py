@@ -1,39 +1,73 @@
+import numpy as np
 import pygame
-from ..config.ui_config import SCREEN_HEIGHT, SCREEN_WIDTH
+from ..config.game_config import GAME_CONFIG
+from ..config.ui_config import GAME_HEIGHT, GAME_WIDTH
 from ..config.projectile_config import PROJECTILE_CONFIG, ELEMENTAL_EFFECTS
+from ..managers.resource_manager import RESOURCES
+
+def _projectile_image(size, color):
+    """Shared solid-colour projectile image"""
+    def render():
+        image = pygame.Surface((size, size))
+        image.fill(color)
+        return image
+    return RESOURCES.get_surface(('projectile', size, tuple(color)), render)
 
 class Projectile(pygame.sprite.Sprite):
-    def __init__(self, start_pos, target_enemy, projectile_type='regular'):
+    def __init__(self, start_pos, target_enemy, projectile_type='regular', max_range=None):
         super().__init__()
+        self.pool = None  # ObjectPool this projectile is checked out from, if any
+        self.pos = pygame.math.Vector2()
+        self.prev_pos = pygame.math.Vector2()  # Start of the last step, for swept collision
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(start_pos, target_enemy, projectile_type, max_range)
+
+    def reset(self, start_pos, target_enemy, projectile_type='regular', max_range=None):
+        """(Re)initialize in place, so pooled projectiles allocate nothing new"""
         # Get stats from config
-        projectile_stats = PROJECTILE_CONFIG[projectile_type]
+        self.__dict__.update(PROJECTILE_CONFIG[projectile_type])
         self.type = projectile_type
-        for stat_name, value in projectile_stats.items():
-            setattr(self, stat_name, value)
         self.element = None # 'pyro', 'glacier', 'storm'
+        self.source = None  # Type of the tower that fired it, for kill attribution
 
-        self.image = pygame.Surface((self.size, self.size))
-        self.image.fill(self.color)
+        self.image = _projectile_image(self.size, self.color)
         # Center the rect on the projectile's position
-        self.rect = self.image.get_rect(center=start_pos)
-        # Make collision rect slightly larger than visual
-        self.rect.inflate_ip(2, 2)  # Add 2 pixels to each side
+        # Make collision rect slightly larger than visual (2 pixels on each side)
+        self.rect.size = (self.size + 2, self.size + 2)
+        self.rect.center = start_pos
 
         # Movement variables
-        self.pos = pygame.math.Vector2(start_pos)
+        self.pos.update(start_pos)
+        self.prev_pos.update(start_pos)
+        self.hit_radius = self.rect.width / 2
+
+        # Projectiles that miss are culled once they fly past their range
+        if max_range is None:
+            max_range = max(GAME_WIDTH, GAME_HEIGHT)
+        self.lifetime = max_range * GAME_CONFIG['projectile_range_factor'] / self.speed
 
         # Targeting (how far to shoot ahead of moving target)
-        self._calculate_lead(target_enemy)
+        # Without a target (restored from a save) the caller sets target and direction
+        if target_enemy is not None:
+            self._calculate_lead(target_enemy)
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
         
     def update(self, dt):
         # Move projectile
+        self.prev_pos.update(self.pos)
         movement = self.direction * self.speed * dt
         self.pos += movement
         self.rect.center = self.pos
+        self.lifetime -= dt
         
-        # Check if projectile has gone off-screen
-        if (self.pos.y < 0 or self.pos.y > SCREEN_HEIGHT or 
-            self.pos.x < 0 or self.pos.x > SCREEN_WIDTH):
+        # Cull once out of range or outside the game area
+        if (self.lifetime <= 0 or
+            self.pos.y < 0 or self.pos.y > GAME_HEIGHT or 
+            self.pos.x < 0 or self.pos.x > GAME_WIDTH):
             self.kill()
             #print("Projectile went off-screen and was removed.")
 
@@ -58,10 +92,17 @@ class Projectile(pygame.sprite.Sprite):
         # Linear falloff: 100% damage at center, 50% at edge
         damage_multiplier = 1 - (distance_to_impact / self.splash_radius) * 0.5
         return int(self.damage * damage_multiplier)
+
+    def get_splash_damages(self, distances):
+        """Batched get_splash_damage for an array of distances"""
+        damage_multiplier = 1 - (distances / self.splash_radius) * 0.5
+        damages = np.trunc(self.damage * damage_multiplier).astype(np.int64)
+        damages[distances > self.splash_radius] = 0
+        return damages
     
     def set_element(self, element_type):
         if element_type in ELEMENTAL_EFFECTS:
             self.element = element_type
             # Change color based on element
             self.color = ELEMENTAL_EFFECTS[element_type]['color']
-            self.image.fill(self.color)
\ No newline at end of file
+            self.image = _projectile_image(self.size, self.color)
\ No newline at end of file
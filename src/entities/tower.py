@@ -1,7 +1,7 @@
 import pygame
 from ..config.tower_config import TOWER_CONFIG, ELEMENTAL_UPGRADES
 from ..config.ui_config import UI_CONFIG, UI_POSITIONS, Colors
-from .projectile import Projectile
+from ..managers.resource_manager import RESOURCES
 
 class Tower:
     def __init__(self, x_pos, y_pos, tower_rect, tower_type='basic'):
@@ -9,6 +9,7 @@ class Tower:
         self.x = x_pos
         self.y = y_pos
         self.rect = tower_rect
+        self.spot = None  # Index of the map tower spot, set by TowerManager
 
         # Tower stats
         tower_stats = TOWER_CONFIG['type'][tower_type]
@@ -28,9 +29,8 @@ class Tower:
         self.game = None  # Will be set when tower is added to the game
         self.is_hovered = False
 
-        # Initialize fonts
-        pygame.font.init()
-        self.small_font = pygame.font.SysFont('Arial', UI_CONFIG["font_size_small"])
+        # Shared font, looked up on first draw so headless simulations never touch pygame.font
+        self.small_font = None
     
     def update(self, dt):
         # First check if target is still valid
@@ -50,12 +50,16 @@ class Tower:
             self.fire_timer = 0
 
     def draw(self, screen):
+        """Draw the tower (and its range and targeting mode when hovered), returns the rect drawn"""
+        drawn = pygame.Rect(self.x - self.size/2, self.y - self.size/2, self.size, self.size)
         if self.is_hovered:
             # Draw range circle
-            pygame.draw.circle(screen, Colors.GRAY, (self.x, self.y), self.range, 1)
+            drawn.union_ip(pygame.draw.circle(screen, Colors.GRAY, (self.x, self.y), self.range, 1))
 
             # Show targeting mode
-            targeting_txt = self.small_font.render(f"{self.targeting_mode}", True, Colors.WHITE)
+            if self.small_font is None:
+                self.small_font = RESOURCES.get_font('Arial', UI_CONFIG["font_size_small"])
+            targeting_txt = RESOURCES.render_text(self.small_font, f"{self.targeting_mode}", Colors.WHITE)
             text_bg = pygame.Rect(
                 self.x - targeting_txt.get_width()//2 - 5,
                 self.y + self.size//2 + 5,
@@ -64,6 +68,7 @@ class Tower:
             )
             pygame.draw.rect(screen, Colors.BLACK, text_bg)
             screen.blit(targeting_txt, (self.x - targeting_txt.get_width()//2, self.y + self.size//2 + 5))
+            drawn.union_ip(text_bg)
 
         # Draw tower (simple square for now)
         pygame.draw.rect(screen, self.color, (self.x - self.size/2, self.y - self.size/2, self.size, self.size))
@@ -71,6 +76,7 @@ class Tower:
             # Draw element indicator
             pygame.draw.circle(screen, ELEMENTAL_UPGRADES[self.element]['color'], 
                                (self.x, self.y), self.size//2)
+        return drawn
 
     def update_hover(self, mouse_pos):
         if self.rect.collidepoint(mouse_pos):
@@ -79,18 +85,20 @@ class Tower:
             self.is_hovered = False
 
     def detect_enemy(self, enemy_pos, enemy_radius):
-        center1 = pygame.math.Vector2((self.x, self.y)) # Tower center
-        center2 = pygame.math.Vector2(enemy_pos)        # Enemy center
-        distance = center1.distance_to(center2)         # Distance between centers
-        return distance < (self.range + enemy_radius)   # Check if within range
+        dx = enemy_pos[0] - self.x                      # Offset from tower center
+        dy = enemy_pos[1] - self.y
+        reach = self.range + enemy_radius
+        return dx * dx + dy * dy < reach * reach        # Check if within range (no sqrt)
     
     def fire_at(self, enemy):
         """Create appropriate projectile type based on tower's projectile_type"""
-        new_projectile = Projectile(
-            start_pos=(self.x, self.y),
-            target_enemy=enemy,
-            projectile_type=self.projectile_type
+        new_projectile = self.game.projectile_pool.acquire(
+            (self.x, self.y),       # start_pos
+            enemy,                  # target_enemy
+            self.projectile_type,   # projectile_type
+            self.range              # max_range
         )
+        new_projectile.source = self.type
         if self.element:
             new_projectile.set_element(self.element)
         self.game.projectiles.add(new_projectile)
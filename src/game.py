@@ -1,50 +1,107 @@
+import os
+import time
+import numpy as np
 import pygame
 
 from src.config.projectile_config import ELEMENTAL_EFFECTS
 
 from .entities.map import MAPS
+from .entities.enemy import Enemy
+from .entities.enemy_store import EnemyStore
+from .entities.effect_store import EffectStore
+from .entities.enemy_atlas import get_enemy_atlas
 from .entities.tower import Tower
 from .entities.projectile import Projectile
+from .entities.pool import ObjectPool
 from .managers.wave_manager import WaveManager
 from .managers.tower_manager import TowerManager
 from .managers.ui_manager import UIManager
+from .managers.collision_manager import CollisionManager
+from .managers.dirty_rect_tracker import DirtyRectTracker
+from .managers.perf_monitor import PerfMonitor
+from .sim.recorder import InputRecorder
+from .sim.savegame import load_game, save_game
 from .config.game_config import GAME_CONFIG
 from .config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
-from .config.ui_config import UI_CONFIG, GAME_HEIGHT, GAME_WIDTH
+from .config.ui_config import UI_CONFIG, GAME_HEIGHT, GAME_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, enemy_engine=None):
         # Set starting map
         self.current_map = MAPS["level_2"]
 
+        # 'sprite' or 'array', GAME_CONFIG['enemy_engine'] unless given
+        self.enemy_engine = enemy_engine or GAME_CONFIG["enemy_engine"]
+
+        # Without a screen the game runs headless: simulation only, no UI or drawing
+        self.headless = screen is None
+
+        # Frame timing overlay, kept across levels (F3 toggles, F4 dumps to JSON)
+        self.perf = PerfMonitor(UI_CONFIG["perf_history_seconds"])
+
+        # Input recording, see src/sim/recorder.py
+        self.record_path = None  # Set to record every level started to this file
+        self.recorder = None
+
+        # Set to a SimulationProcess when the simulation runs in another process, see src/sim/remote.py
+        self.remote = None
+
         # Initialize game state
         self.init_game(screen)
 
     def init_game(self, screen):
         # Screen info
         self.screen = screen
-        self.screen_width = screen.get_width()
-        self.screen_height = screen.get_height()
+        if self.headless:
+            self.screen_width = SCREEN_WIDTH
+            self.screen_height = SCREEN_HEIGHT
+        else:
+            self.screen_width = screen.get_width()
+            self.screen_height = screen.get_height()
 
         # Game world
-        self.game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+        self.game_surface = None if self.headless else pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
         self.viewport = [0, 0]
 
         # Managers
-        self.wave_manager = WaveManager(self, self.current_map.get_path())
-        self.ui_manager = UIManager(self, self.screen, self.wave_manager)
+        self.wave_manager = WaveManager(self, self.current_map)
+        self.ui_manager = None if self.headless else UIManager(self, self.screen, self.wave_manager)
+        self.dirty_rects = None if self.headless else DirtyRectTracker(
+            (self.screen_width, self.screen_height), UI_CONFIG["dirty_max_area_pct"], UI_CONFIG["dirty_rects"]
+        )
+        self.drawn_state = None  # State of the last drawn frame
         self.tower_manager = TowerManager(self)
 
-        # Enemies
+        # Enemies, recycled through a pool instead of reallocated per spawn
         self.enemies = pygame.sprite.Group()
+        self.enemy_pool = ObjectPool(Enemy, 'enemy')
+        if self.enemy_engine == "array":
+            self.enemy_store = EnemyStore(self.current_map.flow_field)
+        else:
+            self.enemy_store = None
+        self.effect_store = EffectStore()  # Burns and slows of every enemy
 
-        # Projectiles
+        # Projectiles, released back to the pool when killed
         self.projectiles = pygame.sprite.Group()
+        self.projectile_pool = ObjectPool(Projectile, 'projectile')
+        self.chain_arcs = []  # [points, time left, color] of recent storm chains, drawn briefly
+
+        # Enemy spatial grid, projectile hits and splash queries
+        self.collision_manager = CollisionManager(self)
 
         # Game stats
         self.lives = GAME_CONFIG["starting_lives"]
         self.money = GAME_CONFIG["starting_money"]
         self.speed_factor = GAME_CONFIG["initial_speed"]
+        self.enemies_killed = 0
+        self.enemies_leaked = 0
+        self.kills_by_tower = {}  # Tower type -> kills, 'other' when no tower was credited
+
+        # Fixed timestep: frames feed an accumulator, the sim advances in whole ticks
+        self.tick_dt = 1.0 / GAME_CONFIG["tick_rate"]
+        self.tick_accumulator = 0.0
+        self.ticks = 0            # Sim ticks run since the level started
+        self.render_alpha = 1.0   # Draw position between the last two sim states
         
         # Game state
         self.state = "menu"  # "menu", "level select", "playing", "paused", "game_over", "victory"
@@ -52,6 +109,32 @@ class Game:
         # Colors for testing
         self.bg_color = UI_CONFIG["bg_color"]
     
+    def enter_level(self, map_id):
+        """Switch to a map from MAPS with a fresh game state, in the playing state"""
+        self.level_started_at = time.perf_counter()  # For startup/level load instrumentation
+        self.current_map = MAPS[map_id]
+        self.init_game(self.screen)
+        self.state = "playing"
+
+    def start_level(self, map_id):
+        """Load a map from MAPS and start playing it"""
+        self.enter_level(map_id)
+        if self.remote is not None:
+            self.remote.start_level(map_id)
+        elif self.record_path:
+            self.recorder = InputRecorder(map_id, self.tick_dt, self.enemy_engine)  # Replaces the previous level's recording
+
+    def select_level(self, map_id):
+        """Highlight a level on the level select screen, it is only loaded once started"""
+        self.ui_manager.selected_level = map_id
+        print(f"Selected level: {map_id}")
+
+    def save_recording(self):
+        """Write the current input recording to record_path"""
+        if self.recorder is not None and self.record_path:
+            self.recorder.save(self.record_path)
+            print(f"Recording saved to {self.record_path}")
+
     def reset_game(self, screen):
         self.enemies.empty()
         self.projectiles.empty()
@@ -69,46 +152,69 @@ class Game:
                     self.reset_game(self.screen)
             elif event.key == pygame.K_RIGHT:
                 if self.state == "playing":
-                    self.speed_factor *= 2.0
+                    self.apply_command(('speed', min(self.speed_factor * 2.0, GAME_CONFIG["max_speed"])))
             elif event.key == pygame.K_LEFT:
                 if self.state == "playing":
-                    self.speed_factor /= 2.0
+                    self.apply_command(('speed', max(self.speed_factor / 2.0, GAME_CONFIG["min_speed"])))
+            elif event.key == pygame.K_F3:
+                self.perf.toggle()
+                self.dirty_rects.request_full()  # Erase the overlay when hiding it
+            elif event.key == pygame.K_F4:
+                if self.perf.enabled:
+                    self.perf.dump()
+            elif event.key == pygame.K_F5:
+                if self.state in ("playing", "paused"):
+                    if self.remote is not None:
+                        self.remote.send(('save', GAME_CONFIG["quicksave_path"]))  # The simulation prints it
+                    else:
+                        save_game(self, GAME_CONFIG["quicksave_path"])
+                        print(f"Game saved to {GAME_CONFIG['quicksave_path']}")
+            elif event.key == pygame.K_F9:
+                if os.path.exists(GAME_CONFIG["quicksave_path"]):
+                    if self.remote is not None:
+                        self.remote.load(GAME_CONFIG["quicksave_path"])  # Reported by sync once the simulation has it
+                    else:
+                        try:
+                            load_game(self, GAME_CONFIG["quicksave_path"])
+                            print(f"Game loaded from {GAME_CONFIG['quicksave_path']}")
+                        except ValueError as error:  # Not a save, or its map file is broken
+                            print(f"Could not load {GAME_CONFIG['quicksave_path']}: {error}")
             elif event.key == pygame.K_RETURN:
                 if self.state == "menu":
                     self.state = "level select"
                 elif self.state == "level select":
-                    self.current_map = MAPS[self.ui_manager.selected_level]
-                    self.init_game(self.screen)
-                    self.state = "playing"
-            elif event.key == pygame.K_1:
-                if self.state == "level select":
-                    self.ui_manager.selected_level = 'level_1'
-                    print(f"Selected level: {self.ui_manager.selected_level}")
-            elif event.key == pygame.K_2:
-                if self.state == "level select":
-                    self.ui_manager.selected_level = 'level_2'
-                    print(f"Selected level: {self.ui_manager.selected_level}")
+                    try:
+                        self.start_level(self.ui_manager.selected_level)
+                    except ValueError as error:  # Broken map file, it is marked in the list from now on
+                        print(error)
+            elif self.state == "level select" and event.key in (pygame.K_UP, pygame.K_DOWN):
+                # Step through every discovered map
+                levels = list(MAPS)
+                current = levels.index(self.ui_manager.selected_level) if self.ui_manager.selected_level in MAPS else 0
+                step = 1 if event.key == pygame.K_DOWN else -1
+                self.select_level(levels[(current + step) % len(levels)])
+            elif self.state == "level select" and pygame.K_1 <= event.key <= pygame.K_9:
+                levels = list(MAPS)
+                index = event.key - pygame.K_1
+                if index < len(levels):
+                    self.select_level(levels[index])
         elif event.type == pygame.MOUSEBUTTONDOWN:
             game_pos = self.translate_mouse_pos(event.pos)
             if self.state == "playing":
                 if event.button == 1: # left mouse click
-                    for i, rect in enumerate(self.current_map.get_tower_rects()):
-                        if rect.collidepoint(game_pos):
-                            if self.tower_manager._is_spot_occupied(rect):
-                                # Check for upgrade if tower exists here
-                                for tower in self.tower_manager.towers:
-                                    if tower.rect.collidepoint(game_pos):
-                                        if self.tower_manager.selected_upgrade_type:
-                                            if tower.element == self.tower_manager.selected_upgrade_type:
-                                                print("Tower already upgraded!")
-                                            else:
-                                                success = self.tower_manager.upgrade_tower(tower, self.tower_manager.selected_upgrade_type)
-                                                if success:
-                                                    print(f"Upgraded tower to {self.tower_manager.selected_upgrade_type}!")
-                                            break
-                                break  # Spot occupied, no placement
-                            self.tower_manager.place_tower(i, self.tower_manager.selected_tower_type)
-                            break
+                    spot = self.tower_manager.spot_at(game_pos)
+                    if spot is not None:
+                        tower = self.tower_at_spot(spot)
+                        if tower:
+                            # Upgrade the tower already on this spot, no placement
+                            upgrade_type = self.tower_manager.selected_upgrade_type
+                            if upgrade_type:
+                                if tower.element == upgrade_type:
+                                    print("Tower already upgraded!")
+                                elif self.apply_command(('upgrade', spot, upgrade_type)):
+                                    print(f"Upgraded tower to {upgrade_type}!")
+                        else:
+                            self.apply_command(('place', spot, self.tower_manager.selected_tower_type))
                     for name, rect in self.ui_manager.get_shop_towers().items():
                         if rect.collidepoint(event.pos):
                             if name.lower() in TOWER_CONFIG['type']:
@@ -121,42 +227,105 @@ class Game:
                                 break
                 elif event.button == 3:  # Right click
                     # Check if clicked on a tower
-                    for tower in self.tower_manager.towers:
-                        if tower.rect.collidepoint(game_pos):
-                            self.tower_manager.sell_tower(tower)
-                            break
+                    spot = self.tower_manager.spot_at(game_pos)
+                    if self.tower_at_spot(spot):
+                        self.apply_command(('sell', spot))
                 elif event.button == 2:  # Middle click/scroll wheel
                 # Change targeting mode
-                    for tower in self.tower_manager.towers:
-                        if tower.rect.collidepoint(game_pos):
-                            self.tower_manager.cycle_tower_targeting(tower)
-                            break
+                    spot = self.tower_manager.spot_at(game_pos)
+                    if self.tower_at_spot(spot):
+                        self.apply_command(('target', spot))
             ''' --- Alternate tower placement ---
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1: # left mouse click
                     self.place_tower_anywhere()
             '''
 
+    def apply_command(self, command):
+        """Apply a player command, returns whether it succeeded
+
+        Every input that changes the simulation goes through here, as
+        ('place', spot, tower_type), ('upgrade', spot, element), ('sell', spot),
+        ('target', spot) or ('speed', factor), so it can be recorded and replayed.
+        With a remote simulation the command is only sent there.
+        """
+        if self.remote is not None:
+            return self.remote.send(command)
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, command)
+        action, *args = command
+        if action == 'speed':
+            self.speed_factor = args[0]
+            return True
+        if action == 'place':
+            return self.tower_manager.place_tower(*args)
+
+        tower = self.tower_at_spot(args[0])
+        if tower is None:
+            return False
+        if action == 'upgrade':
+            return self.tower_manager.upgrade_tower(tower, args[1])
+        if action == 'sell':
+            self.tower_manager.sell_tower(tower)
+        elif action == 'target':
+            self.tower_manager.cycle_tower_targeting(tower)
+        return True
+
+    def tower_at_spot(self, spot):
+        """The tower built on a tower spot, or None"""
+        return self.tower_manager.tower_at(spot)
+
     def update(self, dt):
+        """Advance by a rendered frame of dt real seconds, in fixed sim ticks"""
+        if self.remote is not None:
+            self.remote.sync(self)  # The simulation process ticks, take its latest frame
+            return
+        if self.state != "playing":
+            return
+
+        # Fast-forward runs more ticks per frame, never longer ticks
+        self.tick_accumulator += dt * self.speed_factor
+        ticks = int(self.tick_accumulator / self.tick_dt)
+        if ticks > GAME_CONFIG["max_ticks_per_frame"]:
+            ticks = GAME_CONFIG["max_ticks_per_frame"]
+            self.tick_accumulator = ticks * self.tick_dt
+
+        for _ in range(ticks):
+            self.tick_accumulator -= self.tick_dt
+            self.tick()
+            if self.state != "playing":
+                break
+
+        self.render_alpha = min(max(self.tick_accumulator / self.tick_dt, 0.0), 1.0)
+
+    def tick(self):
+        """Run one fixed simulation step of tick_dt game seconds"""
         if self.state != "playing":
             return
-        
-        adjusted_dt = dt * self.speed_factor
 
         if self._check_victory():
             return
 
-        if self.state == "playing":
-            # Spawn logic
-            self.wave_manager.update(adjusted_dt, self.enemies)
+        dt = self.tick_dt
+        perf = self.perf
+        perf.start()
+        # Spawn logic
+        self.wave_manager.update(dt, self.enemies)
+        perf.lap('wave_manager.update')
 
-            self._update_enemies(adjusted_dt)
-            self.tower_manager.update(adjusted_dt)
-            self._update_projectiles(adjusted_dt)
+        self._update_enemies(dt)
+        perf.lap('_update_enemies')
+        self.tower_manager.update(dt)
+        perf.lap('tower_manager.update')
+        self._update_projectiles(dt)
+        perf.lap('_update_projectiles')
+        self.ticks += 1
+        if self.recorder is not None:
+            self.recorder.on_tick(self)
 
-            # Game-over check
-            if self.lives <= 0:
-                self.state = "game_over"
+        # Game-over check
+        if self.lives <= 0:
+            self.state = "game_over"
     
     def _check_victory(self):
         # Check for victory (all waves complete and no enemies left)
@@ -168,76 +337,154 @@ class Game:
         return False
     
     def _update_enemies(self, dt):
+        # Expire status effects and tick burns for all enemies at once
+        self.effect_store.update(dt)
+
+        if self.enemy_store is not None:
+            return self._update_stored_enemies(dt)
+
         # Update every enemy
         self.enemies.update(dt)
 
-        # Handle goal reached / cleanup
-        for enemy in list(self.enemies):
+        # Handle goal reached / cleanup, removing finished enemies in bulk
+        leaked = []
+        dead = []
+        for enemy in self.enemies:
             if enemy.reached_goal:
-                enemy.kill()  # Removes from all sprite groups
-                self.lives -= 1
+                leaked.append(enemy)
             elif enemy.is_dead():
-                enemy.kill()
-                self.money += enemy.get_value()
+                dead.append(enemy)
+        finished = leaked + dead
+        if finished:
+            self.enemies.remove(*finished)
+            self.collision_manager.remove_enemies(finished)
+            self.effect_store.remove_enemies(finished)
+            self.lives -= len(leaked)
+            self.enemies_leaked += len(leaked)
+            self.money += sum(enemy.get_value() for enemy in dead)
+            for enemy in dead:
+                self._credit_kill(enemy)
+
+            # Pooled enemies are reused by the next spawn, no tower may still be aiming at one
+            self.tower_manager.drop_targets(finished)
+            for enemy in finished:
+                self.enemy_pool.release(enemy)
+
+        self.collision_manager.sync_enemies()
+
+    def _update_stored_enemies(self, dt):
+        # Advance all enemies in one step, then remove finished ones in bulk
+        self.enemy_store.update(dt)
+        leaked, dead = self.enemy_store.remove_finished()
+        if leaked or dead:
+            self.tower_manager.drop_targets(leaked + dead)  # Their views go back to the store's pool
+        if leaked:
+            self.enemies.remove(*leaked)
+            self.collision_manager.remove_enemies(leaked)
+            self.effect_store.remove_enemies(leaked)
+            self.lives -= len(leaked)
+            self.enemies_leaked += len(leaked)
+        if dead:
+            self.enemies.remove(*dead)
+            self.collision_manager.remove_enemies(dead)
+            self.effect_store.remove_enemies(dead)
+            self.money += sum(enemy.get_value() for enemy in dead)
+            for enemy in dead:
+                self._credit_kill(enemy)
+        self.collision_manager.sync_enemies()
+
+    def pool_stats(self):
+        """Object pool statistics, keyed by pool name"""
+        pools = [self.enemy_pool, self.projectile_pool]
+        if self.enemy_store is not None:
+            pools.append(self.enemy_store.pool)
+        return {pool.name: pool.stats() for pool in pools}
+
+    def _credit_kill(self, enemy):
+        killer = enemy.killed_by or 'other'
+        self.kills_by_tower[killer] = self.kills_by_tower.get(killer, 0) + 1
+        self.enemies_killed += 1
 
     def _update_projectiles(self, dt):
         # Update projectiles
         self.projectiles.update(dt)
+        if self.chain_arcs:
+            for arc in self.chain_arcs:
+                arc[1] -= dt
+            self.chain_arcs = [arc for arc in self.chain_arcs if arc[1] > 0]
+
+        # Swept projectile vs enemy collisions through the enemy grid
+        hits = self.collision_manager.find_hits(self.projectiles)
 
-        # Convert enemies to sprite group if not already
-        enemy_sprites = pygame.sprite.Group(self.enemies)
-        
-        # Check projectile collisions with enemies
-        hits = pygame.sprite.groupcollide(
-            self.projectiles,           # Group 1: All projectiles
-            enemy_sprites,              # Group 2: All enemies
-            True,                       # Delete projectiles that hit
-            False,                      # Don't delete enemies that get hit
-            pygame.sprite.collide_rect  # Use rectangle collision
-        )
         # Handle hits and apply damage
         for projectile, enemies_hit in hits.items():
+            projectile.kill()  # Delete projectiles that hit
             impact_pos = pygame.math.Vector2(projectile.pos)
             #print(f"Projectile hit! Type: {type(projectile).__name__}")  # Debug print
 
             for enemy in enemies_hit:
-                enemy.take_damage(projectile.damage)
+                enemy.take_damage(projectile.damage, projectile.source)
                 if projectile.element:
-                    effect_data = ELEMENTAL_EFFECTS[projectile.element]
-                    if effect_data['type']:
-                        enemy.apply_effect({
-                            'type': effect_data['type'],
-                            'duration': effect_data['duration'],
-                            'damage_per_second': effect_data.get('damage_per_second', 0),
-                            'slow_pct': effect_data.get('slow_pct', 0)
-                        })
+                    self.effect_store.apply(enemy, projectile.element, projectile.source)
                 #print(f"Enemy hit! Enemy took {projectile.damage} damage! HP left: {enemy.hp}")
             
             if projectile.type == 'shell':  # Check for splash damage
-                #print(f"Processing Shell splash damage...")  # Debug print
-                # Check all enemies for splash damage
-                for enemy in self.enemies:
-                    if enemy not in enemies_hit:  # Skip directly hit enemies
-                        enemy_pos = pygame.math.Vector2(enemy.get_pos())  # Convert to Vector2
-                        distance_to_impact = enemy_pos.distance_to(impact_pos)
-                        #print(f"Checking enemy at distance {distance_to_impact}")  # Debug print
-                        if distance_to_impact <= projectile.splash_radius:  # Add explicit radius check
-                            splash_damage = projectile.get_splash_damage(distance_to_impact)
-                            #print(f"Splash damage calculated: {splash_damage}")  # Debug print
-                            if splash_damage > 0:
-                                #print(f"Applying splash damage: {splash_damage} at distance {distance_to_impact}")
-                                enemy.take_damage(splash_damage)
+                self._apply_splash_damage(projectile, impact_pos, enemies_hit)
+            if projectile.element and ELEMENTAL_EFFECTS[projectile.element].get('type') == 'chain':
+                self._apply_chain_damage(projectile, enemies_hit)
+
+    def _apply_chain_damage(self, projectile, enemies_hit):
+        """Jump from the enemy hit to the nearest unvisited enemy, losing damage per jump"""
+        storm = ELEMENTAL_EFFECTS[projectile.element]
+        visited = set(enemies_hit)
+        current = enemies_hit[0]
+        points = [(current.x, current.y)]
+        damage = projectile.damage
+        for _ in range(storm['max_jumps']):
+            # Each jump is a grid query around the current enemy, not a scan of all enemies
+            target = self.collision_manager.nearest_enemy(current.x, current.y, storm['chain_range'], visited)
+            if target is None:
+                break
+            damage *= 1 - storm['damage_reduction']
+            target.take_damage(int(damage), projectile.source)
+            visited.add(target)
+            current = target
+            points.append((current.x, current.y))
+        if len(points) > 1 and not self.headless:
+            self.chain_arcs.append([points, storm['arc_duration'], storm['color']])
+
+    def _apply_splash_damage(self, projectile, impact_pos, enemies_hit):
+        # Only enemies in grid cells near the impact are considered
+        candidates = [
+            enemy for enemy in self.collision_manager.enemies_near(impact_pos.x, impact_pos.y, projectile.splash_radius)
+            if enemy not in enemies_hit  # Skip directly hit enemies
+        ]
+        if not candidates:
+            return
+
+        # Compute every distance and falloff at once
+        xs = np.fromiter((enemy.x for enemy in candidates), np.float64, len(candidates))
+        ys = np.fromiter((enemy.y for enemy in candidates), np.float64, len(candidates))
+        distances = np.sqrt((xs - impact_pos.x) ** 2 + (ys - impact_pos.y) ** 2)
+        damages = projectile.get_splash_damages(distances)
+        for enemy, damage in zip(candidates, damages):
+            if damage > 0:
+                enemy.take_damage(int(damage), projectile.source)
 
     def draw(self):
-        # Clear screen
-        self.screen.fill(self.bg_color)
+        # Menus, overlays and state changes are always drawn in full
+        if self.state != "playing" or self.drawn_state != self.state:
+            self.dirty_rects.request_full()
+        self.drawn_state = self.state
+        full = self.dirty_rects.is_full()
 
-        # Draw game surface
-        self.game_surface.fill(self.bg_color)
+        # Clear screen
+        if full:
+            self.screen.fill(self.bg_color)
         
         # Draw based on current state
         if self.state == "playing":
-            self.draw_playing()
+            self.draw_playing(full)
         elif self.state == "paused":
             self.draw_playing()
             self.ui_manager.draw_paused()
@@ -248,27 +495,67 @@ class Game:
         elif self.state == "menu":
             self.ui_manager.draw_menu()
         elif self.state == "level select":
-            self.ui_manager.draw_level_select(MAPS)
+            self.ui_manager.draw_level_select(list(MAPS), MAPS.broken)
+
+        # Performance overlay on top of everything
+        perf_rect = self.perf.draw(self.screen)
+        if perf_rect:
+            self.dirty_rects.add(perf_rect)
+        if self.remote is not None:
+            self.remote.release()
+
+    def present(self):
+        """Show the drawn frame: only its dirty regions, or a full flip"""
+        self.perf.start()
+        full = self.dirty_rects.present()
+        self.perf.lap('display.flip')
+        return full
     
-    def draw_playing(self):
-        self.ui_manager.draw()
-        self.current_map.draw_path(self.game_surface)
-        self.current_map.draw_tower_spots(self.game_surface)
-        self.tower_manager.draw(self.game_surface, self.translate_mouse_pos(pygame.mouse.get_pos()))
-        self._draw_enemies(self.game_surface)
-        self.current_map.draw_spawn_point(self.game_surface)
-        self.current_map.draw_end_point(self.game_surface)
-        self.projectiles.draw(self.game_surface)
+    def draw_playing(self, full=True):
+        perf = self.perf
+        perf.start()
+        if full:
+            self.ui_manager.draw()
+        else:
+            self.ui_manager.draw_changed()
+        perf.lap('UIManager.draw')
+
+        # Path, tower spots and spawn/end markers come pre-rendered in one blit
+        self.game_surface.blit(self.current_map.get_static_layer(self.game_surface.get_size(), self.bg_color), (0, 0))
+        perf.lap('draw.map')
+        mouse_pos = self.translate_mouse_pos(pygame.mouse.get_pos())
+        tower_rects = self.tower_manager.draw(self.game_surface, mouse_pos)
+        perf.lap('draw.towers')
+        enemy_rects = self._draw_enemies(self.game_surface)
+        perf.lap('draw.enemies')
+        projectile_rects = self._draw_projectiles(self.game_surface)
+        projectile_rects += self._draw_chain_arcs(self.game_surface)
+        perf.lap('draw.projectiles')
 
         x = (self.screen_width - GAME_WIDTH) // 2
         y = (self.screen_height - GAME_HEIGHT) // 2
         
-        # Draw game surface to screen
-        self.screen.blit(self.game_surface, (x, y))
-        
         # Store viewport position for coordinate translation
         self.viewport = [x, y]
 
+        if full:
+            # Draw game surface to screen
+            self.screen.blit(self.game_surface, (x, y))
+            perf.lap('draw.compose')
+            return
+
+        # Copy only what changed this frame or last frame (to erase old positions)
+        dirty = self.dirty_rects
+        dirty.add_all(tower_rects, (x, y))
+        dirty.add_all(enemy_rects, (x, y))
+        dirty.add_all(projectile_rects, (x, y))
+        game_area = pygame.Rect(x, y, GAME_WIDTH, GAME_HEIGHT)
+        for rect in dirty.prev_rects + dirty.rects:
+            area = rect.clip(game_area)
+            if area.width and area.height:
+                self.screen.blit(self.game_surface, area, area.move(-x, -y))
+        perf.lap('draw.compose')
+
     def load_map(self, map_id):
         """Change to a different map"""
         if map_id in MAPS:
@@ -277,8 +564,24 @@ class Game:
             self.reset_game()
 
     def _draw_enemies(self, surface):
-        for enemy in self.enemies:
-            enemy.draw(surface)
+        if self.remote is not None:
+            return self.remote.draw_enemies(surface, self.render_alpha)
+        # Every enemy sprite and health bar in one blits call from the shared atlas
+        blits = get_enemy_atlas().blit_list(self.enemies, self.render_alpha)
+        return surface.blits(blits)
+
+    def _draw_projectiles(self, surface):
+        if self.remote is not None:
+            return self.remote.draw_projectiles(surface, self.render_alpha)
+        # Interpolate between the last two sim positions
+        alpha = self.render_alpha
+        for projectile in self.projectiles:
+            projectile.rect.center = projectile.prev_pos.lerp(projectile.pos, alpha)
+        self.projectiles.draw(surface)
+        return list(self.projectiles.spritedict.values())  # Rects blitted by Group.draw
+
+    def _draw_chain_arcs(self, surface):
+        return [pygame.draw.lines(surface, color, False, points, 2) for points, _, color in self.chain_arcs]
 
     def translate_mouse_pos(self, screen_pos):
         """Convert screen coordinates to game surface coordinates"""
@@ -0,0 +1,105 @@
+import numpy as np
+from ..config.enemy_config import ENEMY_CONFIG
+from ..config.game_config import GAME_CONFIG
+from ..config.ui_config import GAME_HEIGHT, GAME_WIDTH
+from ..sim.spatial_grid import SpatialGrid
+
+class CollisionManager:
+    """Keeps the enemy grid in sync and resolves projectile hits with swept tests"""
+    def __init__(self, game):
+        self.game = game
+        self.grid = SpatialGrid(GAME_CONFIG['spatial_cell_size'], GAME_WIDTH, GAME_HEIGHT)
+        self.max_enemy_radius = max(stats['radius'] for stats in ENEMY_CONFIG['types'].values())
+
+    def sync_enemies(self):
+        """Insert new enemies and move the ones that changed cell"""
+        grid = self.grid
+        store = self.game.enemy_store
+        if store is not None:
+            n = store.count
+            keys = grid.keys_for(store.x[:n], store.y[:n])
+            for slot in np.flatnonzero(keys != store.grid_key[:n]):
+                grid.move(store.enemies[slot], int(keys[slot]))
+            store.grid_key[:n] = keys
+            return
+
+        item_keys = grid.item_keys
+        for enemy in self.game.enemies:
+            key = grid.key_for(enemy.x, enemy.y)
+            if item_keys.get(enemy) != key:
+                grid.move(enemy, key)
+
+    def remove_enemies(self, enemies):
+        for enemy in enemies:
+            self.grid.remove(enemy)
+
+    def enemies_near(self, x, y, radius):
+        """Enemies whose centers may lie within radius of (x, y)"""
+        return self.grid.query_radius(x, y, radius)
+
+    def nearest_enemy(self, x, y, radius, exclude=()):
+        """Closest live enemy whose center is within radius of (x, y), skipping exclude"""
+        best = None
+        best_dist_sq = radius * radius
+        for enemy in self.grid.query_radius(x, y, radius):
+            if enemy.hp <= 0 or enemy in exclude:
+                continue
+            dist_sq = (enemy.x - x) ** 2 + (enemy.y - y) ** 2
+            if dist_sq < best_dist_sq or (best is None and dist_sq == best_dist_sq):
+                best = enemy
+                best_dist_sq = dist_sq
+        return best
+
+    def find_hits(self, projectiles):
+        """Map each projectile to the first live enemy its last step passed through
+
+        Each projectile is swept from its previous to its current position and
+        tested against circles of enemy radius plus projectile radius, so fast
+        projectiles cannot tunnel through small enemies.  The projectile's pos
+        is moved back to the point of impact.
+        """
+        hits = {}
+        margin = self.max_enemy_radius
+        for projectile in projectiles:
+            ax, ay = projectile.prev_pos
+            bx, by = projectile.pos
+            reach = margin + projectile.hit_radius
+            candidates = self.grid.query_rect(
+                min(ax, bx) - reach, min(ay, by) - reach,
+                max(ax, bx) + reach, max(ay, by) + reach
+            )
+            if not candidates:
+                continue
+
+            dx = bx - ax
+            dy = by - ay
+            seg_len_sq = dx * dx + dy * dy
+            best_t = 2.0
+            best_enemy = None
+            for enemy in candidates:
+                if enemy.hp <= 0:
+                    continue
+                r = enemy.radius + projectile.hit_radius
+                fx = ax - enemy.x
+                fy = ay - enemy.y
+                c = fx * fx + fy * fy - r * r
+                if c <= 0:
+                    t = 0.0  # Step started inside the enemy
+                elif seg_len_sq == 0:
+                    continue
+                else:
+                    b = fx * dx + fy * dy
+                    disc = b * b - seg_len_sq * c
+                    if b >= 0 or disc < 0:
+                        continue  # Moving away, or the line misses the circle
+                    t = (-b - disc ** 0.5) / seg_len_sq
+                    if t > 1.0:
+                        continue
+                if t < best_t:
+                    best_t = t
+                    best_enemy = enemy
+
+            if best_enemy is not None:
+                projectile.pos.update(ax + dx * best_t, ay + dy * best_t)
+                hits[projectile] = [best_enemy]
+        return hits
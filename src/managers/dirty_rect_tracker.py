@@ -0,0 +1,51 @@
+import pygame
+
+class DirtyRectTracker:
+    """Collects the screen regions that changed this frame and presents only those
+
+    Regions drawn last frame are presented again so whatever moved away from
+    them is erased.  When too much of the screen is dirty, or a full redraw was
+    requested, the whole frame is flipped instead.
+    """
+    def __init__(self, screen_size, max_area_pct=0.4, enabled=True):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.max_area = screen_size[0] * screen_size[1] * max_area_pct
+        self.enabled = enabled
+        self.rects = []       # Screen rects changed this frame
+        self.prev_rects = []  # Screen rects changed last frame
+        self.full = True      # Next frame must be drawn and presented in full
+
+    def request_full(self):
+        """Redraw and present the whole screen next frame"""
+        self.full = True
+
+    def is_full(self):
+        return self.full or not self.enabled
+
+    def add(self, rect, offset=(0, 0)):
+        """Mark a region dirty, offset translates it into screen coordinates"""
+        if rect.width and rect.height:
+            self.rects.append(rect.move(offset))
+
+    def add_all(self, rects, offset=(0, 0)):
+        for rect in rects:
+            self.add(rect, offset)
+
+    def present(self):
+        """Push this frame to the display, returns True if it was a full flip"""
+        full = self.is_full()
+        if not full:
+            rects = [rect.clip(self.screen_rect) for rect in self.prev_rects + self.rects]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if sum(rect.width * rect.height for rect in rects) > self.max_area:
+                full = True  # Cheaper to push the whole frame
+
+        if full:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+        self.prev_rects = self.rects
+        self.rects = []
+        self.full = False
+        return full
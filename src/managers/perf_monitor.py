@@ -0,0 +1,159 @@
+import json
+import time
+from collections import deque
+import numpy as np
+import pygame
+from ..config.ui_config import Colors, FPS, UI_CONFIG, UI_POSITIONS
+from .resource_manager import RESOURCES
+
+# Phases shown in the overlay, in frame order
+SIM_PHASES = ('wave_manager.update', '_update_enemies', 'tower_manager.update', '_update_projectiles')
+DRAW_PHASES = ('UIManager.draw', 'draw.map', 'draw.towers', 'draw.enemies', 'draw.projectiles', 'draw.compose')
+PHASES = SIM_PHASES + DRAW_PHASES + ('display.flip',)
+
+GRAPH_WIDTH = 240
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 50.0  # Frame time at the top of the graph
+
+
+class PerfMonitor:
+    """Per-frame phase timings and entity counts behind a toggleable overlay
+
+    Hooks stay in the game loop permanently: start() and lap() return
+    immediately while the monitor is disabled.
+    """
+    def __init__(self, history_seconds=10):
+        self.enabled = False
+        self.history = deque(maxlen=history_seconds * FPS)  # (time, frame_ms, phases, counts) per frame
+        self.phases = dict.fromkeys(PHASES, 0.0)  # Seconds spent per phase this frame
+        self._last = 0.0
+        self._frame_start = None
+        self.overlay = None
+        self.overlay_time = 0.0
+        self.font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.history.clear()
+        self._frame_start = None
+        self.overlay = None
+        print(f"Performance HUD {'on' if self.enabled else 'off'}")
+
+    def start(self):
+        """Begin timing a run of phases"""
+        if not self.enabled:
+            return
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous start()/lap() to phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self, game):
+        """Close the frame: record its duration, phase timings and entity counts"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            counts = (len(game.enemies), len(game.projectiles), len(game.tower_manager.towers))
+            self.history.append((now, (now - self._frame_start) * 1000, self.phases, counts))
+        self._frame_start = now
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+    def percentiles(self, frames=None):
+        """Frame time percentiles (ms) over the recorded history"""
+        frames = self.history if frames is None else frames
+        if not frames:
+            return {}
+        frame_ms = np.fromiter((frame[1] for frame in frames), np.float64, len(frames))
+        p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+        return {'p50': p50, 'p95': p95, 'p99': p99, 'max': frame_ms.max()}
+
+    def dump(self, seconds=None, path=None):
+        """Write the last seconds of frames to a JSON file, returns its path"""
+        seconds = seconds or UI_CONFIG['perf_dump_seconds']
+        path = path or time.strftime('perf_%Y%m%d_%H%M%S.json')
+        frames = list(self.history)
+        if frames:
+            cutoff = frames[-1][0] - seconds
+            frames = [frame for frame in frames if frame[0] >= cutoff]
+        start = frames[0][0] if frames else 0.0
+        report = {
+            'seconds': seconds,
+            'frames': len(frames),
+            'percentiles_ms': self.percentiles(frames),
+            'timeline': [
+                {
+                    'time': round(t - start, 6),
+                    'frame_ms': round(frame_ms, 3),
+                    'phases_ms': {phase: round(value * 1000, 3) for phase, value in phases.items() if value},
+                    'enemies': counts[0],
+                    'projectiles': counts[1],
+                    'towers': counts[2],
+                }
+                for t, frame_ms, phases, counts in frames
+            ],
+        }
+        with open(path, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Performance dump written to {path}")
+        return path
+
+    def draw(self, screen):
+        """Draw the overlay, returns the screen rect it covers (or None when disabled)"""
+        if not self.enabled:
+            return None
+        # Text and graph are re-rendered a few times a second, blitted every frame
+        now = time.perf_counter()
+        if self.overlay is None or now - self.overlay_time >= UI_CONFIG['perf_refresh_interval']:
+            self.overlay = self._render()
+            self.overlay_time = now
+        return screen.blit(self.overlay, UI_POSITIONS['perf_hud'])
+
+    def _render(self):
+        if self.font is None:
+            self.font = RESOURCES.get_font(None, UI_CONFIG['font_size_small'])
+        frames = list(self.history)
+        lines = []  # (label, right-aligned value)
+        if frames:
+            recent = frames[-FPS:]  # Phase averages over the last second
+            stats = self.percentiles()
+            _, frame_ms, _, (enemies, projectiles, towers) = frames[-1]
+            lines.append(("frame", f"{frame_ms:.1f} ms"))
+            lines.append(("p50 / p95 / p99", f"{stats['p50']:.1f} / {stats['p95']:.1f} / {stats['p99']:.1f} ms"))
+            lines.append(("enemies / projectiles / towers", f"{enemies} / {projectiles} / {towers}"))
+            for phase in PHASES:
+                average = sum(frame[2][phase] for frame in recent) / len(recent) * 1000
+                lines.append((phase, f"{average:.2f} ms"))
+        else:
+            lines.append(("collecting...", ""))
+
+        line_height = self.font.get_linesize()
+        width = GRAPH_WIDTH + 20
+        height = GRAPH_HEIGHT + 20 + line_height * len(lines)
+        surface = pygame.Surface((width, height))
+        surface.fill(Colors.BLACK)
+        pygame.draw.rect(surface, Colors.GRAY, surface.get_rect(), 1)
+
+        # Rolling frame-time graph, one column per frame, with 60 and 30 fps guides
+        graph = pygame.Rect(10, 10, GRAPH_WIDTH, GRAPH_HEIGHT)
+        for target_ms in (1000 / 60, 1000 / 30):
+            y = graph.bottom - int(min(target_ms / GRAPH_MAX_MS, 1.0) * GRAPH_HEIGHT)
+            pygame.draw.line(surface, Colors.DARK_GREEN, (graph.left, y), (graph.right, y))
+        for i, frame in enumerate(frames[-GRAPH_WIDTH:]):
+            frame_ms = frame[1]
+            bar = int(min(frame_ms / GRAPH_MAX_MS, 1.0) * GRAPH_HEIGHT)
+            color = Colors.GREEN if frame_ms <= 1000 / 55 else Colors.YELLOW if frame_ms <= 1000 / 30 else Colors.RED
+            pygame.draw.line(surface, color, (graph.left + i, graph.bottom), (graph.left + i, graph.bottom - bar))
+
+        y = graph.bottom + 10
+        for label, value in lines:
+            surface.blit(self.font.render(label, True, Colors.WHITE), (10, y))
+            value_text = self.font.render(value, True, Colors.WHITE)
+            surface.blit(value_text, (width - 10 - value_text.get_width(), y))
+            y += line_height
+        return surface
@@ -0,0 +1,35 @@
+import pygame
+from ..config.ui_config import UI_CONFIG
+from .text_cache import TextCache
+
+class ResourceManager:
+    """Process-wide registry of fonts and shared surfaces, each loaded once on first use"""
+    def __init__(self):
+        self.fonts = {}     # (name, size) -> Font
+        self.surfaces = {}  # key -> Surface
+        self.text_cache = TextCache(UI_CONFIG["text_cache_size"])
+
+    def get_font(self, name, size):
+        """Shared font handle, name None is pygame's default font (no system font scan)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def get_surface(self, key, factory):
+        """Shared surface (or surface-backed object) for key, built by factory() on first use"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = factory()
+            self.surfaces[key] = surface
+        return surface
+
+    def render_text(self, font, text, color):
+        return self.text_cache.render(font, text, color)
+
+# Shared registry instance
+RESOURCES = ResourceManager()
@@ -0,0 +1,69 @@
+import numpy as np
+from ..config.tower_config import TOWER_CONFIG
+
+class TargetingManager:
+    """Picks targets for every tower at once from a tower x enemy distance matrix"""
+    def __init__(self, game):
+        self.game = game
+        self.modes = TOWER_CONFIG['targeting_modes']
+        self.mode_index = {mode: i for i, mode in enumerate(self.modes)}
+
+    def update(self, towers):
+        """Assign a target (or None) to each tower in one batched pass"""
+        if not towers:
+            return
+        enemies, ex, ey, radius, hp, flying, goal_distance = self._enemy_arrays()
+        if not enemies:
+            for tower in towers:
+                tower.set_target(None)
+            return
+
+        # Tower state, read once per tick
+        tx = np.fromiter((tower.x for tower in towers), np.float64, len(towers))
+        ty = np.fromiter((tower.y for tower in towers), np.float64, len(towers))
+        tower_range = np.fromiter((tower.range for tower in towers), np.float64, len(towers))
+        can_fly = np.fromiter((tower.can_target_flying for tower in towers), np.bool_, len(towers))
+        can_ground = np.fromiter((tower.can_target_ground for tower in towers), np.bool_, len(towers))
+        mode = np.fromiter((self.mode_index[tower.targeting_mode] for tower in towers), np.int64, len(towers))
+
+        # Squared distances and eligibility, shape (towers, enemies)
+        dx = ex[None, :] - tx[:, None]
+        dy = ey[None, :] - ty[:, None]
+        dist_sq = dx * dx + dy * dy
+        reach = tower_range[:, None] + radius[None, :]
+        eligible = dist_sq < reach * reach
+        eligible &= np.where(flying[None, :], can_fly[:, None], can_ground[:, None])
+
+        # Per-mode sort key, smaller is better ('first' is closest to a goal)
+        keys = np.empty_like(dist_sq)
+        keys[mode == self.mode_index['first']] = goal_distance
+        keys[mode == self.mode_index['last']] = -goal_distance
+        keys[mode == self.mode_index['strongest']] = -hp
+        keys[mode == self.mode_index['weakest']] = hp
+        closest = mode == self.mode_index['closest']
+        keys[closest] = dist_sq[closest]
+
+        keys[~eligible] = np.inf
+        best = np.argmin(keys, axis=1)
+        found = eligible[np.arange(len(towers)), best]
+
+        for i, tower in enumerate(towers):
+            tower.set_target(enemies[best[i]] if found[i] else None)
+
+    def _enemy_arrays(self):
+        """Enemy list plus position, radius, hp, flying and distance-to-goal arrays"""
+        store = self.game.enemy_store
+        if store is not None:
+            n = store.count
+            return (store.enemies[:n], store.x[:n], store.y[:n], store.radius[:n],
+                    store.hp[:n], store.flying[:n], store.goal_distance[:n])
+
+        enemies = list(self.game.enemies)
+        n = len(enemies)
+        ex = np.fromiter((enemy.x for enemy in enemies), np.float64, n)
+        ey = np.fromiter((enemy.y for enemy in enemies), np.float64, n)
+        radius = np.fromiter((enemy.radius for enemy in enemies), np.float64, n)
+        hp = np.fromiter((enemy.hp for enemy in enemies), np.float64, n)
+        flying = np.fromiter((enemy.flying for enemy in enemies), np.bool_, n)
+        goal_distance = np.fromiter((enemy.goal_distance for enemy in enemies), np.float64, n)
+        return enemies, ex, ey, radius, hp, flying, goal_distance
@@ -0,0 +1,27 @@
+from collections import OrderedDict
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces keyed by (font, text, color)"""
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Evict least recently used
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
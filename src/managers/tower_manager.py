@@ -1,6 +1,8 @@
 import pygame
 from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
 from ..entities.tower import Tower
+from .targeting_manager import TargetingManager
+from .resource_manager import RESOURCES
 
 class TowerManager:
     def __init__(self, game):
@@ -8,22 +10,76 @@ class TowerManager:
         self.towers = []
         self.selected_tower_type = 'basic'
         self.selected_upgrade_type = None  # 'pyro', 'glacier', 'storm'
+        self.targeting = TargetingManager(game)
+        self.changed_rects = []   # Tower spots placed, sold or upgraded since the last draw
+        self.spot_towers = {}     # Spot index -> tower built on it
+        self.hovered_tower = None
+
+        # Spot index: grid cell -> spot indices whose rect overlaps that cell, so a point
+        # lookup only tests the few spots around it
+        self.spot_cell_size = TOWER_CONFIG['size']
+        self.spot_cells = {}
+        for spot, rect in enumerate(game.current_map.get_tower_rects()):
+            for cx in range(rect.left // self.spot_cell_size, (rect.right - 1) // self.spot_cell_size + 1):
+                for cy in range(rect.top // self.spot_cell_size, (rect.bottom - 1) // self.spot_cell_size + 1):
+                    self.spot_cells.setdefault((cx, cy), []).append(spot)
 
     def update(self, dt):
         """Update all towers and handle targeting"""
         for tower in self.towers: # Update each tower
             tower.update(dt)
-            self._get_tower_target(tower)
+        self.targeting.update(self.towers) # Retarget all towers in one pass
 
     def draw(self, screen, mouse_pos):
-        """Draw towers and range previews"""
+        """Draw towers and range previews, returns the rects that may have changed"""
         #mouse_pos = pygame.mouse.get_pos()
+        dirty = self.changed_rects
+        self.changed_rects = []
         if self.game.state == 'playing':
-            self._draw_tower_range_preview(screen, mouse_pos)
+            preview = self._draw_tower_range_preview(screen, mouse_pos)
+            if preview:
+                dirty.append(preview)
         
+        # Only the tower under the mouse and the one it just left change hover state
+        hovered = self.spot_towers.get(self.spot_at(mouse_pos))
+        if hovered is not self.hovered_tower:
+            if self.hovered_tower is not None:
+                self.hovered_tower.is_hovered = False
+            if hovered is not None:
+                hovered.is_hovered = True
+            self.hovered_tower = hovered
+
+        for tower in self.towers:
+            drawn = tower.draw(screen)
+            if tower.is_hovered:
+                dirty.append(drawn)
+        return dirty
+
+    def drop_targets(self, enemies):
+        """Forget targets that left the game, before their objects are recycled for new spawns"""
+        gone = set(enemies)
         for tower in self.towers:
-            tower.update_hover(mouse_pos)
-            tower.draw(screen)
+            if tower.target in gone:
+                tower.target = None
+
+    def spot_at(self, pos):
+        """Index of the tower spot containing a point, or None"""
+        x, y = pos
+        cell = self.spot_cells.get((int(x // self.spot_cell_size), int(y // self.spot_cell_size)))
+        if cell:
+            rects = self.game.current_map.get_tower_rects()
+            for spot in cell:
+                if rects[spot].collidepoint(pos):
+                    return spot
+        return None
+
+    def tower_at(self, spot):
+        """The tower built on a tower spot, or None"""
+        return self.spot_towers.get(spot)
+
+    def _mark_changed(self, tower):
+        if not self.game.headless:
+            self.changed_rects.append(pygame.Rect(tower.rect))
 
     def place_tower(self, spot_index, tower_type='basic'):
         """Place a new tower if possible"""
@@ -31,11 +87,8 @@ class TowerManager:
         if spot_index >= len(self.game.current_map.get_tower_points()):
             return False
 
-        # Get tower spot rect
-        spot_rect = self.game.current_map.get_tower_rects()[spot_index]
-        
         # Check if spot is occupied
-        if self._is_spot_occupied(spot_rect):
+        if self._is_spot_occupied(spot_index):
             print("Spot already occupied!")
             return False
 
@@ -44,29 +97,46 @@ class TowerManager:
             print("Insufficient money!")
             return False
 
-        x, y, width, height = self.game.current_map.get_tower_points()[spot_index]
-        tower_x = x + width // 2
-        tower_y = y + height // 2
-        
         # Create and place tower
-        new_tower = Tower(tower_x, tower_y, spot_rect, tower_type)
-        new_tower.game = self.game
-        self.towers.append(new_tower)
+        new_tower = self.add_tower(spot_index, tower_type)
         
         # Deduct cost
         self.game.money -= new_tower.get_cost()
         print(f"Placed tower at spot {spot_index}. Money left: {self.game.money}")
         return True
 
+    def add_tower(self, spot_index, tower_type):
+        """Build a tower on a spot without any checks or cost, returns it"""
+        spot_rect = self.game.current_map.get_tower_rects()[spot_index]
+        x, y, width, height = self.game.current_map.get_tower_points()[spot_index]
+        tower_x = x + width // 2
+        tower_y = y + height // 2
+
+        new_tower = Tower(tower_x, tower_y, spot_rect, tower_type)
+        new_tower.game = self.game
+        new_tower.spot = spot_index
+        self.towers.append(new_tower)
+        self.spot_towers[spot_index] = new_tower
+        self._mark_changed(new_tower)
+        return new_tower
+
     def sell_tower(self, tower):
         """Sell an existing tower"""
         if tower in self.towers:
             self.game.money += tower.get_sell_value()
-            self.towers.remove(tower)
-            tower.sell()
+            self.remove_tower(tower)
             print(f"Sold tower. Money now: {self.game.money}")
         else:
             print("Tower not found!")
+
+    def remove_tower(self, tower):
+        """Take a tower off its spot without any refund"""
+        self.towers.remove(tower)
+        del self.spot_towers[tower.spot]
+        if tower is self.hovered_tower:
+            self.hovered_tower = None
+        self._mark_changed(tower)
+        tower.sell()
     
     def upgrade_tower(self, tower, element_type):
         """Upgrade a tower with an elemental type"""
@@ -89,112 +159,35 @@ class TowerManager:
         
         # Apply upgrade
         tower.upgrade(element_type)
+        self._mark_changed(tower)
         self.game.money -= upgrade_cost
         print(f"Upgraded tower to {element_type}. Money left: {self.game.money}")
         return True
 
-    def _get_tower_target(self, tower):
-        enemies_list = list(self.game.enemies)
-        if tower.targeting_mode == 'first':
-                for enemy in enemies_list:
-                    if enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_flying', False) is False:
-                        continue
-                    if not enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_ground', False) is False:
-                        continue
-                    if tower.detect_enemy(enemy.get_pos(), enemy.get_size()): # Detects first enemy in range
-                        if not tower.get_target(): # Assign target if none
-                            tower.set_target(enemy)
-                    else:
-                        if tower.get_target() == enemy: # Clear target if out of range
-                            tower.set_target(None)
-        elif tower.targeting_mode == 'last':
-            for enemy in reversed(enemies_list):
-                if enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_flying', False) is False:
-                        continue
-                if not enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_ground', False) is False:
-                        continue
-                if tower.detect_enemy(enemy.get_pos(), enemy.get_size()):
-                    if not tower.get_target():
-                        tower.set_target(enemy)
-                else:
-                    if tower.get_target() == enemy:
-                        tower.set_target(None)
-        elif tower.targeting_mode == 'strongest':
-            strongest_enemy = None
-            max_hp = -1
-            for enemy in enemies_list:
-                if enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_flying', False) is False:
-                        continue
-                if not enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_ground', False) is False:
-                        continue
-                if tower.detect_enemy(enemy.get_pos(), enemy.get_size()):
-                    if enemy.hp > max_hp:
-                        max_hp = enemy.hp
-                        strongest_enemy = enemy
-            tower.set_target(strongest_enemy)
-        elif tower.targeting_mode == 'weakest':
-            weakest_enemy = None
-            min_hp = float('inf')
-            for enemy in enemies_list:
-                if enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_flying', False) is False:
-                        continue
-                if not enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_ground', False) is False:
-                        continue
-                if tower.detect_enemy(enemy.get_pos(), enemy.get_size()):
-                    if enemy.hp < min_hp:
-                        min_hp = enemy.hp
-                        weakest_enemy = enemy
-            tower.set_target(weakest_enemy)
-        elif tower.targeting_mode == 'closest':
-            closest_enemy = None
-            min_dist = float('inf')
-            for enemy in self.game.enemies:
-                if enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_flying', False) is False:
-                        continue
-                if not enemy.flying and TOWER_CONFIG['type'][tower.type].get('can_target_ground', False) is False:
-                        continue
-                if tower.detect_enemy(enemy.get_pos(), enemy.get_size()):
-                    dist = pygame.math.Vector2((tower.x, tower.y)).distance_to(pygame.math.Vector2(enemy.get_pos()))
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_enemy = enemy
-            tower.set_target(closest_enemy)
-
-    def _is_spot_occupied(self, spot_rect):
+    def _is_spot_occupied(self, spot_index):
         """Check if a tower spot is already occupied"""
-        return any(spot_rect.collidepoint(tower.x, tower.y) for tower in self.towers)
-        
+        return spot_index in self.spot_towers
 
     def _draw_tower_range_preview(self, screen, mouse_pos):
-        """Draw range preview when hovering over tower spots"""
-        for rect in self.game.current_map.get_tower_rects():
-            if rect.collidepoint(mouse_pos) and not self._is_spot_occupied(rect):
-                tower_config = TOWER_CONFIG['type'][self.selected_tower_type]
-                x, y = rect.center
-                
-                # Draw range circle outline
-                pygame.draw.circle(
-                    screen,                 # Surface
-                    tower_config['color'],  # Color
-                    (x, y),                 # Center
-                    tower_config['range'],  # Radius
-                    1                       # Width (1 for outline)
-                )
-                
-                # Draw semi-transparent fill
-                range_surface = pygame.Surface(
-                    (screen.get_width(), screen.get_height()), 
-                    pygame.SRCALPHA
-                )
-                pygame.draw.circle(
-                    range_surface,
-                    (*tower_config['color'], 30),
-                    (x, y),
-                    tower_config['range']
-                )
-                screen.blit(range_surface, (0, 0))
-                break
+        """Draw range preview when hovering over tower spots, returns the rect drawn"""
+        spot = self.spot_at(mouse_pos)
+        if spot is None or self._is_spot_occupied(spot):
+            return None
+        tower_config = TOWER_CONFIG['type'][self.selected_tower_type]
+        x, y = self.game.current_map.get_tower_rects()[spot].center
+        radius = tower_config['range']
+        overlay = self._get_range_overlay(radius, tower_config['color'])
+        return screen.blit(overlay, (x - radius, y - radius))
     
+    def _get_range_overlay(self, radius, color):
+        """Semi-transparent range circle with outline, rendered once per range and color"""
+        def render():
+            overlay = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(overlay, (*color, 30), (radius, radius), radius)  # Fill
+            pygame.draw.circle(overlay, color, (radius, radius), radius, 1)      # Outline
+            return overlay
+        return RESOURCES.get_surface(('range_overlay', radius, tuple(color)), render)
+
     def cycle_tower_targeting(self, tower):
         """Cycle through available targeting modes"""
         modes = ['first', 'last', 'strongest', 'weakest', 'closest']
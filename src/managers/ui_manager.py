@@ -1,6 +1,7 @@
 import pygame
 from ..config.ui_config import Colors, UI_CONFIG, UI_POSITIONS
 from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+from .resource_manager import RESOURCES
 
 class UIManager:
     def __init__(self, game, screen, wave_manager):
@@ -13,18 +14,36 @@ class UIManager:
         
         self.shop_towers = {}  # Dict with (name, rect) for tower shop options
 
-        # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 60)
-        self.large_font = pygame.font.Font(None, UI_CONFIG["font_size_large"])
-        self.medium_font = pygame.font.SysFont('Arial', UI_CONFIG["font_size_medium"])
-        self.small_font = pygame.font.SysFont('Arial', UI_CONFIG["font_size_small"])
+        # Fonts are shared and only loaded once per process
+        self.title_font = RESOURCES.get_font('Arial', 60)
+        self.large_font = RESOURCES.get_font(None, UI_CONFIG["font_size_large"])
+        self.medium_font = RESOURCES.get_font('Arial', UI_CONFIG["font_size_medium"])
+        self.small_font = RESOURCES.get_font('Arial', UI_CONFIG["font_size_small"])
         
         # Colors
         self.bg_color = UI_CONFIG["bg_color"]
         self.text_color = UI_CONFIG["text_color"]
+
+        # Render caches
+        self.text_cache = RESOURCES.text_cache  # Survives UIManager rebuilds between levels
+        self.hud_values = {}    # HUD region -> value it was last rendered with
+        self.hud_surfaces = {}  # HUD region -> rendered text
+        self.hud_rects = {}     # HUD region -> screen rect it was last blitted to
+        self.incremental = False  # Only redraw HUD regions that changed (screen was not cleared)
+        self.shop_surface = None  # Tower and upgrade shops, rendered once
+        self.shop_origin = UI_POSITIONS['tower_shop']
+        self._shop_target = None
+        self.pause_overlay = None
     
+    def draw_changed(self):
+        """Redraw only the HUD regions whose values changed, on an uncleared screen"""
+        self.incremental = True
+        self._draw_ui_stats()
+        self._draw_wave_info()
+
     def draw(self):
+        self.incremental = False
+
         # Draw game world elements
         self._draw_game_world()
         
@@ -37,31 +56,83 @@ class UIManager:
         # Draw tower shop
         self._draw_tower_shop()
 
+    def _text(self, font, text, color):
+        """Rendered text surface from the LRU text cache"""
+        return self.text_cache.render(font, text, color)
+
+    def _draw_hud_region(self, region, value, render, pos):
+        """Blit a HUD region, re-rendering it only when its value changed"""
+        changed = region not in self.hud_values or self.hud_values[region] != value
+        if changed:
+            self._clear_hud_region(region)
+            self.hud_values[region] = value
+            self.hud_surfaces[region] = render(value)
+        if changed or not self.incremental:
+            rect = self.screen.blit(self.hud_surfaces[region], pos)
+            self.hud_rects[region] = rect
+            if self.incremental:
+                self.game.dirty_rects.add(rect)
+
+    def _clear_hud_region(self, region):
+        """Erase a region's old text when the screen is not being cleared"""
+        rect = self.hud_rects.pop(region, None)
+        self.hud_values.pop(region, None)
+        if rect and self.incremental:
+            self.screen.fill(self.bg_color, rect)
+            self.game.dirty_rects.add(rect)
+
     def _draw_game_world(self):
         # --- draw game world ---
-        title_txt = self.large_font.render("Myth-Forge Defense", True, self.text_color)
+        title_txt = self._text(self.large_font, "Myth-Forge Defense", self.text_color)
         self.screen.blit(title_txt, UI_POSITIONS["title"])
 
     def _draw_ui_stats(self):
         # --- UI text ---
-        money_txt = self.medium_font.render(f"Money: {self.game.money}", True, (255,255,255))
-        self.screen.blit(money_txt, UI_POSITIONS["money"])
-        lives_txt = self.medium_font.render(f"Lives: {self.game.lives}", True, (255,255,255))
-        self.screen.blit(lives_txt, UI_POSITIONS["lives"])
-        speed_txt = self.medium_font.render(f"Speed: {self.game.speed_factor}", True, (255,255,255))
-        self.screen.blit(speed_txt, UI_POSITIONS["speed"])
+        font = self.medium_font
+        self._draw_hud_region('money', self.game.money,
+                              lambda money: self._text(font, f"Money: {money}", (255,255,255)), UI_POSITIONS["money"])
+        self._draw_hud_region('lives', self.game.lives,
+                              lambda lives: self._text(font, f"Lives: {lives}", (255,255,255)), UI_POSITIONS["lives"])
+        self._draw_hud_region('speed', self.game.speed_factor,
+                              lambda speed: self._text(font, f"Speed: {speed}", (255,255,255)), UI_POSITIONS["speed"])
 
     def _draw_wave_info(self):
         # --- wave info ---
+        font = self.medium_font
         wave_info = self.wave_manager.get_wave_info()
-        wave_txt = self.medium_font.render(f"Wave: {wave_info['current_wave']}/{wave_info['total_waves']}", True, (255,255,255))
-        self.screen.blit(wave_txt, UI_POSITIONS["wave"])
+        self._draw_hud_region('wave', (wave_info['current_wave'], wave_info['total_waves']),
+                              lambda wave: self._text(font, f"Wave: {wave[0]}/{wave[1]}", (255,255,255)),
+                              UI_POSITIONS["wave"])
         
         if wave_info['break_timer'] > 0:
-            break_txt = self.medium_font.render(f"Next wave in: {wave_info['break_timer']:.1f}", True, (255,255,255))
-            self.screen.blit(break_txt, (self.screen_width//2 - 100, 50))
+            # Only changes every tenth of a second
+            self._draw_hud_region('wave_timer', f"{wave_info['break_timer']:.1f}",
+                                  lambda timer: self._text(font, f"Next wave in: {timer}", (255,255,255)),
+                                  (self.screen_width//2 - 100, 50))
+        else:
+            self._clear_hud_region('wave_timer')
 
     def _draw_tower_shop(self):
+        # The shops never change, render them once and blit
+        if self.shop_surface is None:
+            self._render_shops()
+        self.screen.blit(self.shop_surface, self.shop_origin)
+
+    def _render_shops(self):
+        """Render both shop panels into shop_surface, shop rects stay in screen coordinates"""
+        size = TOWER_CONFIG['size']
+        space_per_option = 10 + self.medium_font.get_height() + 10 + size + 10
+        height = space_per_option * max(len(TOWER_CONFIG['type']), len(ELEMENTAL_UPGRADES))
+        self.shop_surface = pygame.Surface((size * 4, height), pygame.SRCALPHA)
+        self._shop_target = self.shop_surface
+        self._build_tower_shop()
+        self._shop_target = None
+
+    def _shop_rect(self, rect):
+        """Screen rect translated into shop_surface coordinates"""
+        return rect.move(-self.shop_origin[0], -self.shop_origin[1])
+
+    def _build_tower_shop(self):
         # --- draw tower selection ---
         size = TOWER_CONFIG['size']
         tower_config = TOWER_CONFIG['type']
@@ -84,7 +155,7 @@ class UIManager:
             size * 2,                                # width
             total_height                             # calculated height
         )
-        pygame.draw.rect(self.screen, Colors.BLACK, shop_rect, 2)  # 2 is border thickness
+        pygame.draw.rect(self._shop_target, Colors.BLACK, self._shop_rect(shop_rect), 2)  # 2 is border thickness
         # Draw tower options
         next_y = shop_rect.top
         for tower_name, stats in tower_config.items():
@@ -95,9 +166,9 @@ class UIManager:
                 top_y=next_y
             )
         # Draw upgrade shop
-        self._draw_upgrade_shop()
+        self._build_upgrade_shop()
         
-    def _draw_upgrade_shop(self):
+    def _build_upgrade_shop(self):
         size = TOWER_CONFIG['size']
         upgrade_config = ELEMENTAL_UPGRADES
 
@@ -118,7 +189,7 @@ class UIManager:
             size * 2,                                # width
             total_height                             # calculated height
         )
-        pygame.draw.rect(self.screen, Colors.BLACK, shop_rect, 2)  # 2 is border thickness
+        pygame.draw.rect(self._shop_target, Colors.BLACK, self._shop_rect(shop_rect), 2)  # 2 is border thickness
         # Draw upgrade options
         next_y = shop_rect.top
         for element_name, stats in upgrade_config.items():
@@ -132,84 +203,95 @@ class UIManager:
     def __draw_tower_option(self, name, shop_rect, tower_config, top_y):
         size = TOWER_CONFIG['size']
         # Draw tower name
-        name_txt = self.medium_font.render(name, True, Colors.WHITE)
+        name_txt = self._text(self.medium_font, name, Colors.WHITE)
         name_rect = name_txt.get_rect(center=(shop_rect.centerx, top_y + 20))
-        self.screen.blit(name_txt, name_rect)
+        self._shop_target.blit(name_txt, self._shop_rect(name_rect))
         # Draw tower representation (simple square for now)
         tower_rect = pygame.Rect(shop_rect.centerx - size//2, name_rect.bottom + 10, size, size)
         self.shop_towers[name] = tower_rect
-        pygame.draw.rect(self.screen, tower_config['color'], tower_rect)
+        pygame.draw.rect(self._shop_target, tower_config['color'], self._shop_rect(tower_rect))
         # Draw cost on tower
-        cost_txt = self.small_font.render(f"${tower_config['cost']}", True, Colors.WHITE)
+        cost_txt = self._text(self.small_font, f"${tower_config['cost']}", Colors.WHITE)
         cost_rect = cost_txt.get_rect(center=(tower_rect.centerx, tower_rect.top + size//2))
-        self.screen.blit(cost_txt, cost_rect)
+        self._shop_target.blit(cost_txt, self._shop_rect(cost_rect))
 
         return tower_rect.bottom + 10  # Return bottom y for next option
     
     def __draw_upgrade_option(self, name, shop_rect, tower_config, top_y):
         size = TOWER_CONFIG['size']
         # Draw tower name
-        name_txt = self.medium_font.render(name, True, Colors.WHITE)
+        name_txt = self._text(self.medium_font, name, Colors.WHITE)
         name_rect = name_txt.get_rect(center=(shop_rect.centerx, top_y + 20))
-        self.screen.blit(name_txt, name_rect)
+        self._shop_target.blit(name_txt, self._shop_rect(name_rect))
         # Draw tower representation (simple circle for now)
         tower_rect = pygame.Rect(shop_rect.centerx - size//2, name_rect.bottom + 10, size, size)
         self.shop_towers[name] = tower_rect
-        pygame.draw.circle(self.screen, tower_config['color'], tower_rect.center, size//2)
+        pygame.draw.circle(self._shop_target, tower_config['color'], self._shop_rect(tower_rect).center, size//2)
         # Draw cost on tower
-        cost_txt = self.small_font.render(f"${tower_config['cost']}", True, Colors.WHITE)
+        cost_txt = self._text(self.small_font, f"${tower_config['cost']}", Colors.WHITE)
         cost_rect = cost_txt.get_rect(center=(tower_rect.centerx, tower_rect.top + size//2))
-        self.screen.blit(cost_txt, cost_rect)
+        self._shop_target.blit(cost_txt, self._shop_rect(cost_rect))
         
         return tower_rect.bottom + 10  # Return bottom y for next option
 
     def draw_paused(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, created once
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface((self.screen_width, self.screen_height))
+            self.pause_overlay.set_alpha(128)
+            self.pause_overlay.fill((0, 0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause text
-        text = self.large_font.render("PAUSED - Press ESC to resume", True, self.text_color)
+        text = self._text(self.large_font, "PAUSED - Press ESC to resume", self.text_color)
         text_rect = text.get_rect(center=(self.screen_width//2, self.screen_height//2))
         self.screen.blit(text, text_rect)
 
     def draw_over(self):
-        text = self.large_font.render("Game Over - Press R to restart", True, self.text_color)
+        text = self._text(self.large_font, "Game Over - Press R to restart", self.text_color)
         text_rect = text.get_rect(center=(self.screen_width//2, self.screen_height//2))
         self.screen.blit(text, text_rect)
 
     def draw_victory(self):
-        text = self.large_font.render("You Won! - Press R to restart", True, self.text_color)
+        text = self._text(self.large_font, "You Won! - Press R to restart", self.text_color)
         text_rect = text.get_rect(center=(self.screen_width//2, self.screen_height//2))
         self.screen.blit(text, text_rect)
 
     def draw_menu(self):
         self.screen.fill(self.bg_color)
-        title_txt = self.title_font.render("Myth-Forge Defense", True, self.text_color)
+        title_txt = self._text(self.title_font, "Myth-Forge Defense", self.text_color)
         title_rect = title_txt.get_rect(center=(self.screen_width//2, self.screen_height//4))
         self.screen.blit(title_txt, title_rect)
         
-        prompt_txt = self.medium_font.render("Press ENTER to Start", True, self.text_color)
+        prompt_txt = self._text(self.medium_font, "Press ENTER to Start", self.text_color)
         prompt_rect = prompt_txt.get_rect(center=(self.screen_width//2, self.screen_height//2))
         self.screen.blit(prompt_txt, prompt_rect)
     
-    def draw_level_select(self, levels):
+    def draw_level_select(self, levels, broken=()):
         self.screen.fill(self.bg_color)
-        title_txt = self.title_font.render("Select Level", True, self.text_color)
+        title_txt = self._text(self.title_font, "Select Level", self.text_color)
         title_rect = title_txt.get_rect(center=(self.screen_width//2, self.screen_height//6))
         self.screen.blit(title_txt, title_rect)
         
-        # Draw level options
+        # Draw level options, scrolled so the selected one stays on screen
         start_y = self.screen_height//4
         spacing = 60
-        for i, level in enumerate(levels):
-            level_txt = self.medium_font.render(f"{i+1}. {level}", True, self.text_color)
-            level_rect = level_txt.get_rect(center=(self.screen_width//2, start_y + i * spacing))
+        visible = max(1, (self.screen_height - 100 - start_y) // spacing)
+        selected = levels.index(self.selected_level) if self.selected_level in levels else 0
+        first = min(max(0, selected - visible + 1), max(0, len(levels) - visible))
+        for i, level in enumerate(levels[first:first + visible], first):
+            color = Colors.YELLOW if i == selected else self.text_color
+            label = f"{i+1}. {level}"
+            if level in broken:
+                label += " (invalid map file)"
+                if i != selected:
+                    color = Colors.RED
+            level_txt = self._text(self.medium_font, label, color)
+            level_rect = level_txt.get_rect(center=(self.screen_width//2, start_y + (i - first) * spacing))
             self.screen.blit(level_txt, level_rect)
         
-        prompt_txt = self.small_font.render("Press number key to select level", True, self.text_color)
+        prompt_txt = self._text(self.small_font, "Press number key or Up/Down to select level, Enter to start",
+                                self.text_color)
         prompt_rect = prompt_txt.get_rect(center=(self.screen_width//2, self.screen_height - 50))
         self.screen.blit(prompt_txt, prompt_rect)
 
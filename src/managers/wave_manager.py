@@ -1,46 +1,64 @@
+import heapq
 import pygame
 from ..entities.enemy import Enemy
 from ..config.wave_config import WAVE_CONFIG
 
+
+def compile_wave(wave):
+    """Spawn timeline of a wave: heap of (seconds into the wave, order, enemy type, spawn index or None)
+
+    Each group starts when the previous one has spawned its last enemy and
+    spawns one enemy every interval, the first one interval after it starts.
+    """
+    timeline = []
+    start = 0.0
+    for group in wave["groups"]:
+        for i in range(1, group["count"] + 1):
+            timeline.append((start + i * group["interval"], len(timeline), group["type"], group.get("spawn")))
+        start += group["count"] * group["interval"]
+    heapq.heapify(timeline)
+    return timeline
+
+
 class WaveManager:
-    def __init__(self, game, path_points):
+    def __init__(self, game, level):
         self.game = game
-        self.path_points = path_points # Path enemies will follow, based on map.py
+        self.field = level.flow_field  # Steering enemies follow, based on map.py
+        self.spawns = level.spawns     # Spawn points, used in turn unless a group names one
+        self.next_spawn = 0
         self.current_wave = -1  # No wave started yet
-        self.spawn_timer = 0    # Timer between individual enemy spawns
         self.waves = WAVE_CONFIG['waves'] # List of wave definitions
+        self.timelines = [compile_wave(wave) for wave in self.waves]  # Compiled once, copied per wave
+        self.timeline = []      # Spawns of the current wave not due yet
+        self.spawned = 0        # Spawns popped from the current wave's timeline
+        self.wave_time = 0      # Seconds since the current wave started
         self.wave_timer = 0     # Counts time between waves
         self.wave_interval = WAVE_CONFIG['wave_interval']  # seconds between waves
         self.wave_in_progress = False # Is a wave currently active?
-        self.current_enemy_group = 0 # Index of current enemy group in wave
-        self.remaining_spawns = 0 # Total enemies left to spawn in current wave group
 
     def update(self, dt, enemy_list):        
         # Handle between-wave break
         if not self.wave_in_progress:
             return self._handle_wave_break(dt)
-            
-        wave = self.waves[self.current_wave]            # Current wave details
-        groups = wave["groups"]
 
         # Handle enemy spawning
-        self._handle_enemy_spawning(dt, groups, enemy_list)
+        self._handle_enemy_spawning(dt, enemy_list)
 
     def reset(self):
         """Reset wave manager to initial state"""
         self.current_wave = -1  # No wave started yet
-        self.spawn_timer = 0
+        self.timeline = []
+        self.spawned = 0
+        self.wave_time = 0
         self.wave_timer = 0
         self.wave_in_progress = False
-        self.enemies_spawned = 0
-        self.current_enemy_group = 0
-        self.remaining_spawns = 0
+        self.next_spawn = 0
     
     def _handle_wave_break(self, dt):
         """Handle time between waves"""
         self.wave_timer += dt
         if self.wave_timer >= self.wave_interval:
-            self._start_next_wave()
+            self._start_next_wave(self.wave_timer - self.wave_interval)
         
     def _is_wave_completed(self, enemy_list):
         """Check if current wave is finished"""
@@ -48,47 +66,61 @@ class WaveManager:
             print(f"Wave {self.current_wave + 1} completed!")
             self.wave_in_progress = False
             self.wave_timer = 0
-            self.current_enemy_group = 0
             self._award_wave_completion_bonus()
             return True
         return False
     
-    def _handle_enemy_spawning(self, dt, groups, enemy_list):
-        """Handle enemy spawning and group progression"""
-        current_group = groups[self.current_enemy_group]
-        self.spawn_timer += dt                          # Increment spawn timer
-        
-        if (self.spawn_timer >= current_group["interval"] and 
-            self.remaining_spawns > 0):                 # Time to spawn next enemy?
-            new_enemy = self._spawn_enemy(current_group["type"])
-            enemy_list.add(new_enemy)
-            self.remaining_spawns -= 1
-            self.spawn_timer = 0
-            
-        # Move to next enemy type if current one is done
-        if self.remaining_spawns <= 0:
-            if self.current_enemy_group + 1 < len(groups):
-                self.current_enemy_group += 1
-                self.remaining_spawns = groups[self.current_enemy_group]["count"]
-                self.spawn_timer = 0 # Reset spawn timer for next group
-            else:
-                self._is_wave_completed(enemy_list)
+    def _handle_enemy_spawning(self, dt, enemy_list):
+        """Spawn every enemy due by the start of this tick, then advance the wave clock"""
+        timeline = self.timeline
+        now = self.wave_time
+        if timeline and timeline[0][0] <= now:
+            due = []
+            while timeline and timeline[0][0] <= now:
+                due.append(heapq.heappop(timeline))
+            self.spawned += len(due)
+            enemies = [self._spawn_enemy(enemy_type, spawn) for _, _, enemy_type, spawn in due]
+            # Due part way through an earlier tick: catch up on the movement since then,
+            # the rest of this tick's comes with every other enemy's update
+            for (time, _, _, _), enemy in zip(due, enemies):
+                if time < now:
+                    enemy.update(now - time)
+            enemy_list.add(*enemies)
+        self.wave_time = now + dt
+
+        if not timeline:
+            self._is_wave_completed(enemy_list)
     
-    def _start_next_wave(self):
+    def _start_next_wave(self, elapsed=0):
+        """Start the next wave, elapsed seconds ago"""
         # Only increment if we haven't reached the last wave
         if self.current_wave + 1 < len(self.waves): # Check if more waves are available
             self.current_wave += 1                  # Move to next wave
-            self.wave_in_progress = True            # Reset spawn variables
-            self.spawn_timer = 0                    # Reset spawn timer
-            self.current_enemy_group = 0            # Start with first enemy group
-            self.remaining_spawns = self.waves[self.current_wave]["groups"][0]["count"]
+            self.wave_in_progress = True
+            self.timeline = list(self.timelines[self.current_wave])
+            self.spawned = 0
+            self.wave_time = elapsed
             print(f"Starting wave {self.current_wave + 1}")
         else:
             print("All waves completed!")
+
+    def restore_timeline(self):
+        """Rebuild the spawns still due in the current wave from how many were popped"""
+        self.timeline = []
+        if self.wave_in_progress:
+            self.timeline = sorted(self.timelines[self.current_wave])[self.spawned:]
     
-    def _spawn_enemy(self, enemy_type):
-        """Create a new enemy of specified type"""        
-        return Enemy(self.path_points, enemy_type)
+    def _spawn_enemy(self, enemy_type, spawn=None):
+        """Create a new enemy of specified type at a spawn point (by index, or the next in turn)"""
+        if spawn is None:
+            spawn = self.next_spawn
+            self.next_spawn = (self.next_spawn + 1) % len(self.spawns)
+        spawn_point = self.spawns[spawn % len(self.spawns)]
+        if self.game and self.game.enemy_store is not None:
+            return self.game.enemy_store.spawn(enemy_type, spawn_point)
+        if self.game:
+            return self.game.enemy_pool.acquire(self.field, enemy_type, spawn_point)
+        return Enemy(self.field, enemy_type, spawn_point)
 
     def _award_wave_completion_bonus(self):
         """Award bonus for completing a wave"""
@@ -1,61 +0,0 @@
-from ..config.tower_config import TOWER_CONFIG
-
-size = TOWER_CONFIG['size']
-
-LEVEL_1 = {
-    'name': "The First Trial",
-    'path_points': [
-        (100, 100),
-        (450, 100),
-        (450, 400),
-        (700, 400),
-        (700, 650),
-        (950, 650)
-    ],
-    'tower_points': [
-        (150, 150, size, size),
-        (200, 150, size, size),
-        (250, 150, size, size),   
-        (300, 150, size, size),
-        (350, 150, size, size),
-
-        (350, 200, size, size),  
-        (350, 250, size, size),
-        (350, 300, size, size),
-        (350, 350, size, size),
-        (350, 400, size, size),
-        (350, 450, size, size),
-
-        (400, 450, size, size),
-        (450, 450, size, size),
-        (500, 450, size, size),
-        (550, 450, size, size),
-        (600, 450, size, size),
-
-        (600, 500, size, size),
-        (600, 550, size, size),
-        (600, 600, size, size),
-        (600, 650, size, size),
-        
-        (500, 100, size, size),
-        (500, 150, size, size),
-        (500, 200, size, size),
-        (500, 250, size, size),
-        (500, 300, size, size),
-
-        (550, 300, size, size),
-        (600, 300, size, size),
-        (650, 300, size, size),
-        (700, 300, size, size),
-        (750, 300, size, size),
-
-        (750, 350, size, size),
-        (750, 400, size, size),
-        (750, 450, size, size),
-        (750, 500, size, size),
-        (750, 550, size, size),
-
-        (800, 550, size, size),
-        (850, 550, size, size),
-    ]
-}
\ No newline at end of file
@@ -0,0 +1,175 @@
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+
+from .headless import HeadlessRunner, parse_placement
+from ..entities.map import MAPS
+from ..config.enemy_config import ENEMY_CONFIG
+from ..config.game_config import GAME_CONFIG
+from ..config.projectile_config import ELEMENTAL_EFFECTS, PROJECTILE_CONFIG
+from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+from ..config.wave_config import WAVE_CONFIG
+
+# Config dicts a scenario may override, by the name used in override paths
+CONFIGS = {
+    'GAME_CONFIG': GAME_CONFIG,
+    'ENEMY_CONFIG': ENEMY_CONFIG,
+    'TOWER_CONFIG': TOWER_CONFIG,
+    'ELEMENTAL_UPGRADES': ELEMENTAL_UPGRADES,
+    'PROJECTILE_CONFIG': PROJECTILE_CONFIG,
+    'ELEMENTAL_EFFECTS': ELEMENTAL_EFFECTS,
+    'WAVE_CONFIG': WAVE_CONFIG,
+}
+
+_DEFAULTS = None  # Pristine copy of CONFIGS, taken once per worker
+
+
+def expand_grid(grid):
+    """Turn a scenario grid into a list of scenarios
+
+    The grid is a dict with 'maps' (list of MAPS ids), 'layouts' (name -> list of
+    'spot:type[:element]' placements) and optional 'overrides' (name -> {dotted
+    config path: value}).  Every combination becomes one scenario; 'repeat' runs
+    each combination several times.
+    """
+    layouts = grid.get('layouts') or {'empty': []}
+    overrides = grid.get('overrides') or {'default': {}}
+    scenarios = []
+    combos = itertools.product(grid['maps'], layouts.items(), overrides.items(), range(grid.get('repeat', 1)))
+    for map_id, (layout_name, placements), (override_name, override), run in combos:
+        scenarios.append({
+            'id': len(scenarios),
+            'map': map_id,
+            'layout': layout_name,
+            'placements': placements,
+            'override': override_name,
+            'overrides': override,
+            'run': run,
+            'max_time': grid.get('max_time', 3600.0),
+        })
+    return scenarios
+
+
+def apply_override(path, value):
+    """Set a config value from a dotted path like 'TOWER_CONFIG.type.cannon.range'"""
+    name, *keys = path.split('.')
+    if name not in CONFIGS or not keys:
+        raise KeyError(f"Unknown config path '{path}'")
+    target = CONFIGS[name]
+    for key in keys[:-1]:
+        target = target[int(key)] if isinstance(target, list) else target[key]
+    last = keys[-1]
+    if isinstance(target, list):
+        target[int(last)] = value
+    else:
+        target[last] = value
+
+
+def _restore_defaults():
+    for name, config in CONFIGS.items():
+        config.clear()
+        config.update(copy.deepcopy(_DEFAULTS[name]))
+    # Loaded maps were baked with the configs of the scenario that loaded them, the
+    # next use loads them again (from the bake cache, keyed by those configs)
+    MAPS.maps.clear()
+
+
+def _init_worker():
+    global _DEFAULTS
+    _DEFAULTS = copy.deepcopy(CONFIGS)
+
+
+def run_scenario(scenario):
+    """Run one scenario in the current process and return it with its report"""
+    if _DEFAULTS is None:
+        _init_worker()
+    _restore_defaults()
+    try:
+        for path, value in scenario['overrides'].items():
+            apply_override(path, value)
+        placements = [
+            parse_placement(item) if isinstance(item, str) else tuple(item) + (None,) * (3 - len(item))
+            for item in scenario['placements']
+        ]
+        report = HeadlessRunner(scenario['map'], placements, max_time=scenario['max_time']).run()
+        return scenario, report, None
+    except Exception as error:  # Report the failure, keep the batch going
+        return scenario, None, f"{type(error).__name__}: {error}"
+    finally:
+        _restore_defaults()
+
+
+def run_batch(scenarios, workers=None):
+    """Yield (scenario, report, error) as scenarios finish, across a process pool"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for scenario in scenarios:
+            yield run_scenario(scenario)
+        return
+
+    # Forked workers inherit the already imported game modules and start instantly
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with context.Pool(workers, initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(run_scenario, scenarios)
+
+
+def wave_rows(scenario, report, error):
+    """Flatten a scenario result into one row per wave"""
+    base = {
+        'scenario': scenario['id'],
+        'map': scenario['map'],
+        'layout': scenario['layout'],
+        'override': scenario['override'],
+        'run': scenario['run'],
+    }
+    if error:
+        return [dict(base, error=error)]
+    rows = []
+    for wave in report['waves']:
+        rows.append(dict(
+            base,
+            result=report['result'],
+            wave=wave['wave'],
+            lives_lost=wave['lives_lost'],
+            leaks=wave['leaks'],
+            kills=wave['kills'],
+            lives=wave['lives'],
+            money=wave['money'],
+            kills_by_tower=wave['kills_by_tower'],
+        ))
+    return rows
+
+
+class ResultWriter:
+    """Streams wave rows to a .jsonl or .csv file as they arrive"""
+    def __init__(self, path):
+        self.path = path
+        self.csv = path.endswith('.csv')
+        self.file = open(path, 'w', newline='')
+        self.writer = None
+        if self.csv:
+            self.tower_types = list(TOWER_CONFIG['type']) + ['other']
+            fields = ['scenario', 'map', 'layout', 'override', 'run', 'result', 'wave', 'lives_lost',
+                      'leaks', 'kills', 'lives', 'money', 'error']
+            fields += [f"kills_{tower_type}" for tower_type in self.tower_types]
+            self.writer = csv.DictWriter(self.file, fields)
+            self.writer.writeheader()
+
+    def write(self, rows):
+        for row in rows:
+            if self.csv:
+                row = dict(row)
+                kills = row.pop('kills_by_tower', {})
+                for tower_type in self.tower_types:
+                    row[f"kills_{tower_type}"] = kills.get(tower_type, 0)
+                self.writer.writerow(row)
+            else:
+                self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
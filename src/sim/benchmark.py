@@ -0,0 +1,215 @@
+import contextlib
+import datetime
+import os
+import platform
+import statistics
+import time
+
+# Keep pygame quiet and away from any real video device
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+from .savegame import restore
+from .stress import populate_enemies
+from ..game import Game
+from ..entities.map import MAPS
+from ..config.game_config import GAME_CONFIG
+from ..config.tower_config import TOWER_CONFIG
+from ..config.ui_config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def machine_info():
+    """Where a benchmark ran, stored next to its results"""
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pygame': pygame.version.ver,
+    }
+
+
+def time_calls(func, repeats=7, number=20, setup=None):
+    """Per-call timings in microseconds: func runs number times per repeat, setup is not timed"""
+    samples = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number * 1e6)
+    return {
+        'median_us': statistics.median(samples),
+        'min_us': min(samples),
+        'mean_us': statistics.fmean(samples),
+        'repeats': repeats,
+        'number': number,
+    }
+
+
+class BenchmarkSuite:
+    """Synthetic scenarios on every MAPS level, timing the simulation and drawing hot paths
+
+    Each level gets enemy_count enemies spread along its path, towers_per_type
+    towers of every TOWER_CONFIG type and projectile_count shells (half of them
+    storm) in flight, half about to hit.
+    """
+    def __init__(self, enemy_count=200, towers_per_type=2, projectile_count=100, repeats=7,
+                 enemy_engine=None, maps=None, saves=()):
+        self.enemy_count = enemy_count
+        self.towers_per_type = towers_per_type
+        self.projectile_count = projectile_count
+        self.repeats = repeats
+        self.enemy_engine = enemy_engine or GAME_CONFIG['enemy_engine']
+        self.maps = list(maps or MAPS)
+        self.saves = list(saves)  # Save files to time from their (mid-wave) state to the end of the wave
+
+    def run(self, progress=None):
+        """Run every benchmark and return the report"""
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        results = {}
+        for map_id in self.maps:
+            benchmarks = self._run_map(map_id, screen)
+            while True:
+                # The game's print() chatter is swallowed, progress is not
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    name, timing = next(benchmarks, (None, None))
+                if name is None:
+                    break
+                results[f"{map_id}/{name}"] = timing
+                if progress:
+                    progress(f"{map_id}/{name}", timing)
+        for path in self.saves:
+            with open(path, 'rb') as file:
+                data = file.read()
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                timing = time_calls(lambda: self._resume_wave(data), max(self.repeats // 2, 1), number=1)
+            name = f"{os.path.basename(path)}/resume_wave"
+            results[name] = timing
+            if progress:
+                progress(name, timing)
+        return {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'machine': machine_info(),
+            'config': {
+                'enemies': self.enemy_count,
+                'towers_per_type': self.towers_per_type,
+                'projectiles': self.projectile_count,
+                'repeats': self.repeats,
+                'enemy_engine': self.enemy_engine,
+            },
+            'results': results,
+        }
+
+    def _build(self, map_id, screen):
+        game = Game(screen, self.enemy_engine)
+        game.start_level(map_id)
+        game.money = 10 ** 9
+        tower_types = list(TOWER_CONFIG['type'])
+        spots = len(game.current_map.get_tower_points())
+        for i in range(min(self.towers_per_type * len(tower_types), spots)):
+            game.tower_manager.place_tower(i, tower_types[i % len(tower_types)])
+        populate_enemies(game, self.enemy_count, hp_scale=1000)
+        return game
+
+    def _fire_projectiles(self, game):
+        """Replace whatever is in flight with a fresh volley of shells, every other one storm"""
+        for projectile in list(game.projectiles):
+            projectile.kill()
+        enemies = list(game.enemies)
+        towers = game.tower_manager.towers
+        if not enemies or not towers:
+            return
+        for i in range(self.projectile_count):
+            enemy = enemies[i % len(enemies)]
+            if i % 4 < 2:
+                start = (enemy.x - 4, enemy.y)  # Hits this tick
+            else:
+                tower = towers[i % len(towers)]
+                start = (tower.x, tower.y)      # Still on its way
+            projectile = game.projectile_pool.acquire(start, enemy, 'shell', 300)
+            if i % 2:
+                projectile.set_element('storm')
+            game.projectiles.add(projectile)
+
+    def _run_map(self, map_id, screen):
+        game = self._build(map_id, screen)
+        tower_manager = game.tower_manager
+        dt = game.tick_dt
+        repeats = self.repeats
+
+        # The batched retarget TowerManager.update runs every tick
+        yield 'targeting.update', time_calls(lambda: tower_manager.targeting.update(tower_manager.towers), repeats)
+
+        yield '_update_projectiles', time_calls(lambda: game._update_projectiles(dt), repeats, number=1,
+                                                setup=lambda: self._fire_projectiles(game))
+
+        # Every repeat starts from freshly placed enemies instead of ones further along the path
+        fresh = [game]
+        def update_enemies():
+            if fresh[0].enemy_store is not None:
+                fresh[0].enemy_store.update(dt)
+            else:
+                fresh[0].enemies.update(dt)
+        def rebuild():
+            fresh[0] = self._build(map_id, screen)
+        yield 'Enemy.update', time_calls(update_enemies, repeats, setup=rebuild)
+
+        surface = pygame.Surface(game.game_surface.get_size())
+        yield 'Map.draw_path', time_calls(lambda: game.current_map.draw_path(surface), repeats)
+        yield 'UIManager.draw', time_calls(game.ui_manager.draw, repeats)
+
+        yield 'full_wave', time_calls(lambda: self._full_wave(map_id), max(repeats // 2, 1), number=1)
+
+    def _full_wave(self, map_id):
+        """Play the first wave end to end without a window"""
+        game = Game(None, self.enemy_engine)
+        game.start_level(map_id)
+        game.money = 10 ** 9
+        tower_types = list(TOWER_CONFIG['type'])
+        for i in range(min(self.towers_per_type * len(tower_types), len(game.current_map.get_tower_points()))):
+            game.tower_manager.place_tower(i, tower_types[i % len(tower_types)])
+        wave_manager = game.wave_manager
+        while game.state == "playing" and not (wave_manager.current_wave == 0 and not wave_manager.wave_in_progress):
+            game.tick()
+
+    def _resume_wave(self, data):
+        """Load a saved state and play until its wave is over, the next one if saved between waves"""
+        game = restore(Game(None, self.enemy_engine), data)
+        wave_manager = game.wave_manager
+        started = False
+        while game.state == "playing" and not (started and not wave_manager.wave_in_progress):
+            started = started or wave_manager.wave_in_progress
+            game.tick()
+
+
+def compare(baseline, current, threshold=0.10):
+    """Rows of (name, baseline_us, current_us, ratio, status) for benchmarks in both reports
+
+    A benchmark regressed when its median got more than threshold slower.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            rows.append((name, None, result['median_us'], None, 'new'))
+            continue
+        ratio = result['median_us'] / base['median_us'] if base['median_us'] else float('inf')
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+        elif ratio < 1 - threshold:
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append((name, base['median_us'], result['median_us'], ratio, status))
+    for name in baseline['results']:
+        if name not in current['results']:
+            rows.append((name, baseline['results'][name]['median_us'], None, None, 'missing'))
+    return rows
@@ -0,0 +1,152 @@
+import contextlib
+import os
+import time
+
+# Keep pygame quiet and away from any real video device
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from .savegame import load_game
+from ..game import Game
+from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+
+
+def check_placement(spot, tower_type, element=None):
+    """Raise ValueError for a placement no map could ever build"""
+    if spot < 0:
+        raise ValueError(f"Invalid tower spot {spot}")
+    if tower_type not in TOWER_CONFIG['type']:
+        raise ValueError(f"Unknown tower type '{tower_type}', expected one of {', '.join(TOWER_CONFIG['type'])}")
+    if element is not None and element not in ELEMENTAL_UPGRADES:
+        raise ValueError(f"Unknown element '{element}', expected one of {', '.join(ELEMENTAL_UPGRADES)}")
+
+
+def parse_placement(text):
+    """Parse a 'spot:type[:element]' string into a (spot, type, element) tuple"""
+    parts = text.split(':')
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid placement '{text}', expected spot:type[:element]")
+    element = parts[2] if len(parts) == 3 and parts[2] else None
+    placement = int(parts[0]), parts[1], element
+    check_placement(*placement)
+    return placement
+
+
+class HeadlessRunner:
+    """Plays a level through without a window, drawing or a frame cap"""
+    def __init__(self, map_id='level_1', placements=(), dt=None,
+                 max_time=3600.0, quiet=True, enemy_engine=None):
+        self.map_id = map_id
+        self.placements = list(placements)  # Build order of (spot, tower_type, element)
+        for placement in self.placements:
+            check_placement(*placement)
+        self.dt = dt                        # Simulated seconds per tick, 1 / GAME_CONFIG['tick_rate'] when None
+        self.max_time = max_time            # Simulated seconds before giving up
+        self.quiet = quiet                  # Swallow the game's print() chatter
+        self.enemy_engine = enemy_engine    # Overrides GAME_CONFIG['enemy_engine'] for this run when set
+
+    def run(self):
+        """Run one game to victory, game over or timeout and return its report"""
+        if self.quiet:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                return self._run()
+        return self._run()
+
+    def _run(self):
+        game = Game(None, self.enemy_engine)
+        if self.map_id.endswith('.mfs'):
+            load_game(game, self.map_id)  # Start from a saved, possibly mid-wave, state
+        else:
+            game.start_level(self.map_id)
+        if self.dt is not None:
+            game.tick_dt = self.dt
+        dt = game.tick_dt  # Read when the run starts, so tick_rate overrides apply
+        self.game = game
+
+        # Towers are built in order as soon as they can be afforded, steps that can never be built are skipped
+        build_order = []
+        for spot, tower_type, element in self.placements:
+            build_order.append(('place', spot, tower_type))
+            if element:
+                build_order.append(('upgrade', spot, element))
+
+        waves = []
+        in_wave = False
+        wave_start = None
+        ticks = 0
+        max_ticks = int(self.max_time / dt)
+        started = time.perf_counter()
+
+        while game.state == "playing" and ticks < max_ticks:
+            while build_order and self._try_build(game, build_order[0]):
+                build_order.pop(0)
+
+            game.tick()  # No frame pacing, ticks run back to back
+            ticks += 1
+
+            # Wave bookkeeping
+            wave_manager = game.wave_manager
+            if wave_manager.wave_in_progress and not in_wave:
+                in_wave = True
+                wave_start = (game.lives, game.enemies_killed, game.enemies_leaked, dict(game.kills_by_tower))
+            elif in_wave and (not wave_manager.wave_in_progress or game.state != "playing"):
+                in_wave = False
+                waves.append(self._wave_report(game, wave_start))
+
+        wall_time = time.perf_counter() - started
+        if in_wave:
+            waves.append(self._wave_report(game, wave_start))
+
+        return {
+            'map': self.map_id,
+            'result': game.state if game.state != "playing" else "timeout",
+            'lives': game.lives,
+            'money': game.money,
+            'towers': len(game.tower_manager.towers),
+            'ticks': ticks,
+            'sim_time': ticks * dt,
+            'wall_time': wall_time,
+            'ticks_per_second': ticks / wall_time if wall_time > 0 else 0.0,
+            'waves': waves,
+            'pools': game.pool_stats(),
+        }
+
+    def _try_build(self, game, step):
+        """Attempt one build order step, returns True once it is done or skipped, False while waiting on money"""
+        action, spot, arg = step
+        tower_manager = game.tower_manager
+        if spot >= len(game.current_map.get_tower_points()):
+            print(f"Skipping {action} on spot {spot}: the map has no such spot")
+            return True
+
+        tower = tower_manager.tower_at(spot)
+        if action == 'place':
+            if tower is not None:
+                print(f"Skipping place on spot {spot}: already occupied")
+                return True
+            if game.money < TOWER_CONFIG['type'][arg]['cost']:
+                return False
+            return tower_manager.place_tower(spot, arg)
+
+        if tower is None or tower.element is not None:
+            print(f"Skipping upgrade on spot {spot}: no tower to upgrade")
+            return True
+        if game.money < ELEMENTAL_UPGRADES[arg]['cost']:
+            return False
+        return tower_manager.upgrade_tower(tower, arg)
+
+    def _wave_report(self, game, wave_start):
+        lives, killed, leaked, kills_by_tower = wave_start
+        return {
+            'wave': game.wave_manager.current_wave + 1,
+            'lives_lost': lives - game.lives,
+            'kills': game.enemies_killed - killed,
+            'kills_by_tower': {
+                tower_type: count - kills_by_tower.get(tower_type, 0)
+                for tower_type, count in game.kills_by_tower.items()
+                if count - kills_by_tower.get(tower_type, 0)
+            },
+            'leaks': game.enemies_leaked - leaked,
+            'lives': game.lives,
+            'money': game.money,
+        }
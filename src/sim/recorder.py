@@ -0,0 +1,157 @@
+import json
+import struct
+import zlib
+import numpy as np
+from ..config.enemy_config import ENEMY_CONFIG
+from ..config.game_config import GAME_CONFIG
+from ..config.projectile_config import ELEMENTAL_EFFECTS, PROJECTILE_CONFIG, STATUS_EFFECTS
+from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+from ..config.wave_config import WAVE_CONFIG
+
+# Replay file layout (little endian):
+#   magic, version, header length (u32), zlib'd JSON header
+#   command count (u32), commands as (tick u32, action u8, spot u16, argument u16)
+#   hash count (u32), zlib'd u32 state hash per tick from start_tick on
+#   snapshot length (u32), savegame snapshot the recording starts from (empty for a fresh level)
+MAGIC = b'MFRP'
+VERSION = 2
+ACTIONS = ('place', 'upgrade', 'sell', 'target', 'speed')
+COMMAND = struct.Struct('<IBHH')
+NO_ARG = 0xFFFF
+
+TARGETING_MODES = ('first', 'last', 'strongest', 'weakest', 'closest')
+
+
+def config_digest():
+    """CRC of every gameplay config, a replay only reproduces under the same configs"""
+    configs = [GAME_CONFIG, ENEMY_CONFIG, TOWER_CONFIG, ELEMENTAL_UPGRADES, PROJECTILE_CONFIG,
+               ELEMENTAL_EFFECTS, STATUS_EFFECTS, WAVE_CONFIG]
+    return zlib.crc32(json.dumps(configs, sort_keys=True, default=str).encode())
+
+
+def state_hash(game):
+    """CRC32 of the simulation state: counters, wave progress, enemies, projectiles and towers"""
+    wave_manager = game.wave_manager
+    crc = zlib.crc32(np.array([
+        game.ticks, game.lives, game.money, game.enemies_killed, game.enemies_leaked,
+        wave_manager.current_wave, wave_manager.spawned, wave_manager.wave_in_progress, wave_manager.next_spawn,
+        len(game.enemies), len(game.projectiles),
+    ], dtype=np.int64).tobytes())
+    crc = zlib.crc32(np.array([wave_manager.wave_time, wave_manager.wave_timer], dtype=np.float64).tobytes(), crc)
+
+    store = game.enemy_store
+    if store is not None:
+        n = store.count
+        for array in (store.x, store.y, store.hp, store.speed):
+            crc = zlib.crc32(array[:n].tobytes(), crc)
+    elif game.enemies:
+        enemies = game.enemies.sprites()
+        for name in ('x', 'y', 'hp', 'speed'):
+            crc = zlib.crc32(np.fromiter((getattr(enemy, name) for enemy in enemies), np.float64,
+                                         len(enemies)).tobytes(), crc)
+
+    if game.projectiles:
+        projectiles = game.projectiles.sprites()
+        positions = np.fromiter((c for projectile in projectiles for c in projectile.pos), np.float64,
+                                2 * len(projectiles))
+        crc = zlib.crc32(positions.tobytes(), crc)
+
+    for tower in game.tower_manager.towers:
+        crc = zlib.crc32(struct.pack('<dddBb', tower.x, tower.y, tower.fire_timer,
+                                     TARGETING_MODES.index(tower.targeting_mode),
+                                     -1 if tower.element is None else list(ELEMENTAL_UPGRADES).index(tower.element)),
+                         crc)
+    return crc
+
+
+class InputRecorder:
+    """Logs player commands with the sim tick they were applied on, plus a state hash per tick"""
+    def __init__(self, map_id, tick_dt, enemy_engine):
+        self.map_id = map_id
+        self.tick_dt = tick_dt
+        self.enemy_engine = enemy_engine
+        self.commands = []  # (tick, command)
+        self.hashes = []    # State hash after each tick
+        self.snapshot = b''  # Save the level was loaded from, replays restore it first
+        self.start_tick = 0  # Tick the first hash belongs to
+
+    def start_from(self, snapshot, tick):
+        """Record from a loaded save instead of a fresh level"""
+        self.snapshot = snapshot
+        self.start_tick = tick
+        self.commands = []
+        self.hashes = []
+
+    def record(self, tick, command):
+        self.commands.append((tick, tuple(command)))
+
+    def on_tick(self, game):
+        self.hashes.append(state_hash(game))
+
+    def save(self, path):
+        # Strings (tower types, elements, speed factors) go to a table in the header
+        strings = []
+        records = []
+        for tick, (action, *args) in self.commands:
+            spot = args[0] if action != 'speed' else NO_ARG
+            text = str(args[-1]) if action in ('place', 'upgrade', 'speed') else None
+            arg = NO_ARG
+            if text is not None:
+                if text not in strings:
+                    strings.append(text)
+                arg = strings.index(text)
+            records.append(COMMAND.pack(tick, ACTIONS.index(action), spot, arg))
+
+        header = zlib.compress(json.dumps({
+            'map': self.map_id,
+            'tick_dt': self.tick_dt,
+            'enemy_engine': self.enemy_engine,
+            'config_digest': config_digest(),
+            'start_tick': self.start_tick,
+            'strings': strings,
+        }).encode())
+        hashes = zlib.compress(np.array(self.hashes, dtype='<u4').tobytes())
+        with open(path, 'wb') as file:
+            file.write(MAGIC + struct.pack('<HI', VERSION, len(header)) + header)
+            file.write(struct.pack('<I', len(records)) + b''.join(records))
+            file.write(struct.pack('<II', len(self.hashes), len(hashes)) + hashes)
+            file.write(struct.pack('<I', len(self.snapshot)) + self.snapshot)
+
+
+def load_recording(path):
+    """Read a replay file into (header, [(tick, command)], hashes, snapshot)"""
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    version, header_size = struct.unpack_from('<HI', data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported replay version {version}")
+    offset = 10
+    header = json.loads(zlib.decompress(data[offset:offset + header_size]))
+    offset += header_size
+    strings = header['strings']
+
+    (count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    commands = []
+    for tick, action, spot, arg in COMMAND.iter_unpack(data[offset:offset + count * COMMAND.size]):
+        action = ACTIONS[action]
+        if action == 'speed':
+            command = (action, float(strings[arg]))
+        elif action in ('place', 'upgrade'):
+            command = (action, spot, strings[arg])
+        else:
+            command = (action, spot)
+        commands.append((tick, command))
+    offset += count * COMMAND.size
+
+    hash_count, hash_size = struct.unpack_from('<II', data, offset)
+    offset += 8
+    hashes = np.frombuffer(zlib.decompress(data[offset:offset + hash_size]), dtype='<u4')[:hash_count].tolist()
+    offset += hash_size
+
+    (snapshot_size,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    snapshot = data[offset:offset + snapshot_size]
+    return header, commands, hashes, snapshot
@@ -0,0 +1,387 @@
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+import numpy as np
+
+from ..entities.enemy_atlas import get_enemy_atlas
+from ..entities.projectile import _projectile_image
+from ..config.enemy_config import ENEMY_CONFIG
+from ..config.game_config import GAME_CONFIG
+from ..config.projectile_config import ELEMENTAL_EFFECTS, PROJECTILE_CONFIG
+from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+
+# Shared memory layout: a control record, then two frames (front and back) of
+#   header record, enemy records, projectile records, tower records
+# each sized for the GAME_CONFIG 'sim_process_*' capacities. The simulation
+# fills the back frame and flips 'front'; the renderer draws straight from
+# numpy views on the front frame and marks it in 'reading' meanwhile.
+CONTROL = np.dtype([('front', '<i8'), ('reading', '<i8')])
+HEADER = np.dtype([
+    ('level', '<i8'), ('map', 'S64'), ('ticks', '<i8'), ('tick_at', '<f8'), ('tick_interval', '<f8'), ('state', 'u1'),
+    ('lives', '<i4'), ('money', '<i4'), ('speed', '<f8'), ('current_wave', '<i4'), ('wave_timer', '<f8'),
+    ('wave_in_progress', 'u1'), ('enemies', '<u4'), ('projectiles', '<u4'), ('towers', '<u4'),
+])
+ENEMY = np.dtype([
+    ('type', 'u1'), ('x', '<f4'), ('y', '<f4'), ('prev_x', '<f4'), ('prev_y', '<f4'), ('hp', '<f4'), ('max_hp', '<f4'),
+])
+PROJECTILE = np.dtype([
+    ('type', 'u1'), ('element', 'i1'), ('x', '<f4'), ('y', '<f4'), ('prev_x', '<f4'), ('prev_y', '<f4'),
+])
+TOWER = np.dtype([('spot', '<u2'), ('type', 'u1'), ('element', 'i1'), ('targeting', 'u1')])
+
+STATES = ("menu", "level select", "playing", "paused", "game_over", "victory")
+
+
+def _capacities():
+    return (GAME_CONFIG['sim_process_enemies'], GAME_CONFIG['sim_process_projectiles'],
+            GAME_CONFIG['sim_process_towers'])
+
+
+def _index(names, name):
+    return -1 if name is None else names.index(name)
+
+
+class SharedState:
+    """Numpy views of the control record and both frames in a shared memory buffer"""
+    def __init__(self, buf, capacities):
+        enemies, projectiles, towers = capacities
+        self.control = np.ndarray(1, CONTROL, buf, 0)
+        offset = CONTROL.itemsize
+        self.frames = []
+        for _ in range(2):
+            frame = {}
+            for name, dtype, count in (('header', HEADER, 1), ('enemies', ENEMY, enemies),
+                                       ('projectiles', PROJECTILE, projectiles), ('towers', TOWER, towers)):
+                frame[name] = np.ndarray(count, dtype, buf, offset)
+                offset += dtype.itemsize * count
+            self.frames.append(frame)
+
+    @staticmethod
+    def size(capacities):
+        enemies, projectiles, towers = capacities
+        frame = HEADER.itemsize + ENEMY.itemsize * enemies + PROJECTILE.itemsize * projectiles + TOWER.itemsize * towers
+        return CONTROL.itemsize + 2 * frame
+
+    # Renderer side
+
+    def acquire(self):
+        """Front frame, marked as being read so the simulation leaves it alone"""
+        control = self.control[0]
+        while True:
+            front = int(control['front'])
+            control['reading'] = front
+            if int(control['front']) == front:  # Not flipped before the mark landed
+                return self.frames[front]
+
+    def release(self):
+        self.control[0]['reading'] = -1
+
+    # Simulation side
+
+    def back(self):
+        """Index of the frame to write next, or None while the renderer is still reading it"""
+        control = self.control[0]
+        back = 1 - int(control['front'])
+        if int(control['reading']) == back:
+            return None
+        return back
+
+    def flip(self, back):
+        self.control[0]['front'] = back
+
+    def close(self):
+        """Drop every view, shared memory can only be closed once none are left"""
+        self.control = None
+        self.frames = []
+
+
+def _write_frame(frame, game, level, tick_at, tick_interval):
+    """Copy the drawable state of a game into a frame"""
+    enemy_types = {name: i for i, name in enumerate(ENEMY_CONFIG['types'])}
+    store = game.enemy_store
+    if store is not None:
+        # Live enemies fill the first store slots, their arrays are copied in one go
+        n = min(store.count, len(frame['enemies']))
+        enemies = store.enemies[:n]
+        records = frame['enemies'][:n]
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'hp', 'max_hp'):
+            records[name] = getattr(store, name)[:n]
+    else:
+        enemies = game.enemies.sprites()[:len(frame['enemies'])]
+        n = len(enemies)
+        records = frame['enemies'][:n]
+        records['x'] = [enemy.x for enemy in enemies]
+        records['y'] = [enemy.y for enemy in enemies]
+        records['prev_x'] = [enemy.prev_x for enemy in enemies]
+        records['prev_y'] = [enemy.prev_y for enemy in enemies]
+        records['hp'] = [enemy.hp for enemy in enemies]
+        records['max_hp'] = [enemy.max_hp for enemy in enemies]
+    records['type'] = [enemy_types[enemy.type] for enemy in enemies]
+
+    projectile_types = list(PROJECTILE_CONFIG)
+    elements = list(ELEMENTAL_EFFECTS)
+    projectiles = game.projectiles.sprites()[:len(frame['projectiles'])]
+    records = frame['projectiles'][:len(projectiles)]
+    records['type'] = [projectile_types.index(projectile.type) for projectile in projectiles]
+    records['element'] = [_index(elements, projectile.element) for projectile in projectiles]
+    records['x'] = [projectile.pos.x for projectile in projectiles]
+    records['y'] = [projectile.pos.y for projectile in projectiles]
+    records['prev_x'] = [projectile.prev_pos.x for projectile in projectiles]
+    records['prev_y'] = [projectile.prev_pos.y for projectile in projectiles]
+
+    tower_types = list(TOWER_CONFIG['type'])
+    upgrades = list(ELEMENTAL_UPGRADES)
+    modes = TOWER_CONFIG['targeting_modes']
+    towers = game.tower_manager.towers[:len(frame['towers'])]
+    records = frame['towers'][:len(towers)]
+    for i, tower in enumerate(towers):
+        records[i] = (tower.spot, tower_types.index(tower.type), _index(upgrades, tower.element),
+                      modes.index(tower.targeting_mode))
+
+    wave_manager = game.wave_manager
+    frame['header'][0] = (
+        level, game.current_map.map_id.encode(), game.ticks, tick_at, tick_interval, STATES.index(game.state), game.lives, game.money,
+        game.speed_factor, wave_manager.current_wave, wave_manager.wave_timer, wave_manager.wave_in_progress,
+        n, len(projectiles), len(towers),
+    )
+
+
+def run_simulation(memory_name, commands, record_path=None):
+    """Simulation process: tick a headless game in real time and publish every tick to shared memory
+
+    Messages on the commands queue are Game.apply_command tuples, or
+    ('start', map_id), ('state', 'playing' | 'paused'), ('save', path),
+    ('load', path) and ('quit',).
+    """
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from ..game import Game
+    from .savegame import load_game, save_game
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+    state = SharedState(memory.buf, _capacities())
+    game = Game(None)
+    game.record_path = record_path
+
+    level = 0  # Levels started or loaded, tells the renderer which frames are current
+    tick_dt = game.tick_dt
+    next_tick = time.perf_counter()
+    tick_at = next_tick
+    tick_interval = tick_dt
+    running = True
+    while running:
+        while True:
+            try:
+                message = commands.get_nowait()
+            except queue.Empty:
+                break
+            action = message[0]
+            if action == 'quit':
+                running = False
+                break
+            if action == 'start':
+                game.start_level(message[1])
+                level += 1
+            elif action == 'state':
+                if game.state in ("playing", "paused"):
+                    game.state = message[1]
+            elif action == 'save':
+                save_game(game, message[1])
+                print(f"Game saved to {message[1]}")
+            elif action == 'load':
+                load_game(game, message[1])
+                level += 1
+            else:
+                game.apply_command(message)
+
+        ticks = game.ticks
+        game.update(tick_dt)
+        now = time.perf_counter()
+        if game.ticks != ticks:
+            tick_interval = now - tick_at
+            tick_at = now
+
+        # Skipped while the renderer holds the back frame, the next tick publishes instead
+        back = state.back()
+        if back is not None:
+            _write_frame(state.frames[back], game, level, tick_at, tick_interval)
+            state.flip(back)
+
+        next_tick += tick_dt
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -GAME_CONFIG['max_ticks_per_frame'] * tick_dt:
+            next_tick = time.perf_counter()  # Too far behind to catch up, drop the backlog
+
+    game.save_recording()
+    state.close()
+    memory.close()
+
+
+class SimulationProcess:
+    """Renderer side of the out-of-process simulation
+
+    Attached to a windowed Game as game.remote: its commands go to the
+    simulation process and its HUD, towers, enemies and projectiles come
+    from the shared frames, the local game never ticks.
+    """
+    def __init__(self, record_path=None):
+        capacities = _capacities()
+        self.memory = shared_memory.SharedMemory(create=True, size=SharedState.size(capacities))
+        self.state = SharedState(self.memory.buf, capacities)
+        self.state.control[0] = (0, -1)  # Frames start zeroed, level 0 is never current
+
+        # Spawned, not forked: the child must not inherit the window
+        context = multiprocessing.get_context('spawn')
+        self.commands = context.Queue()
+        self.process = context.Process(target=run_simulation, args=(self.memory.name, self.commands, record_path),
+                                       daemon=True)
+        self.level = 0
+        self.loading = None      # Path of a load sent, its map is only known from the first frame after it
+        self.frame = None        # Frame held between Game.update and the end of Game.draw
+        self.sent_state = None   # Last playing/paused state sent
+        self.towers = None       # Tower records the local towers were last synced to
+
+        self.enemy_types = list(ENEMY_CONFIG['types'])
+        self.tower_types = list(TOWER_CONFIG['type'])
+        self.upgrades = list(ELEMENTAL_UPGRADES)
+        self.modes = TOWER_CONFIG['targeting_modes']
+        self.projectile_images = []  # [type][element + 1] -> (image, half size)
+        elements = list(ELEMENTAL_EFFECTS)
+        for stats in PROJECTILE_CONFIG.values():
+            colors = [stats['color']] + [ELEMENTAL_EFFECTS[element]['color'] for element in elements]
+            self.projectile_images.append([(stats['size'], color) for color in colors])
+
+    def start(self):
+        self.process.start()
+
+    def send(self, message):
+        self.commands.put(message)
+        return True
+
+    def start_level(self, map_id):
+        self.level += 1
+        self.send(('start', map_id))
+        self._reset_view()
+        self.loading = None  # A load still in flight is superseded
+
+    def load(self, path):
+        """Load a save in the simulation, the local game follows once its frames arrive"""
+        self.level += 1
+        self.send(('load', path))
+        self._reset_view()
+        self.loading = path
+
+    def _reset_view(self):
+        self.sent_state = "playing"
+        self.towers = None
+
+    def stop(self):
+        """Quit the simulation process and free the shared memory"""
+        self.release()
+        if self.process.is_alive():
+            self.send(('quit',))
+            self.process.join(5.0)
+        self.state.close()
+        self.memory.close()
+        self.memory.unlink()
+
+    def sync(self, game):
+        """Hold the front frame and copy its HUD numbers, state and towers into the local game"""
+        if not self.process.is_alive():
+            raise RuntimeError("Simulation process exited")
+        if game.state not in ("playing", "paused") and self.loading is None:
+            return
+        if game.state != self.sent_state and self.loading is None:
+            self.send(('state', game.state))  # Esc pauses and resumes the simulation too
+            self.sent_state = game.state
+
+        self.release()
+        frame = self.state.acquire()
+        header = frame['header'][0]
+        if header['level'] != self.level:
+            self.release()  # Still showing the previous level
+            return
+        self.frame = frame
+
+        if self.loading is not None:
+            # The simulation has loaded the save: switch to its map, towers and numbers come from the frame
+            game.enter_level(header['map'].decode())
+            print(f"Game loaded from {self.loading}")
+            self.loading = None
+
+        game.ticks = int(header['ticks'])
+        game.lives = int(header['lives'])
+        game.money = int(header['money'])
+        game.speed_factor = float(header['speed'])
+        wave_manager = game.wave_manager
+        wave_manager.current_wave = int(header['current_wave'])
+        wave_manager.wave_timer = float(header['wave_timer'])
+        wave_manager.wave_in_progress = bool(header['wave_in_progress'])
+        state = STATES[header['state']]
+        if state in ("game_over", "victory"):
+            game.state = state
+
+        towers = frame['towers'][:header['towers']]
+        if self.towers is None or not np.array_equal(towers, self.towers):
+            self._sync_towers(game.tower_manager, towers)
+            self.towers = towers.copy()
+
+        if game.state == "playing":
+            elapsed = time.perf_counter() - header['tick_at']
+            game.render_alpha = min(max(elapsed / header['tick_interval'], 0.0), 1.0)
+        else:
+            game.render_alpha = 1.0
+
+    def _sync_towers(self, tower_manager, records):
+        """Rebuild the local towers that differ from the simulation's"""
+        wanted = {}
+        for spot, tower_type, element, targeting in records.tolist():
+            wanted[spot] = (self.tower_types[tower_type], None if element < 0 else self.upgrades[element],
+                            self.modes[targeting])
+        for tower in list(tower_manager.towers):
+            if wanted.get(tower.spot, (None, None))[:2] != (tower.type, tower.element):
+                tower_manager.remove_tower(tower)
+        for spot, (tower_type, element, targeting) in wanted.items():
+            tower = tower_manager.tower_at(spot)
+            if tower is None:
+                tower = tower_manager.add_tower(spot, tower_type)
+                if element:
+                    tower.upgrade(element)
+            tower.set_targeting_mode(targeting)
+
+    def release(self):
+        """Let the simulation write the held frame again"""
+        self.frame = None
+        self.state.release()
+
+    def draw_enemies(self, surface, alpha):
+        if self.frame is None:
+            return []
+        records = self.frame['enemies'][:self.frame['header'][0]['enemies']]
+        prev_x = records['prev_x']
+        prev_y = records['prev_y']
+        xs = (prev_x + (records['x'] - prev_x) * alpha).astype(np.int64)
+        ys = (prev_y + (records['y'] - prev_y) * alpha).astype(np.int64)
+        blits = get_enemy_atlas().blit_arrays(records['type'], xs, ys, records['hp'] / records['max_hp'])
+        return surface.blits(blits)
+
+    def draw_projectiles(self, surface, alpha):
+        if self.frame is None:
+            return []
+        records = self.frame['projectiles'][:self.frame['header'][0]['projectiles']]
+        prev_x = records['prev_x']
+        prev_y = records['prev_y']
+        xs = prev_x + (records['x'] - prev_x) * alpha
+        ys = prev_y + (records['y'] - prev_y) * alpha
+        images = self.projectile_images
+        blits = []
+        for projectile_type, element, x, y in zip(records['type'].tolist(), records['element'].tolist(),
+                                                  xs.tolist(), ys.tolist()):
+            size, color = images[projectile_type][element + 1]
+            offset = (size + 2) // 2  # At the top left of the projectile's rect, which is 2px larger
+            blits.append((_projectile_image(size, color), (int(x) - offset, int(y) - offset)))
+        return surface.blits(blits)
@@ -0,0 +1,71 @@
+import contextlib
+import os
+import time
+
+# Keep pygame quiet and away from any real video device
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from .recorder import config_digest, load_recording, state_hash
+from .savegame import restore
+from ..game import Game
+
+
+class ReplayRunner:
+    """Feeds a recording back into a headless game as fast as possible, checking state hashes"""
+    def __init__(self, path, verify=True, to_end=False, quiet=True):
+        self.header, self.commands, self.hashes, self.snapshot = load_recording(path)
+        self.verify = verify    # Compare the state hash after every recorded tick
+        self.to_end = to_end    # Keep simulating past the recording until the game ends
+        self.quiet = quiet
+
+    def run(self):
+        """Replay the recording, returns a report with the first divergent tick (if any)"""
+        if self.quiet:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                return self._run()
+        return self._run()
+
+    def _run(self):
+        game = Game(None, self.header['enemy_engine'])
+        if self.snapshot:
+            restore(game, self.snapshot)  # Recorded after loading a save, start from the same state
+        else:
+            game.start_level(self.header['map'])
+        game.tick_dt = self.header['tick_dt']
+
+        commands = self.commands
+        hashes = self.hashes
+        start_tick = self.header['start_tick']
+        next_command = 0
+        diverged_at = None
+        max_ticks = start_tick + len(hashes) if not self.to_end else float('inf')
+        started = time.perf_counter()
+
+        while game.state == "playing" and game.ticks < max_ticks:
+            # Commands recorded on tick t were applied before tick t ran
+            while next_command < len(commands) and commands[next_command][0] <= game.ticks:
+                game.apply_command(commands[next_command][1])
+                next_command += 1
+
+            game.tick()
+            tick = game.ticks - 1
+            index = tick - start_tick
+            if self.verify and diverged_at is None and index < len(hashes) and state_hash(game) != hashes[index]:
+                diverged_at = tick
+        wall_time = time.perf_counter() - started
+
+        return {
+            'map': self.header['map'],
+            'config_matches': self.header['config_digest'] == config_digest(),
+            'commands': len(commands),
+            'commands_applied': next_command,
+            'recorded_ticks': len(hashes),
+            'ticks': game.ticks,
+            'diverged_at': diverged_at,
+            'result': game.state,
+            'lives': game.lives,
+            'money': game.money,
+            'wall_time': wall_time,
+            'ticks_per_second': game.ticks / wall_time if wall_time > 0 else 0.0,
+        }
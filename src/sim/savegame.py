@@ -0,0 +1,200 @@
+import json
+import struct
+import zlib
+import numpy as np
+import pygame
+from ..entities.effect_store import EFFECT_KINDS
+from ..config.enemy_config import ENEMY_CONFIG
+from ..config.projectile_config import PROJECTILE_CONFIG
+from ..config.tower_config import ELEMENTAL_UPGRADES, TOWER_CONFIG
+
+# Save file layout (little endian):
+#   magic, version (u16), header length (u32), zlib'd JSON header with scalars and name tables
+#   then one section per entity kind: count (u32) followed by count packed records
+MAGIC = b'MFSV'
+VERSION = 3
+
+ENEMY = np.dtype([
+    ('type', 'u1'), ('x', '<f8'), ('y', '<f8'), ('prev_x', '<f8'), ('prev_y', '<f8'), ('dx', '<f8'), ('dy', '<f8'),
+    ('hp', '<f8'), ('speed', '<f8'),
+])
+EFFECT = np.dtype([
+    ('enemy', '<u4'), ('kind', 'u1'), ('remaining', '<f8'), ('magnitude', '<f8'), ('timer', '<f8'), ('source', 'i1'),
+])
+TOWER = np.dtype([
+    ('spot', '<u2'), ('type', 'u1'), ('element', 'i1'), ('targeting', 'u1'), ('fire_timer', '<f8'), ('target', '<i4'),
+])
+PROJECTILE = np.dtype([
+    ('type', 'u1'), ('element', 'i1'), ('source', 'i1'), ('x', '<f8'), ('y', '<f8'), ('prev_x', '<f8'),
+    ('prev_y', '<f8'), ('dx', '<f8'), ('dy', '<f8'), ('target_x', '<f8'), ('target_y', '<f8'), ('lifetime', '<f8'),
+])
+SECTIONS = (ENEMY, EFFECT, TOWER, PROJECTILE)
+
+WAVE_FIELDS = ('current_wave', 'spawned', 'wave_time', 'wave_timer', 'wave_in_progress', 'next_spawn')
+
+
+def _index(names, name):
+    return -1 if name is None else names.index(name)
+
+
+def _name(names, index):
+    return None if index < 0 else names[index]
+
+
+def snapshot(game):
+    """Serialize the complete simulation state of a game to bytes"""
+    enemy_types = list(ENEMY_CONFIG['types'])
+    tower_types = list(TOWER_CONFIG['type'])
+    elements = list(ELEMENTAL_UPGRADES)
+    projectile_types = list(PROJECTILE_CONFIG)
+    modes = TOWER_CONFIG['targeting_modes']
+
+    enemies = game.enemies.sprites()
+    enemy_index = {enemy: i for i, enemy in enumerate(enemies)}
+    enemy_data = np.zeros(len(enemies), ENEMY)
+    for i, enemy in enumerate(enemies):
+        enemy_data[i] = (enemy_types.index(enemy.type), enemy.x, enemy.y, enemy.prev_x, enemy.prev_y,
+                         *enemy.direction, enemy.hp, enemy.speed)
+
+    effects = game.effect_store
+    n = effects.count
+    effect_data = np.zeros(n, EFFECT)
+    effect_data['enemy'] = [enemy_index[owner] for owner in effects.owners[:n]]
+    effect_data['kind'] = effects.kind[:n]
+    effect_data['remaining'] = effects.remaining[:n]
+    effect_data['magnitude'] = effects.magnitude[:n]
+    effect_data['timer'] = effects.timer[:n]
+    effect_data['source'] = [_index(tower_types, source) for source in effects.sources[:n]]
+
+    towers = game.tower_manager.towers
+    tower_data = np.zeros(len(towers), TOWER)
+    for i, tower in enumerate(towers):
+        target = -1 if tower.target is None else enemy_index[tower.target]
+        tower_data[i] = (tower.spot, tower_types.index(tower.type), _index(elements, tower.element),
+                         modes.index(tower.targeting_mode), tower.fire_timer, target)
+
+    projectiles = game.projectiles.sprites()
+    projectile_data = np.zeros(len(projectiles), PROJECTILE)
+    for i, projectile in enumerate(projectiles):
+        projectile_data[i] = (projectile_types.index(projectile.type), _index(elements, projectile.element),
+                              _index(tower_types, projectile.source), projectile.pos.x, projectile.pos.y,
+                              projectile.prev_pos.x, projectile.prev_pos.y, projectile.direction.x,
+                              projectile.direction.y, projectile.target.x, projectile.target.y, projectile.lifetime)
+
+    wave_manager = game.wave_manager
+    header = zlib.compress(json.dumps({
+        'map': game.current_map.map_id,
+        'lives': game.lives,
+        'money': game.money,
+        'speed_factor': game.speed_factor,
+        'ticks': game.ticks,
+        'tick_accumulator': game.tick_accumulator,
+        'enemies_killed': game.enemies_killed,
+        'enemies_leaked': game.enemies_leaked,
+        'kills_by_tower': game.kills_by_tower,
+        'selected_tower_type': game.tower_manager.selected_tower_type,
+        'selected_upgrade_type': game.tower_manager.selected_upgrade_type,
+        'wave': {field: getattr(wave_manager, field) for field in WAVE_FIELDS},
+        'enemy_types': enemy_types,
+        'tower_types': tower_types,
+        'elements': elements,
+        'projectile_types': projectile_types,
+        'effect_kinds': list(EFFECT_KINDS),
+        'targeting_modes': modes,
+    }).encode())
+
+    parts = [MAGIC, struct.pack('<HI', VERSION, len(header)), header]
+    for data in (enemy_data, effect_data, tower_data, projectile_data):
+        parts.append(struct.pack('<I', len(data)))
+        parts.append(data.tobytes())
+    return b''.join(parts)
+
+
+def restore(game, data):
+    """Replace the game's state with a snapshot, restarting its level"""
+    if data[:4] != MAGIC:
+        raise ValueError("Not a save file")
+    version, header_size = struct.unpack_from('<HI', data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+    offset = 10
+    header = json.loads(zlib.decompress(data[offset:offset + header_size]))
+    offset += header_size
+    sections = []
+    for dtype in SECTIONS:
+        (count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        sections.append(np.frombuffer(data, dtype, count, offset))
+        offset += count * dtype.itemsize
+    enemy_data, effect_data, tower_data, projectile_data = sections
+
+    game.start_level(header['map'])
+    for name in ('lives', 'money', 'speed_factor', 'ticks', 'tick_accumulator', 'enemies_killed',
+                 'enemies_leaked', 'kills_by_tower'):
+        setattr(game, name, header[name])
+    game.tower_manager.selected_tower_type = header['selected_tower_type']
+    game.tower_manager.selected_upgrade_type = header['selected_upgrade_type']
+
+    # Enemies, in their original update order
+    enemy_types = header['enemy_types']
+    enemies = []
+    for record in enemy_data.tolist():
+        enemy_type, x, y, prev_x, prev_y, dx, dy, hp, speed = record
+        enemy = game.wave_manager._spawn_enemy(enemy_types[enemy_type])
+        enemy.place(x, y)
+        enemy.prev_x, enemy.prev_y = prev_x, prev_y
+        enemy.direction = (dx, dy)  # Direction of the last step, used to lead shots
+        enemy.hp = hp
+        enemy.speed = speed
+        game.enemies.add(enemy)
+        enemies.append(enemy)
+    game.collision_manager.sync_enemies()
+
+    # Wave progress after the spawns above, which advance the spawn point rotation
+    for field, value in header['wave'].items():
+        setattr(game.wave_manager, field, value)
+    game.wave_manager.restore_timeline()
+
+    effect_kinds = header['effect_kinds']
+    tower_types = header['tower_types']
+    for enemy, kind, remaining, magnitude, timer, source in effect_data.tolist():
+        game.effect_store.add_row(enemies[enemy], EFFECT_KINDS.index(effect_kinds[kind]), remaining, magnitude,
+                                  timer, _name(tower_types, source))
+
+    elements = header['elements']
+    modes = header['targeting_modes']
+    for spot, tower_type, element, targeting, fire_timer, target in tower_data.tolist():
+        tower = game.tower_manager.add_tower(spot, tower_types[tower_type])
+        if element >= 0:
+            tower.upgrade(elements[element])
+        tower.set_targeting_mode(modes[targeting])
+        tower.fire_timer = fire_timer
+        if target >= 0:
+            tower.target = enemies[target]
+
+    projectile_types = header['projectile_types']
+    for record in projectile_data.tolist():
+        projectile_type, element, source, x, y, prev_x, prev_y, dx, dy, target_x, target_y, lifetime = record
+        projectile = game.projectile_pool.acquire((x, y), None, projectile_types[projectile_type])
+        if element >= 0:
+            projectile.set_element(elements[element])
+        projectile.source = _name(tower_types, source)
+        projectile.prev_pos.update(prev_x, prev_y)
+        projectile.direction = pygame.math.Vector2(dx, dy)
+        projectile.target = pygame.math.Vector2(target_x, target_y)
+        projectile.lifetime = lifetime
+        game.projectiles.add(projectile)
+
+    if game.recorder is not None:
+        game.recorder.start_from(data, game.ticks)  # start_level began a recording of a fresh level
+    return game
+
+
+def save_game(game, path):
+    with open(path, 'wb') as file:
+        file.write(snapshot(game))
+
+
+def load_game(game, path):
+    with open(path, 'rb') as file:
+        return restore(game, file.read())
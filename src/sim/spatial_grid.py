@@ -0,0 +1,67 @@
+import math
+import numpy as np
+
+class SpatialGrid:
+    """Uniform grid of item buckets, updated incrementally as items change cell
+
+    Buckets are insertion-ordered dicts so queries are deterministic.
+    Items are bucketed by their center; callers widen queries by the item radius.
+    """
+    def __init__(self, cell_size, width, height):
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cells = [{} for _ in range(self.cols * self.rows)]
+        self.item_keys = {}  # Item -> cell key
+
+    def __len__(self):
+        return len(self.item_keys)
+
+    def __contains__(self, item):
+        return item in self.item_keys
+
+    def key_for(self, x, y):
+        """Cell key for a point, points outside the grid clamp to the border cells"""
+        cx = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        cy = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return cy * self.cols + cx
+
+    def keys_for(self, xs, ys):
+        """Vectorized key_for over coordinate arrays"""
+        cx = np.clip(np.floor_divide(xs, self.cell_size), 0, self.cols - 1).astype(np.int64)
+        cy = np.clip(np.floor_divide(ys, self.cell_size), 0, self.rows - 1).astype(np.int64)
+        return cy * self.cols + cx
+
+    def move(self, item, key):
+        """Insert item into cell key, or relocate it if it is in another cell"""
+        old_key = self.item_keys.get(item)
+        if old_key == key:
+            return
+        if old_key is not None:
+            del self.cells[old_key][item]
+        self.cells[key][item] = None
+        self.item_keys[item] = key
+
+    def remove(self, item):
+        key = self.item_keys.pop(item, None)
+        if key is not None:
+            del self.cells[key][item]
+
+    def query_rect(self, x0, y0, x1, y1):
+        """Items bucketed in cells overlapping the rectangle (broadphase only)"""
+        cs = self.cell_size
+        cx0 = min(max(int(x0 // cs), 0), self.cols - 1)
+        cx1 = min(max(int(x1 // cs), 0), self.cols - 1)
+        cy0 = min(max(int(y0 // cs), 0), self.rows - 1)
+        cy1 = min(max(int(y1 // cs), 0), self.rows - 1)
+        found = []
+        for row in range(cy0, cy1 + 1):
+            base = row * self.cols
+            for key in range(base + cx0, base + cx1 + 1):
+                if self.cells[key]:
+                    found.extend(self.cells[key])
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Items bucketed in cells overlapping the circle's bounding box"""
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
@@ -0,0 +1,92 @@
+import contextlib
+import os
+import time
+
+# Keep pygame quiet and away from any real video device
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from ..game import Game
+
+# Phases timed separately, in tick order
+PHASES = ('enemies', 'towers', 'projectiles')
+
+
+def populate_enemies(game, count, enemy_type='tank', spread=0.5, hp_scale=1):
+    """Add count enemies evenly spaced over the first spread of the (first) path, with hp_scale times their hp"""
+    path = game.current_map.get_path()
+    for i in range(count):
+        enemy = game.wave_manager._spawn_enemy(enemy_type)
+        enemy.hp = enemy.max_hp * hp_scale
+        enemy.place(*path.position_at(path.length * spread * i / max(count, 1)))
+        game.enemies.add(enemy)
+    game.collision_manager.sync_enemies()
+
+
+class StormStress:
+    """Every tower spot fires elemental shots into a dense, slow wave spread along the path
+
+    Waves are not spawned by the wave manager: the whole crowd is placed up
+    front so the enemy count stays (nearly) constant while the phases are timed.
+    """
+    def __init__(self, enemy_count, map_id='level_2', tower_type='rapid', element='storm', enemy_type='tank',
+                 hp_scale=20, spread=0.5, ticks=600, enemy_engine=None):
+        self.enemy_count = enemy_count
+        self.map_id = map_id
+        self.tower_type = tower_type
+        self.element = element          # None runs the same scenario without the upgrade
+        self.enemy_type = enemy_type
+        self.hp_scale = hp_scale        # Enemies get this many times their hp so the crowd survives
+        self.spread = spread            # Fraction of the path the crowd is spread over
+        self.ticks = ticks
+        self.enemy_engine = enemy_engine
+
+    def run(self):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return self._run()
+
+    def _run(self):
+        game = Game(None, self.enemy_engine)
+        game.start_level(self.map_id)
+        dt = game.tick_dt
+
+        # A tower on every spot
+        game.money = 10 ** 9
+        tower_manager = game.tower_manager
+        for spot in range(len(game.current_map.get_tower_points())):
+            tower_manager.place_tower(spot, self.tower_type)
+        if self.element:
+            for tower in tower_manager.towers:
+                tower_manager.upgrade_tower(tower, self.element)
+
+        # The crowd, evenly spaced over the first part of the path
+        populate_enemies(game, self.enemy_count, self.enemy_type, self.spread, self.hp_scale)
+
+        timings = dict.fromkeys(PHASES, 0.0)
+        peak_projectiles = 0
+        started = time.perf_counter()
+        for _ in range(self.ticks):
+            t0 = time.perf_counter()
+            game._update_enemies(dt)
+            t1 = time.perf_counter()
+            tower_manager.update(dt)
+            t2 = time.perf_counter()
+            game._update_projectiles(dt)
+            t3 = time.perf_counter()
+            timings['enemies'] += t1 - t0
+            timings['towers'] += t2 - t1
+            timings['projectiles'] += t3 - t2
+            peak_projectiles = max(peak_projectiles, len(game.projectiles))
+        wall_time = time.perf_counter() - started
+
+        return {
+            'enemies': self.enemy_count,
+            'element': self.element,
+            'towers': len(tower_manager.towers),
+            'ticks': self.ticks,
+            'enemies_left': len(game.enemies),
+            'peak_projectiles': peak_projectiles,
+            'wall_time': wall_time,
+            'ms_per_tick': 1000 * wall_time / self.ticks,
+            'phase_ms_per_tick': {phase: 1000 * total / self.ticks for phase, total in timings.items()},
+        }
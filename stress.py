@@ -0,0 +1,32 @@
+import argparse
+import json
+from src.sim.stress import PHASES, StormStress
+
+def main():
+    parser = argparse.ArgumentParser(description='Storm chain lightning stress test: every spot fires into a dense wave')
+    parser.add_argument('--map', default='level_2', help='Map id from MAPS')
+    parser.add_argument('--enemies', type=int, nargs='+', default=[100, 250, 500, 1000], help='Crowd sizes to run')
+    parser.add_argument('--tower', default='rapid', help='Tower type on every spot')
+    parser.add_argument('--ticks', type=int, default=600, help='Simulation ticks per run')
+    parser.add_argument('--enemy-engine', choices=['sprite', 'array'], help='Enemy update engine')
+    parser.add_argument('--json', action='store_true', help='Print the reports as JSON')
+    args = parser.parse_args()
+
+    # Every crowd size with and without the storm upgrade, to isolate the cost of chaining
+    reports = []
+    for count in args.enemies:
+        for element in (None, 'storm'):
+            stress = StormStress(count, args.map, args.tower, element, ticks=args.ticks,
+                                 enemy_engine=args.enemy_engine)
+            reports.append(stress.run())
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return
+    print(f"{'enemies':>8} {'element':>8} {'ms/tick':>8} " + ' '.join(f"{phase:>12}" for phase in PHASES))
+    for report in reports:
+        phases = ' '.join(f"{report['phase_ms_per_tick'][phase]:12.3f}" for phase in PHASES)
+        print(f"{report['enemies']:>8} {report['element'] or '-':>8} {report['ms_per_tick']:8.3f} {phases}")
+
+if __name__ == "__main__":
+    main()
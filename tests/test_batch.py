@@ -0,0 +1,80 @@
+import copy
+
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.config.tower_config import TOWER_CONFIG
+from src.config.wave_config import WAVE_CONFIG
+from src.entities.map import MAPS
+from src.sim.batch import apply_override, expand_grid, run_scenario
+
+
+def test_expand_grid_covers_every_combination():
+    grid = {
+        'maps': ['level_1', 'level_2'],
+        'layouts': {'empty': [], 'one': ['4:basic']},
+        'overrides': {'default': {}, 'rich': {'GAME_CONFIG.starting_money': 500}},
+        'repeat': 2,
+        'max_time': 60.0,
+    }
+    scenarios = expand_grid(grid)
+    assert len(scenarios) == 2 * 2 * 2 * 2
+    assert [scenario['id'] for scenario in scenarios] == list(range(16))
+    combos = {(s['map'], s['layout'], s['override'], s['run']) for s in scenarios}
+    assert len(combos) == 16
+    rich = next(s for s in scenarios if s['override'] == 'rich')
+    assert rich['overrides'] == {'GAME_CONFIG.starting_money': 500}
+    assert all(s['max_time'] == 60.0 for s in scenarios)
+
+
+def test_expand_grid_defaults():
+    (scenario,) = expand_grid({'maps': ['level_1']})
+    assert (scenario['layout'], scenario['placements']) == ('empty', [])
+    assert (scenario['override'], scenario['overrides']) == ('default', {})
+    assert scenario['run'] == 0
+
+
+def test_apply_override_sets_nested_values(monkeypatch):
+    monkeypatch.setitem(TOWER_CONFIG, 'type', copy.deepcopy(TOWER_CONFIG['type']))
+    monkeypatch.setitem(WAVE_CONFIG, 'waves', copy.deepcopy(WAVE_CONFIG['waves']))
+    apply_override('TOWER_CONFIG.type.cannon.range', 999)
+    apply_override('WAVE_CONFIG.waves.0.groups.1.count', 3)  # List items by index
+    assert TOWER_CONFIG['type']['cannon']['range'] == 999
+    assert WAVE_CONFIG['waves'][0]['groups'][1]['count'] == 3
+
+
+@pytest.mark.parametrize('path', ['NO_CONFIG.tick_rate', 'GAME_CONFIG'])
+def test_apply_override_rejects_unknown_paths(path):
+    with pytest.raises(KeyError):
+        apply_override(path, 1)
+
+
+def _run(overrides):
+    scenario = expand_grid({'maps': ['level_1'], 'layouts': {'one': ['4:basic']}})[0]
+    scenario['overrides'] = overrides
+    _, report, error = run_scenario(scenario)
+    assert error is None
+    return report
+
+
+def test_run_scenario_applies_tick_rate_overrides():
+    default = _run({})
+    slow = _run({'GAME_CONFIG.tick_rate': GAME_CONFIG['tick_rate'] // 2})
+    assert slow['ticks'] < default['ticks']
+    assert slow['sim_time'] == pytest.approx(default['sim_time'], abs=1.0)
+    assert _run({})['ticks'] == default['ticks']  # Restored for the next scenario
+
+
+def test_run_scenario_rebakes_maps_for_bake_overrides():
+    cell_size = GAME_CONFIG['flow_cell_size']
+    default = _run({})
+    coarse = _run({'GAME_CONFIG.flow_cell_size': cell_size * 2})
+    assert coarse['ticks'] != default['ticks']
+    assert MAPS['level_1'].flow_field.cell_size == cell_size
+
+
+def test_run_scenario_reports_errors():
+    scenario = expand_grid({'maps': ['no_such_map']})[0]
+    _, report, error = run_scenario(scenario)
+    assert report is None
+    assert error.startswith('KeyError')
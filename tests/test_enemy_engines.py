@@ -0,0 +1,29 @@
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.sim.headless import HeadlessRunner, parse_placement
+
+LAYOUT = ['12:cannon', '13:cannon', '30:cannon', '31:cannon:pyro', '20:cannon:glacier', '41:anti-air',
+          '1:rapid', '2:sniper', '22:basic:storm']
+
+
+def _report(enemy_engine):
+    placements = [parse_placement(text) for text in LAYOUT]
+    report = HeadlessRunner('level_2', placements, max_time=300.0, enemy_engine=enemy_engine).run()
+    for key in ('wall_time', 'ticks_per_second', 'pools'):
+        del report[key]
+    return report
+
+
+def test_engines_produce_identical_reports(monkeypatch):
+    monkeypatch.setitem(GAME_CONFIG, 'starting_money', 3000)
+    sprite = _report('sprite')
+    assert sprite['waves'], "no wave was played"
+    assert _report('array') == sprite
+
+
+@pytest.mark.parametrize('enemy_engine', ['sprite', 'array'])
+def test_engine_argument_leaves_config_alone(enemy_engine):
+    default = GAME_CONFIG['enemy_engine']
+    HeadlessRunner('level_1', max_time=5.0, enemy_engine=enemy_engine).run()
+    assert GAME_CONFIG['enemy_engine'] == default
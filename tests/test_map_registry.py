@@ -0,0 +1,94 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.entities.map import MapRegistry
+
+LEVEL = {
+    'name': 'Test Level',
+    'path_points': [[100, 100], [450, 100], [450, 400], [700, 400]],
+    'tower_points': [[150, 150], [200, 150], [500, 300, 40, 40]],
+}
+
+
+def _registry(tmp_path, levels):
+    maps = tmp_path / 'maps'
+    maps.mkdir(exist_ok=True)
+    for map_id, level in levels.items():
+        (maps / f'{map_id}.json').write_text(level if isinstance(level, str) else json.dumps(level))
+    return MapRegistry([str(maps)], str(tmp_path / 'cache'))
+
+
+def _cache_files(tmp_path):
+    return sorted(os.listdir(tmp_path / 'cache'))
+
+
+def test_discovery_lists_files_without_loading(tmp_path):
+    registry = _registry(tmp_path, {'b': LEVEL, 'a': LEVEL})
+    assert sorted(registry) == ['a', 'b'] and 'a' in registry and len(registry) == 2
+    assert registry.maps == {}
+    assert not (tmp_path / 'cache').exists()
+
+
+def test_baked_data_is_cached_by_file_and_settings(tmp_path, monkeypatch):
+    level = _registry(tmp_path, {'test': LEVEL})['test']
+    assert level.name == 'Test Level'
+    assert level.tower_points[2] == (500, 300, 40, 40)
+    (cached,) = _cache_files(tmp_path)
+
+    # Same file and settings: the cache is used, another registry reads the same file
+    again = _registry(tmp_path, {'test': LEVEL}).load('test')
+    assert _cache_files(tmp_path) == [cached]
+    assert again.tower_points == level.tower_points
+    assert np.array_equal(again.flow_field.distance, level.flow_field.distance)
+
+    # A changed file or bake setting gets a key of its own
+    _registry(tmp_path, {'test': dict(LEVEL, name='Renamed')}).load('test')
+    assert len(_cache_files(tmp_path)) == 2
+    monkeypatch.setitem(GAME_CONFIG, 'flow_cell_size', GAME_CONFIG['flow_cell_size'] * 2)
+    coarse = _registry(tmp_path, {'test': LEVEL}).load('test')
+    assert len(_cache_files(tmp_path)) == 3
+    assert coarse.flow_field.cell_size == GAME_CONFIG['flow_cell_size']
+
+
+@pytest.mark.parametrize('damage', ['truncate', 'drop_array'])
+def test_damaged_cache_is_baked_again(tmp_path, damage):
+    registry = _registry(tmp_path, {'test': LEVEL})
+    level = registry.load('test')
+    (cached,) = _cache_files(tmp_path)
+    path = tmp_path / 'cache' / cached
+    if damage == 'truncate':
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) // 2])
+    else:
+        with np.load(path) as baked:
+            arrays = {key: baked[key] for key in baked.files if key != 'spot_path_distances'}
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+
+    rebaked = registry.load('test')
+    assert rebaked.spot_path_distances == level.spot_path_distances
+    assert _cache_files(tmp_path) == [cached]  # Rewritten in place, no temp files left behind
+    with np.load(path) as baked:
+        assert 'spot_path_distances' in baked.files
+
+
+@pytest.mark.parametrize('content, reason', [
+    ('{"tower_points": ', 'Expecting value'),
+    (json.dumps({'path_points': LEVEL['path_points']}), "missing 'tower_points'"),
+    (json.dumps({'tower_points': LEVEL['tower_points']}), "no points in 'path_points' or 'paths'"),
+    (json.dumps(dict(LEVEL, tower_points=[7])), ''),
+])
+def test_invalid_map_files_raise_value_error(tmp_path, content, reason):
+    registry = _registry(tmp_path, {'broken': content, 'good': LEVEL})
+    with pytest.raises(ValueError, match='Invalid map file .*broken.json') as error:
+        registry['broken']
+    assert reason in str(error.value)
+    assert list(registry.broken) == ['broken']
+    assert registry['good'].name == 'Test Level'  # The other maps still load
+
+    registry.discover()
+    assert registry.broken == {}  # Tried again after a rescan
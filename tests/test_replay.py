@@ -0,0 +1,74 @@
+import contextlib
+import io
+
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.game import Game
+from src.sim.recorder import load_recording
+from src.sim.replay import ReplayRunner
+
+# (tick, command) applied while recording
+SCRIPT = [
+    (0, ('place', 4, 'basic')),
+    (0, ('place', 5, 'rapid')),
+    (200, ('target', 4)),
+    (400, ('speed', 2.0)),
+    (900, ('upgrade', 4, 'pyro')),
+    (1300, ('sell', 5)),
+    (1500, ('place', 6, 'cannon')),
+    (1800, ('speed', 0.5)),
+]
+
+
+@pytest.fixture(autouse=True)
+def rich(monkeypatch):
+    """Enough money for every scripted command to go through"""
+    monkeypatch.setitem(GAME_CONFIG, 'starting_money', 1000)
+
+
+def _record(path, enemy_engine, ticks=2400):
+    game = Game(None, enemy_engine)
+    game.record_path = str(path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_level('level_1')
+        script = list(SCRIPT)
+        while game.ticks < ticks and game.state == "playing":
+            while script and script[0][0] <= game.ticks:
+                game.apply_command(script.pop(0)[1])
+            game.tick()
+        game.save_recording()
+    return game
+
+
+def test_recording_round_trips_commands(tmp_path):
+    path = tmp_path / 'game.mfr'
+    game = _record(path, 'sprite')
+    header, commands, hashes, snapshot = load_recording(path)
+    assert header['map'] == 'level_1'
+    assert header['tick_dt'] == game.tick_dt
+    assert commands == SCRIPT
+    assert hashes == game.recorder.hashes
+    assert len(hashes) == game.ticks
+    assert snapshot == b''
+
+
+@pytest.mark.parametrize('enemy_engine', ['sprite', 'array'])
+def test_replay_matches_recording(tmp_path, enemy_engine):
+    path = tmp_path / 'game.mfr'
+    game = _record(path, enemy_engine)
+    report = ReplayRunner(str(path)).run()
+    assert report['config_matches']
+    assert report['diverged_at'] is None
+    assert report['commands_applied'] == len(SCRIPT)
+    assert report['ticks'] == game.ticks
+    assert (report['lives'], report['money']) == (game.lives, game.money)
+
+
+def test_replay_reports_divergence(tmp_path, monkeypatch):
+    path = tmp_path / 'game.mfr'
+    _record(path, 'sprite')
+    monkeypatch.setitem(GAME_CONFIG, 'starting_money', 1001)
+    report = ReplayRunner(str(path)).run()
+    assert not report['config_matches']
+    assert report['diverged_at'] == 0
@@ -0,0 +1,101 @@
+import contextlib
+import io
+
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.game import Game
+from src.sim.headless import parse_placement
+from src.sim.recorder import state_hash
+from src.sim.replay import ReplayRunner
+from src.sim.savegame import load_game, restore, save_game, snapshot
+
+LAYOUT = ['12:cannon:storm', '13:rapid:pyro', '30:cannon', '20:cannon:glacier', '41:anti-air', '2:sniper']
+
+
+@pytest.fixture(autouse=True)
+def rich(monkeypatch):
+    monkeypatch.setitem(GAME_CONFIG, 'starting_money', 3000)
+
+
+def _game(enemy_engine, ticks, record_path=None):
+    """level_2 with towers of every element, played to a busy mid-wave tick"""
+    game = Game(None, enemy_engine)
+    game.record_path = record_path
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_level('level_2')
+        for text in LAYOUT:
+            spot, tower_type, element = parse_placement(text)
+            game.apply_command(('place', spot, tower_type))
+            if element:
+                game.apply_command(('upgrade', spot, element))
+        while game.ticks < ticks:
+            game.tick()
+    return game
+
+
+def _busy_game(enemy_engine):
+    """A game with enemies, projectiles and status effects all in flight"""
+    game = _game(enemy_engine, 3000)
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not (len(game.enemies) and len(game.projectiles) and game.effect_store.count):
+            assert game.ticks < 20000 and game.state == "playing", "nothing in flight to save"
+            game.tick()
+    return game
+
+
+def _restored(data, enemy_engine):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return restore(Game(None, enemy_engine), data)
+
+
+@pytest.mark.parametrize('enemy_engine', ['sprite', 'array'])
+def test_round_trip_keeps_the_state_hash(enemy_engine):
+    game = _busy_game(enemy_engine)
+    data = snapshot(game)
+    loaded = _restored(data, enemy_engine)
+    assert state_hash(loaded) == state_hash(game)
+    assert snapshot(loaded) == data
+
+
+@pytest.mark.parametrize('enemy_engine', ['sprite', 'array'])
+def test_restored_game_plays_on_identically(enemy_engine):
+    game = _busy_game(enemy_engine)
+    loaded = _restored(snapshot(game), enemy_engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(1500):
+            game.tick()
+            loaded.tick()
+            assert state_hash(loaded) == state_hash(game), f"diverged at tick {game.ticks}"
+
+
+def test_save_file_round_trip(tmp_path):
+    game = _game('sprite', 1000)
+    path = str(tmp_path / 'quicksave.mfs')
+    save_game(game, path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        loaded = load_game(Game(None), path)
+    assert state_hash(loaded) == state_hash(game)
+
+
+def test_restore_rejects_other_files():
+    with pytest.raises(ValueError):
+        restore(Game(None), b'MFRP' + bytes(16))
+
+
+def test_recording_after_a_load_replays(tmp_path):
+    record_path = str(tmp_path / 'game.mfr')
+    game = _game('sprite', 900, record_path)
+    data = snapshot(game)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(300):
+            game.tick()
+        restore(game, data)
+        game.apply_command(('place', 5, 'basic'))
+        for _ in range(1200):
+            game.tick()
+        game.save_recording()
+    report = ReplayRunner(record_path).run()
+    assert report['recorded_ticks'] == 1200
+    assert report['diverged_at'] is None
+    assert report['ticks'] == game.ticks
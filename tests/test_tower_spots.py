@@ -0,0 +1,49 @@
+import contextlib
+import io
+
+import pytest
+
+from src.config.game_config import GAME_CONFIG
+from src.game import Game
+
+
+def _game(map_id):
+    game = Game(None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_level(map_id)
+    return game
+
+
+@pytest.mark.parametrize('map_id', ['level_1', 'level_2', 'level_3'])
+def test_spot_at_matches_a_scan_of_every_spot(map_id):
+    game = _game(map_id)
+    rects = game.current_map.get_tower_rects()
+    # Spot centers and corners, then every few pixels across the whole map
+    points = [point for rect in rects for point in (rect.center, rect.topleft, (rect.right - 1, rect.bottom - 1),
+                                                    rect.bottomright)]
+    points += [(x, y) for x in range(-10, 1300, 7) for y in range(-10, 800, 7)]
+    for point in points:
+        # The first spot containing the point, as a scan of every spot finds it
+        expected = next((spot for spot, rect in enumerate(rects) if rect.collidepoint(point)), None)
+        assert game.tower_manager.spot_at(point) == expected, point
+
+
+def test_tower_at_follows_place_sell_and_upgrade(monkeypatch):
+    monkeypatch.setitem(GAME_CONFIG, 'starting_money', 1000)
+    game = _game('level_1')
+    tower_manager = game.tower_manager
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert game.apply_command(('place', 3, 'basic'))
+        assert not game.apply_command(('place', 3, 'rapid'))  # Occupied
+        tower = tower_manager.tower_at(3)
+        assert tower is game.tower_at_spot(3) and tower.spot == 3 and tower.type == 'basic'
+        assert tower_manager.tower_at(4) is None
+
+        assert game.apply_command(('upgrade', 3, 'pyro'))
+        assert tower_manager.tower_at(3) is tower and tower.element == 'pyro'
+
+        assert game.apply_command(('sell', 3))
+        assert tower_manager.tower_at(3) is None and tower_manager.towers == []
+        assert not game.apply_command(('sell', 3))
+        assert game.apply_command(('place', 3, 'rapid'))
+    assert tower_manager.tower_at(3).type == 'rapid'